@@ -1,2 +1,9 @@
 from .api.Client import Client
+from .api.ClientPool import ClientPool
+from .service.AsyncConversationService import AsyncConversationService
+from .service.BulkDeleteService import BulkDeleteService
+from .service.BulkSendService import BulkSendService
 from .service.ConversationService import ConversationService
+from .service.InboxReader import InboxReader
+from .service.MediaSendService import MediaSendService
+from .service.MessageWatcher import MessageWatcher
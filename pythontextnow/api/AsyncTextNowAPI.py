@@ -0,0 +1,168 @@
+from typing import Any, Optional
+
+from pythontextnow.api.AsyncTransport import AsyncTransport
+from pythontextnow.api.BaseTextNowAPI import BaseTextNowAPI
+from pythontextnow.api.MediaStream import MediaStream
+from pythontextnow.decorator.rate_limit import enforce_rate_limit_async
+from pythontextnow.enum import EndpointClass, MessageType
+from pythontextnow.model.Group import Group
+from pythontextnow.model.Message import Message
+from pythontextnow.model.User import User
+from pythontextnow.util import general
+
+
+class AsyncTextNowAPI(BaseTextNowAPI):
+    """
+    The asyncio counterpart of TextNowAPI.
+    Every method is a coroutine and waiting on the rate limit is awaited rather than slept.
+    """
+
+    @property
+    def __transport(self) -> AsyncTransport:
+        return self._client_config.async_transport
+
+    async def __request(
+        self,
+        endpoint_class: Optional[EndpointClass],
+        method: str,
+        url: str,
+        kwargs: dict,
+    ) -> Any:
+        response = await self.__transport.request(
+            method, url, endpoint_class=endpoint_class, **kwargs
+        )
+        response.raise_for_status()
+        return response
+
+    @enforce_rate_limit_async(EndpointClass.SEND)
+    async def send_message(self, *, message: str, send_to: str) -> None:
+        await self.__request(
+            EndpointClass.SEND,
+            *self._build_send_message(message=message, send_to=send_to),
+        )
+
+    @enforce_rate_limit_async(EndpointClass.READ)
+    async def get_messages(
+        self,
+        conversation_phone_number: str,
+        *,
+        start_message_id: Optional[str] = None,
+        page_size: Optional[int],
+        get_archived: Optional[bool],
+        keep_raw: bool = True,
+    ) -> list[Message]:
+        """
+        This gets messages from the conversation with the given phone number.
+
+        This will get all messages before (but not including) the message with the given start_message_id.
+        If the given page_size is greater than the max allowed (30), will default to 30.
+        If keep_raw is False, the returned messages do not keep the raw dicts they were parsed from, which saves memory.
+        """
+        response = await self.__request(
+            EndpointClass.READ,
+            *self._build_get_messages(
+                conversation_phone_number,
+                start_message_id=start_message_id,
+                page_size=page_size,
+                get_archived=get_archived,
+            ),
+        )
+        return self._parse_messages(
+            general.loads_json(response.content), keep_raw=keep_raw
+        )
+
+    @enforce_rate_limit_async(EndpointClass.UPDATE)
+    async def mark_message_as_read(self, message: Message) -> None:
+        await self.__request(
+            EndpointClass.UPDATE, *self._build_mark_message_as_read(message)
+        )
+
+    @enforce_rate_limit_async(EndpointClass.DELETE)
+    async def delete_message(self, *, message_id: str) -> None:
+        """
+        Deletes the message with the given ID.
+        """
+        await self.__request(
+            EndpointClass.DELETE, *self._build_delete_message(message_id=message_id)
+        )
+
+    @enforce_rate_limit_async(EndpointClass.READ)
+    async def get_attachment_url(self, *, message_type: MessageType) -> str:
+        """
+        Gets the URL that a file can be uploaded to.
+        """
+        response = await self.__request(
+            EndpointClass.READ,
+            *self._build_get_attachment_url(message_type=message_type),
+        )
+        return self._parse_attachment_url(response.json())
+
+    async def upload_raw_media(
+        self, *, attachment_url: str, raw_media: bytes | MediaStream, media_type: str
+    ) -> None:
+        """
+        Uploads the given raw_media to the given URL.
+        If raw_media is a MediaStream, the file is streamed rather than read into memory.
+        The URL is on TextNow's storage host rather than the API, so the upload does not wait on a rate limit.
+        """
+        await self.__request(
+            None,
+            *self._build_upload_raw_media(
+                attachment_url=attachment_url,
+                raw_media=raw_media,
+                media_type=media_type,
+            ),
+        )
+
+    @enforce_rate_limit_async(EndpointClass.SEND)
+    async def send_attachment(
+        self,
+        *,
+        conversation_phone_number: str,
+        message_type: MessageType,
+        file_type: str,
+        is_video: bool,
+        attachment_url: str,
+    ) -> None:
+        await self.__request(
+            EndpointClass.SEND,
+            *self._build_send_attachment(
+                conversation_phone_number=conversation_phone_number,
+                message_type=message_type,
+                file_type=file_type,
+                is_video=is_video,
+                attachment_url=attachment_url,
+            ),
+        )
+
+    @enforce_rate_limit_async(EndpointClass.READ)
+    async def get_groups(self) -> list[Group]:
+        response = await self.__request(EndpointClass.READ, *self._build_get_groups())
+        return self._parse_groups(response.json())
+
+    @enforce_rate_limit_async(EndpointClass.READ)
+    async def get_user(self) -> User:
+        response = await self.__request(EndpointClass.READ, *self._build_get_user())
+        return self._parse_user(response.json())
+
+    @enforce_rate_limit_async(EndpointClass.SEND)
+    async def create_group(self, *, phone_numbers: list[str]) -> Group:
+        """
+        Creates a group with all given phone_numbers and returns it.
+        """
+        response = await self.__request(
+            EndpointClass.SEND, *self._build_create_group(phone_numbers=phone_numbers)
+        )
+        return self._parse_group(response.json())
+
+    @enforce_rate_limit_async(EndpointClass.DELETE)
+    async def delete_conversation(self, *, conversation_phone_number: str) -> None:
+        """
+        Deletes the conversation with the given phone number.
+        """
+        await self.__request(
+            EndpointClass.DELETE,
+            *self._build_delete_conversation(
+                conversation_phone_number=conversation_phone_number
+            ),
+        )
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional
+
+from pythontextnow.api.RetryPolicy import RetryPolicy
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit import RateLimiter
+from pythontextnow.util.CustomLogger import CustomLogger
+
+
+class AsyncTransport:
+    """
+    The asyncio counterpart of Transport.
+    Wraps a pooled, keep-alive httpx.AsyncClient that is shared by every async API call for a Client.
+
+    httpx is an optional dependency, so it is only imported once the first async call is made.
+    Install it with: pip install pythontextnow[async]
+
+    The httpx.AsyncClient is tied to the event loop it was made on.
+    If a call is made on another event loop, the old client is closed and a new one is made for that event loop.
+    """
+
+    # holds on to close() tasks started by close_nowait(), as the event loop only keeps weak references to them
+    __closing_tasks: set[asyncio.Task] = set()
+
+    def __init__(
+        self,
+        *,
+        pool_maxsize: int,
+        max_connections: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.__pool_maxsize = pool_maxsize
+        self.__max_connections = max_connections
+        self.__retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy.from_config()
+        )
+        self.__rate_limiter = rate_limiter
+        self.__client: Any = None
+        # the event loop the client was made on
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> Any:
+        if self.__client is not None and self.__loop is not asyncio.get_running_loop():
+            # made on another event loop (like an earlier asyncio.run()), so it cannot be used on this one
+            self.close_nowait()
+        if self.__client is None:
+            httpx = self.__import_httpx()
+            limits = httpx.Limits(
+                max_connections=self.__max_connections,
+                max_keepalive_connections=self.__pool_maxsize,
+            )
+            self.__client = httpx.AsyncClient(limits=limits)
+            self.__loop = asyncio.get_running_loop()
+        return self.__client
+
+    @staticmethod
+    def __import_httpx() -> Any:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "httpx is required for async support. Install it with 'pip install pythontextnow[async]'."
+            ) from e
+        return httpx
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        endpoint_class: Optional[EndpointClass] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Makes the given request, retrying it if it fails in a way that is safe to retry.
+        If it is still failing after the last retry, the last response is returned or the last error is raised.
+        """
+        httpx = self.__import_httpx()
+        # httpx wants raw and streamed bodies passed as "content" rather than "data"
+        if kwargs.get("data") is not None and not isinstance(kwargs["data"], dict):
+            kwargs["content"] = kwargs.pop("data")
+        # httpx is deprecating per-request cookies, TextNow does not currently need any
+        if not kwargs.get("cookies"):
+            kwargs.pop("cookies", None)
+
+        body = kwargs.pop("content", None)
+
+        attempt = 0
+        while True:
+            if body is not None:
+                # a streamed body (like a MediaStream) is read from the start again on each attempt
+                kwargs["content"] = (
+                    body.__aiter__() if hasattr(body, "__aiter__") else body
+                )
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                retryable = self.__retry_policy.is_idempotent(method) or isinstance(
+                    e, httpx.ConnectError
+                )
+                if not retryable or attempt >= self.__retry_policy.max_retries:
+                    raise
+                retry_after = None
+                CustomLogger.getLogger().warning(
+                    f"CONNECTION ERROR ON {method} CALL, RETRYING... ({e})"
+                )
+            else:
+                throttled = self.__retry_policy.is_throttled(response.status_code)
+                if self.__rate_limiter is not None and endpoint_class is not None:
+                    if throttled:
+                        self.__rate_limiter.on_throttled(endpoint_class)
+                    elif response.status_code < 400:
+                        self.__rate_limiter.on_success(endpoint_class)
+                if (
+                    not self.__retry_policy.should_retry_status(
+                        method=method, status_code=response.status_code
+                    )
+                    or attempt >= self.__retry_policy.max_retries
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                CustomLogger.getLogger().warning(
+                    f"GOT {response.status_code} ON {method} CALL, RETRYING..."
+                )
+            await asyncio.sleep(
+                self.__retry_policy.get_delay_seconds(
+                    attempt=attempt, retry_after=retry_after
+                )
+            )
+            if self.__rate_limiter is not None and endpoint_class is not None:
+                await asyncio.sleep(
+                    await asyncio.to_thread(self.__rate_limiter.reserve, endpoint_class)
+                )
+            attempt += 1
+
+    async def close(self) -> None:
+        if self.__client is not None and self.__loop is not asyncio.get_running_loop():
+            self.close_nowait()
+        if self.__client is not None:
+            client = self.__client
+            self.__client = None
+            self.__loop = None
+            await client.aclose()
+
+    def close_nowait(self) -> None:
+        """
+        Closes the client from code that cannot await it, like Client.set_client_config().
+        The close is run on the event loop the client was made on:
+            - If that is the running event loop, the close is scheduled on it
+            - If it is running in another thread, the close is handed to it
+            - If it is not running, it is run until the close is done
+        If that event loop has been closed, or cannot be run because another one is running, the client is dropped instead.
+        """
+        client, loop = self.__client, self.__loop
+        if client is None:
+            return
+        self.__client = None
+        self.__loop = None
+        if loop.is_closed():
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            task = loop.create_task(client.aclose())
+            self.__closing_tasks.add(task)
+            task.add_done_callback(self.__closing_tasks.discard)
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        elif running_loop is None:
+            loop.run_until_complete(client.aclose())
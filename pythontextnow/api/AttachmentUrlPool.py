@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from pythontextnow.api.TextNowAPI import TextNowAPI
+from pythontextnow.enum import MessageType
+from pythontextnow.util.ConfigReader import ConfigReader
+from pythontextnow.util.CustomLogger import CustomLogger
+
+
+class AttachmentUrlPool:
+    """
+    Keeps attachment upload URLs ready ahead of time, so an upload does not have to wait for one to be fetched.
+
+    Each URL is only ever handed out once.
+    prefetch() says that a URL of a MessageType will be needed soon, and a background thread fetches one for it.
+    Only URLs that have been asked for are fetched, and at most pool_size of each MessageType are kept ready.
+    URLs older than ttl_seconds are thrown away rather than handed out, in case they have expired.
+    pool_size and ttl_seconds default to attachment_url_pool_size and attachment_url_ttl_seconds under [media] in app.properties.
+    """
+
+    def __init__(
+        self,
+        text_now_api: TextNowAPI,
+        *,
+        pool_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.__text_now_api = text_now_api
+        self.__pool_size = (
+            pool_size
+            if pool_size is not None
+            else ConfigReader.get("media", "attachment_url_pool_size", as_type=int)
+        )
+        self.__ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else ConfigReader.get("media", "attachment_url_ttl_seconds", as_type=float)
+        )
+        # MessageType -> (attachment URL, when it was fetched)
+        self.__attachment_urls: dict[MessageType, deque[tuple[str, float]]] = dict()
+        # MessageType -> how many URLs have been asked for with prefetch() and not taken yet
+        self.__demand: dict[MessageType, int] = dict()
+        # the MessageTypes that a refill is already queued or running for
+        self.__refilling: set[MessageType] = set()
+        self.__closed = False
+        self.__condition = threading.Condition()
+        # fetches are rate limited anyway, so one thread is enough to refill the pool
+        self.__executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pythontextnow-attachment-url"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __take(self, message_type: MessageType) -> Optional[str]:
+        # must be called while holding the condition
+        oldest_allowed = time.monotonic() - self.__ttl_seconds
+        attachment_urls = self.__attachment_urls.setdefault(message_type, deque())
+        while attachment_urls:
+            attachment_url, fetched_at = attachment_urls.popleft()
+            if fetched_at >= oldest_allowed:
+                return attachment_url
+        return None
+
+    def __stop_refilling(self, message_type: MessageType) -> None:
+        # must be called while holding the condition
+        self.__refilling.discard(message_type)
+        # wake up any get() waiting on this refill
+        self.__condition.notify_all()
+
+    def __refill(self, message_type: MessageType) -> None:
+        while True:
+            with self.__condition:
+                attachment_urls = self.__attachment_urls.setdefault(
+                    message_type, deque()
+                )
+                needed = min(self.__demand.get(message_type, 0), self.__pool_size)
+                if self.__closed or len(attachment_urls) >= needed:
+                    self.__stop_refilling(message_type)
+                    return
+            try:
+                attachment_url = self.__text_now_api.get_attachment_url(
+                    message_type=message_type
+                )
+            except Exception as e:
+                CustomLogger.getLogger().warning(
+                    f"FAILED TO PREFETCH {message_type.value} ATTACHMENT URL: {e}"
+                )
+                with self.__condition:
+                    self.__stop_refilling(message_type)
+                return
+            with self.__condition:
+                attachment_urls.append((attachment_url, time.monotonic()))
+                self.__condition.notify_all()
+
+    def prefetch(self, message_type: MessageType, *, count: int = 1) -> None:
+        """
+        Says that count more URLs of the given MessageType will be needed, and starts fetching them in the background.
+        """
+        with self.__condition:
+            if self.__closed:
+                return
+            self.__demand[message_type] = self.__demand.get(message_type, 0) + count
+            if message_type in self.__refilling:
+                return
+            self.__refilling.add(message_type)
+        self.__executor.submit(self.__refill, message_type)
+
+    def cancel(self, message_type: MessageType) -> None:
+        """
+        Says that a URL asked for with prefetch() will not be needed after all.
+        """
+        with self.__condition:
+            self.__demand[message_type] = max(0, self.__demand.get(message_type, 0) - 1)
+
+    def get(self, message_type: MessageType) -> str:
+        """
+        Returns an unused attachment URL for the given MessageType.
+        If none is ready but one is being fetched, this waits for it.
+        Otherwise one is fetched right away.
+        """
+        with self.__condition:
+            attachment_url = self.__take(message_type)
+            while attachment_url is None and message_type in self.__refilling:
+                self.__condition.wait()
+                attachment_url = self.__take(message_type)
+            self.__demand[message_type] = max(0, self.__demand.get(message_type, 0) - 1)
+        if attachment_url is None:
+            attachment_url = self.__text_now_api.get_attachment_url(
+                message_type=message_type
+            )
+        return attachment_url
+
+    def close(self, *, wait: bool = True) -> None:
+        """
+        Stops refilling the pool and drops every URL in it.
+        A fetch that has already started is finished, but no more are made.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+        self.__executor.shutdown(wait=wait, cancel_futures=True)
+        with self.__condition:
+            self.__attachment_urls = dict()
+            self.__demand = dict()
+            self.__refilling = set()
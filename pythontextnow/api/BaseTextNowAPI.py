@@ -0,0 +1,274 @@
+import json
+import urllib
+from datetime import datetime
+from typing import Iterable, Iterator, Optional
+from urllib import parse
+from urllib.parse import quote
+
+from pythontextnow.api.Client import Client, ClientConfig
+from pythontextnow.api.MediaStream import MediaStream
+from pythontextnow.enum import ContactType, MessageDirection, MessageType, ReadStatus
+from pythontextnow.model.Group import Group
+from pythontextnow.model.Message import Message
+from pythontextnow.model.MultiMediaMessage import MultiMediaMessage
+from pythontextnow.model.TextMessage import TextMessage
+from pythontextnow.model.User import User
+from pythontextnow.util import phone_number
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class BaseTextNowAPI:
+    """
+    Holds everything TextNowAPI and AsyncTextNowAPI have in common.
+    Each _build method returns the (method, url, request kwargs) needed to make an API call.
+    Each _parse method turns the JSON of a response into the value the API call returns.
+
+    If no client_config is given, the one set with Client.set_client_config() is used.
+    """
+
+    def __init__(self, *, client_config: Optional[ClientConfig] = None):
+        self.__given_client_config = client_config
+        self._BASE_URL = ConfigReader.get("api", "textnow_base_url")
+        self._VERSION = ConfigReader.get("api", "version")
+        self._API_ROUTE = ConfigReader.get("api", "api_route")
+        self._ATTACHMENT_URL_ROUTE = ConfigReader.get("api", "attachment_url_route")
+        self._CONVERSATIONS_ROUTE = ConfigReader.get("api", "conversations_route")
+        self._GROUPS_ROUTE = ConfigReader.get("api", "groups_route")
+        self._MESSAGES_ROUTE = ConfigReader.get("api", "messages_route")
+        self._MESSAGING_ROUTE = ConfigReader.get("api", "messaging_route")
+        self._SEND_ATTACHMENT_ROUTE = ConfigReader.get("api", "send_attachment_route")
+        self._USERS_ROUTE = ConfigReader.get("api", "users_route")
+
+        self._MAX_MESSAGE_RESPONSE_SIZE = 30
+
+    @property
+    def _client_config(self) -> ClientConfig:
+        if self.__given_client_config is not None:
+            return self.__given_client_config
+        return Client.get_client_config()
+
+    @property
+    def username(self) -> str:
+        return self._client_config.username
+
+    @property
+    def _user_url(self) -> str:
+        return f"{self._BASE_URL}{self._API_ROUTE}{self._USERS_ROUTE}/{self._client_config.username}"
+
+    def _default_request_kwargs(self) -> dict:
+        return {
+            "headers": self._client_config.headers,
+            "cookies": self._client_config.cookies,
+        }
+
+    def _build_send_message(
+        self, *, message: str, send_to: str
+    ) -> tuple[str, str, dict]:
+        json_data = {
+            "contact_value": send_to,
+            "contact_type": ContactType.DEFAULT.value,
+            "message": message,
+            "read": ReadStatus.READ.value,
+            "message_direction": MessageDirection.OUTGOING.value,
+            "message_type": MessageType.TEXT.value,
+            "from_name": self._client_config.username,
+            "has_video": False,
+            "new": True,
+            "date": datetime.now().isoformat(),
+        }
+
+        data = {"json": json.dumps(json_data)}
+
+        return (
+            "POST",
+            f"{self._user_url}{self._MESSAGES_ROUTE}",
+            {"data": data, **self._default_request_kwargs()},
+        )
+
+    def _build_get_messages(
+        self,
+        conversation_phone_number: str,
+        *,
+        start_message_id: Optional[str],
+        page_size: Optional[int],
+        get_archived: Optional[bool],
+    ) -> tuple[str, str, dict]:
+        page_size = (
+            page_size
+            if page_size <= self._MAX_MESSAGE_RESPONSE_SIZE
+            else self._MAX_MESSAGE_RESPONSE_SIZE
+        )
+        contact_value = phone_number.to_e164(conversation_phone_number)
+        params = {
+            "contact_value": contact_value,
+            "direction": "past",
+            "page_size": page_size,
+            "get_archived": 1 if get_archived else 0,
+        }
+        if start_message_id is not None:
+            params["start_message_id"] = start_message_id
+        base_url = f"{self._user_url}{self._MESSAGES_ROUTE}"
+        url_with_params = f"{base_url}?{urllib.parse.urlencode(params)}"
+
+        return "GET", url_with_params, self._default_request_kwargs()
+
+    @staticmethod
+    def _parse_messages(response_json: dict, *, keep_raw: bool = True) -> list[Message]:
+        return list(
+            BaseTextNowAPI._iter_messages(response_json["messages"], keep_raw=keep_raw)
+        )
+
+    @staticmethod
+    def _iter_messages(
+        message_dicts: Iterable[dict], *, keep_raw: bool = True
+    ) -> Iterator[Message]:
+        """
+        Parses the given message dicts one at a time.
+        Messages that are not text or media are skipped.
+        """
+        # sort into Text and MultiMedia messages
+        for message_dict in message_dicts:
+            message_type = MessageType.from_value(message_dict["message_type"])
+            if message_type == MessageType.TEXT:
+                yield TextMessage.from_dict(message_dict, keep_raw=keep_raw)
+            elif message_type in (MessageType.IMAGE, MessageType.VIDEO):
+                yield MultiMediaMessage.from_dict(message_dict, keep_raw=keep_raw)
+
+    def _build_mark_message_as_read(self, message: Message) -> tuple[str, str, dict]:
+        clean_number = quote(message.number)
+        url = f"{self._user_url}{self._CONVERSATIONS_ROUTE}/{clean_number}"
+
+        params = {"latest_message_id": message.id_, "http_method": "PATCH"}
+
+        data = {"read": True}
+
+        return (
+            "PATCH",
+            url,
+            {"params": params, "data": data, **self._default_request_kwargs()},
+        )
+
+    def _build_delete_message(self, *, message_id: str) -> tuple[str, str, dict]:
+        url = f"{self._user_url}{self._MESSAGES_ROUTE}/{message_id}"
+        return "DELETE", url, self._default_request_kwargs()
+
+    def _build_get_attachment_url(
+        self, *, message_type: MessageType
+    ) -> tuple[str, str, dict]:
+        url = f"{self._BASE_URL}{self._API_ROUTE}/{self._VERSION}{self._ATTACHMENT_URL_ROUTE}"
+        params = {"message_type": message_type.value}
+        url_with_params = f"{url}?{parse.urlencode(params)}"
+
+        return "GET", url_with_params, self._default_request_kwargs()
+
+    @staticmethod
+    def _parse_attachment_url(response_json: dict) -> str:
+        return response_json["result"]
+
+    def _build_upload_raw_media(
+        self, *, attachment_url: str, raw_media: bytes | MediaStream, media_type: str
+    ) -> tuple[str, str, dict]:
+        headers = {
+            "accept": "*/*",
+            "content-type": media_type,
+            "accept-language": "en-US,en;q=0.9",
+            "mode": "cors",
+            "method": "PUT",
+            "credentials": "omit",
+        }
+        if isinstance(raw_media, MediaStream):
+            # without this, a streamed body is sent with chunked transfer encoding
+            headers["content-length"] = str(raw_media.size)
+
+        return (
+            "PUT",
+            attachment_url,
+            {
+                "data": raw_media,
+                "headers": headers,
+                "cookies": self._client_config.cookies,
+            },
+        )
+
+    def _build_send_attachment(
+        self,
+        *,
+        conversation_phone_number: str,
+        message_type: MessageType,
+        file_type: str,
+        is_video: bool,
+        attachment_url: str,
+    ) -> tuple[str, str, dict]:
+        data = {
+            "contact_value": conversation_phone_number,
+            "contact_type": ContactType.ALTERNATE.value,
+            "read": 1,
+            "message_direction": MessageDirection.OUTGOING.value,
+            "message_type": message_type.value,
+            "from_name": self._client_config.username,
+            "has_video": is_video,
+            "new": True,
+            "date": datetime.now().isoformat(),
+            "attachment_url": attachment_url,
+            "media_type": file_type,
+        }
+
+        url = f"{self._BASE_URL}{self._API_ROUTE}/{self._VERSION}{self._SEND_ATTACHMENT_ROUTE}"
+
+        return "POST", url, {"data": data, **self._default_request_kwargs()}
+
+    def _build_get_groups(self) -> tuple[str, str, dict]:
+        url = f"{self._user_url}{self._GROUPS_ROUTE}"
+        return "GET", url, self._default_request_kwargs()
+
+    @staticmethod
+    def _parse_groups(response_json: list) -> list[Group]:
+        group_list = list()
+        for group_dict in response_json:
+            group_list.append(Group.from_dict(group_dict))
+        return group_list
+
+    def _build_get_user(self) -> tuple[str, str, dict]:
+        return "GET", self._user_url, self._default_request_kwargs()
+
+    @staticmethod
+    def _parse_user(response_json: dict) -> User:
+        return User.from_dict(response_json)
+
+    def _build_create_group(self, *, phone_numbers: list[str]) -> tuple[str, str, dict]:
+        url = f"{self._user_url}{self._GROUPS_ROUTE}"
+
+        data = {"json": {"members": list()}}
+
+        for phone_number in phone_numbers:
+            member = {
+                "contact_value": phone_number,
+                "contact_type": ContactType.ALTERNATE.value,
+            }
+            data["json"]["members"].append(member)
+
+        data = parse.urlencode(data, quote_via=urllib.parse.quote)
+        # we add this step because of a weird issue: https://qxf2.com/blog/python-mechanize-replace/
+        data = data.replace("%27", "%22")
+
+        # copy so the Content-Type is not added to the headers every other call uses
+        headers = dict(self._client_config.headers)
+        headers["Content-Type"] = "application/x-www-form-urlencoded; charset=UTF-8"
+
+        return (
+            "POST",
+            url,
+            {"data": data, "headers": headers, "cookies": self._client_config.cookies},
+        )
+
+    @staticmethod
+    def _parse_group(response_json: dict) -> Group:
+        return Group.from_dict(response_json)
+
+    def _build_delete_conversation(
+        self, *, conversation_phone_number: str
+    ) -> tuple[str, str, dict]:
+        clean_number = quote(phone_number.to_e164(conversation_phone_number))
+        url = f"{self._user_url}{self._CONVERSATIONS_ROUTE}/{clean_number}"
+
+        return "DELETE", url, self._default_request_kwargs()
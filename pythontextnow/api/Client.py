@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import datetime
 import hashlib
 from dataclasses import dataclass
 from typing import Optional
 
+from pythontextnow.api.AsyncTransport import AsyncTransport
+from pythontextnow.api.RetryPolicy import RetryPolicy
+from pythontextnow.api.Transport import Transport
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit import RateLimit, RateLimiter, RateLimitStateBackend
+from pythontextnow.util.ConfigReader import ConfigReader
 from pythontextnow.util.general import get_random_user_agent
 
 
@@ -17,18 +22,44 @@ class ClientConfig:
     username: str
     headers: dict
     cookies: dict
-    last_call_time: datetime
+    rate_limiter: RateLimiter
+    transport: Transport
+    async_transport: AsyncTransport
 
 
 class Client:
     """
     This class is used to store and set up initial Client configuration.
+
+    Each ClientConfig is scoped to one account (its own headers, connections and rate limits).
+    The config set with set_client_config() is used by anything that is not given a ClientConfig of its own.
     """
 
     client_config: Optional[ClientConfig] = None
 
     @classmethod
-    def set_client_config(cls, *, username: str, sid_cookie: str) -> None:
+    def create_client_config(
+        cls,
+        *,
+        username: str,
+        sid_cookie: str,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        rate_limits: Optional[dict[EndpointClass, RateLimit]] = None,
+        rate_limit_state_backend: Optional[RateLimitStateBackend] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> ClientConfig:
+        """
+        Creates a Client config for the given username and SID cookie, without setting it as the Client config.
+        Pass it to TextNowAPI, ConversationService, etc. to act as this account, or add it to a ClientPool.
+
+        pool_connections, pool_maxsize and pool_block configure the shared keep-alive connection pool.
+        rate_limits sets the RateLimit for each EndpointClass.
+        rate_limit_state_backend is where rate limit state is kept, use a SQLiteRateLimitStateBackend to share it between processes.
+        retry_policy decides when and how failed API calls are retried.
+        Any that are not given will default to the values in app.properties.
+        """
         # use the same user agent for the same username + sid cookie combo
         # we do this by creating a hash of them and then using it as a seed
         hash: int = int(
@@ -39,20 +70,68 @@ class Client:
             "Cookie": f"connect.sid={sid_cookie};",
         }
 
+        pool_connections = (
+            pool_connections
+            if pool_connections is not None
+            else ConfigReader.get("api", "pool_connections", as_type=int)
+        )
+        pool_maxsize = (
+            pool_maxsize
+            if pool_maxsize is not None
+            else ConfigReader.get("api", "pool_maxsize", as_type=int)
+        )
+        pool_block = (
+            pool_block
+            if pool_block is not None
+            else ConfigReader.get("api", "pool_block", as_type=bool)
+        )
+        retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy.from_config()
+        )
+        rate_limiter = RateLimiter(
+            rate_limits=rate_limits,
+            backend=rate_limit_state_backend,
+            key_prefix=username,
+        )
+        transport = Transport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        async_transport = AsyncTransport(
+            pool_maxsize=pool_maxsize,
+            max_connections=pool_connections * pool_maxsize if pool_block else None,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+
         client_config = ClientConfig(
             username=username,
             headers=headers,
             cookies=dict(),  # for now, no cookies are needed
-            last_call_time=datetime.datetime.now(),
+            rate_limiter=rate_limiter,
+            transport=transport,
+            async_transport=async_transport,
         )
+        return client_config
+
+    @classmethod
+    def set_client_config(cls, *, username: str, sid_cookie: str, **kwargs) -> None:
+        """
+        Sets the Client config used by anything that is not given its own.
+        Takes the same arguments as create_client_config().
+        """
+        client_config = cls.create_client_config(
+            username=username, sid_cookie=sid_cookie, **kwargs
+        )
+        # close the connections held by the config being replaced
+        if cls.client_config is not None:
+            cls.client_config.transport.close()
+            cls.client_config.async_transport.close_nowait()
         cls.client_config = client_config
 
     @classmethod
     def get_client_config(cls) -> ClientConfig:
         return cls.client_config
-
-    @classmethod
-    def update(cls, **kwargs) -> None:
-        new_last_call_time = kwargs.pop("last_call_time", None)
-        if new_last_call_time is not None:
-            cls.client_config.last_call_time = new_last_call_time
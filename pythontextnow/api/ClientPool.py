@@ -0,0 +1,48 @@
+import threading
+from typing import Iterable
+
+from pythontextnow.api.Client import ClientConfig
+
+
+class ClientPool:
+    """
+    Holds the ClientConfigs of many accounts and hands them out in turn (round-robin).
+
+    Each account has its own connections and rate limits, so spreading calls across N accounts gives up to N times the throughput of one.
+    """
+
+    def __init__(self, client_configs: Iterable[ClientConfig] = ()):
+        self.__client_configs: list[ClientConfig] = list(client_configs)
+        self.__next_index = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__client_configs)
+
+    @property
+    def client_configs(self) -> list[ClientConfig]:
+        return list(self.__client_configs)
+
+    def add(self, client_config: ClientConfig) -> None:
+        with self.__lock:
+            self.__client_configs.append(client_config)
+
+    def remove(self, *, username: str) -> None:
+        with self.__lock:
+            self.__client_configs = [
+                client_config
+                for client_config in self.__client_configs
+                if client_config.username != username
+            ]
+
+    def get_next_client_config(self) -> ClientConfig:
+        """
+        Returns the ClientConfig of the account that should make the next call.
+        """
+        with self.__lock:
+            if len(self.__client_configs) == 0:
+                raise ValueError("ClientPool has no client configs.")
+            self.__next_index %= len(self.__client_configs)
+            client_config = self.__client_configs[self.__next_index]
+            self.__next_index += 1
+            return client_config
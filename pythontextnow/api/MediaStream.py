@@ -0,0 +1,80 @@
+import asyncio
+import os
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class MediaStream:
+    """
+    The contents of a media file, read chunk_size bytes at a time as it is uploaded.
+    Only one chunk is held in memory at a time, whatever the size of the file.
+
+    Each iteration reads the file from the start, so a failed upload can be retried.
+    If on_progress is given, it is called with (bytes sent, total bytes) after each chunk.
+
+    Raises a ValueError if the file is larger than max_size bytes.
+    If not given, chunk_size and max_size default to the values in app.properties.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        *,
+        chunk_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        self.__file_path = file_path
+        self.__chunk_size = (
+            chunk_size
+            if chunk_size is not None
+            else ConfigReader.get("media", "upload_chunk_size_bytes", as_type=int)
+        )
+        max_size = (
+            max_size
+            if max_size is not None
+            else ConfigReader.get("media", "max_upload_bytes", as_type=int)
+        )
+        self.__on_progress = on_progress
+        self.__size = os.path.getsize(file_path)
+        if self.__size > max_size:
+            raise ValueError(
+                f"'{file_path}' is {self.__size} bytes, which is more than the max of {max_size} bytes."
+            )
+
+    @property
+    def file_path(self) -> str:
+        return self.__file_path
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def __len__(self) -> int:
+        # lets the upload send a Content-Length rather than use chunked transfer encoding
+        return self.__size
+
+    def __iter__(self) -> Iterator[bytes]:
+        bytes_sent = 0
+        with open(self.__file_path, mode="rb") as media:
+            while chunk := media.read(self.__chunk_size):
+                yield chunk
+                bytes_sent += len(chunk)
+                self.__report_progress(bytes_sent)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        bytes_sent = 0
+        # read the file off the event loop
+        media = await asyncio.to_thread(open, self.__file_path, "rb")
+        try:
+            while chunk := await asyncio.to_thread(media.read, self.__chunk_size):
+                yield chunk
+                bytes_sent += len(chunk)
+                self.__report_progress(bytes_sent)
+        finally:
+            media.close()
+
+    def __report_progress(self, bytes_sent: int) -> None:
+        if self.__on_progress is not None:
+            self.__on_progress(bytes_sent, self.__size)
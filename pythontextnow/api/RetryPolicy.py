@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+@dataclass(kw_only=True, frozen=True)
+class RetryPolicy:
+    """
+    Decides when a failed API call is retried and how long to wait before retrying it.
+
+    Waits use "full jitter" exponential backoff: a random time between 0 and backoff_base_seconds * 2^attempt, capped at backoff_max_seconds.
+    If the response has a Retry-After header, the wait is never shorter than it.
+
+    POST calls are not idempotent (retrying a send could send a message twice).
+    They are only retried on a 429, where TextNow has refused to handle the call, or when a connection could not be made.
+    """
+
+    max_retries: int
+    backoff_base_seconds: float
+    backoff_max_seconds: float
+    retry_status_codes: frozenset[int] = field(
+        default=frozenset({429, 500, 502, 503, 504})
+    )
+    throttle_status_codes: frozenset[int] = field(default=frozenset({429, 503}))
+
+    @classmethod
+    def from_config(cls) -> RetryPolicy:
+        return RetryPolicy(
+            max_retries=ConfigReader.get("retry", "max_retries", as_type=int),
+            backoff_base_seconds=ConfigReader.get(
+                "retry", "backoff_base_seconds", as_type=float
+            ),
+            backoff_max_seconds=ConfigReader.get(
+                "retry", "backoff_max_seconds", as_type=float
+            ),
+        )
+
+    @staticmethod
+    def is_idempotent(method: str) -> bool:
+        return method.upper() != "POST"
+
+    def should_retry_status(self, *, method: str, status_code: int) -> bool:
+        if status_code not in self.retry_status_codes:
+            return False
+        return self.is_idempotent(method) or status_code == 429
+
+    def is_throttled(self, status_code: int) -> bool:
+        return status_code in self.throttle_status_codes
+
+    def get_delay_seconds(
+        self, *, attempt: int, retry_after: Optional[str] = None
+    ) -> float:
+        """
+        Returns how long to wait before the given retry attempt (starting at 0).
+        """
+        backoff_seconds = random.uniform(
+            0,
+            min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt),
+        )
+        retry_after_seconds = self.parse_retry_after(retry_after)
+        if retry_after_seconds is not None:
+            return max(backoff_seconds, retry_after_seconds)
+        return backoff_seconds
+
+    @staticmethod
+    def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        """
+        Parses a Retry-After header, which is either a number of seconds or an HTTP date.
+        Returns None if it is missing or cannot be parsed.
+        """
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
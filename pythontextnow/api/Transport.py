@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from pythontextnow.api.RetryPolicy import RetryPolicy
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit import RateLimiter
+from pythontextnow.util.CustomLogger import CustomLogger
+
+
+class Transport:
+    """
+    Wraps a pooled, keep-alive requests.Session that is shared by every API call for a Client.
+
+    pool_connections is the number of per-host connection pools to keep.
+    pool_maxsize is the max number of connections kept alive per host.
+    If pool_block is True, callers wait for a free connection instead of exceeding pool_maxsize.
+
+    Failed calls are retried following the given RetryPolicy.
+    If a RateLimiter is given, throttled and successful calls are reported to it, and each retry waits on it.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.__session.mount("https://", adapter)
+        self.__session.mount("http://", adapter)
+        self.__retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy.from_config()
+        )
+        self.__rate_limiter = rate_limiter
+
+    @property
+    def session(self) -> requests.Session:
+        return self.__session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        endpoint_class: Optional[EndpointClass] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Makes the given request, retrying it if it fails in a way that is safe to retry.
+        If it is still failing after the last retry, the last response is returned or the last error is raised.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = self.__session.request(method, url, **kwargs)
+            except requests.ConnectionError as e:
+                retryable = self.__retry_policy.is_idempotent(method) or isinstance(
+                    e, requests.ConnectTimeout
+                )
+                if not retryable or attempt >= self.__retry_policy.max_retries:
+                    raise
+                retry_after = None
+                CustomLogger.getLogger().warning(
+                    f"CONNECTION ERROR ON {method} CALL, RETRYING... ({e})"
+                )
+            else:
+                throttled = self.__retry_policy.is_throttled(response.status_code)
+                if self.__rate_limiter is not None and endpoint_class is not None:
+                    if throttled:
+                        self.__rate_limiter.on_throttled(endpoint_class)
+                    elif response.status_code < 400:
+                        self.__rate_limiter.on_success(endpoint_class)
+                if (
+                    not self.__retry_policy.should_retry_status(
+                        method=method, status_code=response.status_code
+                    )
+                    or attempt >= self.__retry_policy.max_retries
+                ):
+                    return response
+                retry_after = response.headers.get("Retry-After")
+                CustomLogger.getLogger().warning(
+                    f"GOT {response.status_code} ON {method} CALL, RETRYING..."
+                )
+            time.sleep(
+                self.__retry_policy.get_delay_seconds(
+                    attempt=attempt, retry_after=retry_after
+                )
+            )
+            if self.__rate_limiter is not None and endpoint_class is not None:
+                self.__rate_limiter.acquire(endpoint_class)
+            attempt += 1
+
+    def close(self) -> None:
+        self.__session.close()
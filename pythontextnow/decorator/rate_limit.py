@@ -0,0 +1,45 @@
+import asyncio
+from functools import wraps
+from typing import Callable
+
+from pythontextnow.enum import EndpointClass
+
+
+def enforce_rate_limit(endpoint_class: EndpointClass) -> Callable:
+    """
+    This will wait for the rate limit of the given EndpointClass before calling the method it wraps.
+    Currently, this is set up to work for API call methods only.
+    The rate limiter is taken from the client config of the API instance the method is called on.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def wrapFunction(self, *args, **kwargs):
+            self._client_config.rate_limiter.acquire(endpoint_class)
+            return function(self, *args, **kwargs)
+
+        return wrapFunction
+
+    return decorator
+
+
+def enforce_rate_limit_async(endpoint_class: EndpointClass) -> Callable:
+    """
+    The same as enforce_rate_limit, but for coroutine methods.
+    The wait is awaited instead of blocking the event loop.
+    The reservation is made in a worker thread, as a shared rate limit state backend (like SQLite) can block.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        async def wrapFunction(self, *args, **kwargs):
+            wait_seconds = await asyncio.to_thread(
+                self._client_config.rate_limiter.reserve, endpoint_class
+            )
+            if wait_seconds > 0:
+                await asyncio.sleep(wait_seconds)
+            return await function(self, *args, **kwargs)
+
+        return wrapFunction
+
+    return decorator
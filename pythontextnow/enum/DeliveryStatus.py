@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from enum import Enum, unique
+
+
+@unique
+class DeliveryStatus(Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+    @classmethod
+    def from_value(cls, v: str) -> DeliveryStatus:
+        for delivery_status in DeliveryStatus:
+            if delivery_status.value == v:
+                return delivery_status
+        raise ValueError(f"Value '{v}' is unknown for DeliveryStatus.")
@@ -0,0 +1,13 @@
+from enum import Enum, unique
+
+
+@unique
+class EndpointClass(Enum):
+    """
+    Groups API calls that share a rate limit.
+    """
+
+    SEND = "send"
+    READ = "read"
+    UPDATE = "update"
+    DELETE = "delete"
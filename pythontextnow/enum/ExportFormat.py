@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from enum import Enum, unique
+
+
+@unique
+class ExportFormat(Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+    PARQUET = "parquet"
+
+    @classmethod
+    def from_value(cls, v: str) -> ExportFormat:
+        for export_format in ExportFormat:
+            if export_format.value == v.lower():
+                return export_format
+        raise ValueError(f"Value '{v}' is unknown for ExportFormat.")
@@ -1,4 +1,7 @@
 from .ContactType import ContactType
+from .DeliveryStatus import DeliveryStatus
+from .EndpointClass import EndpointClass
+from .ExportFormat import ExportFormat
 from .MessageDirection import MessageDirection
 from .MessageType import MessageType
 from .ReadStatus import ReadStatus
@@ -0,0 +1,138 @@
+import csv
+import json
+from typing import Any, Iterable
+
+from pythontextnow.enum import ExportFormat
+from pythontextnow.model.Message import Message
+from pythontextnow.model.MultiMediaMessage import MultiMediaMessage
+from pythontextnow.model.TextMessage import TextMessage
+
+
+class MessageExporter:
+    """
+    Turns messages into columns (a dict of column name -> list of values) and writes them to a file.
+
+    Messages are handled in chunks, so exporting a conversation never needs every message in memory at once.
+    A chunk of columns can be turned straight into a pandas DataFrame with pandas.DataFrame(columns).
+
+    Parquet files need pyarrow: pip install pythontextnow[export]
+    """
+
+    COLUMNS = (
+        "id",
+        "number",
+        "datetime",
+        "message_type",
+        "message_direction",
+        "read",
+        "first_contact",
+        "body",
+    )
+
+    @classmethod
+    def to_columns(cls, messages: Iterable[Message]) -> dict[str, list]:
+        """
+        Returns the given messages as columns.
+        body is the text of a text message or the media URL of a media message.
+        """
+        columns: dict[str, list] = {column: list() for column in cls.COLUMNS}
+        for message in messages:
+            columns["id"].append(message.id_)
+            columns["number"].append(message.number)
+            columns["datetime"].append(message.datetime_)
+            columns["message_type"].append(message.message_type.name)
+            columns["message_direction"].append(message.message_direction.name)
+            columns["read"].append(message.read)
+            columns["first_contact"].append(message.first_contact)
+            if isinstance(message, TextMessage):
+                columns["body"].append(message.text)
+            elif isinstance(message, MultiMediaMessage):
+                columns["body"].append(message.media)
+            else:
+                columns["body"].append(None)
+        return columns
+
+    @classmethod
+    def write(
+        cls,
+        chunks: Iterable[dict[str, list]],
+        *,
+        file_path: str,
+        export_format: ExportFormat,
+    ) -> int:
+        """
+        Writes the given chunks of columns to the given file, one chunk at a time.
+        Returns how many rows were written.
+        """
+        if export_format == ExportFormat.CSV:
+            return cls.__write_csv(chunks, file_path)
+        if export_format == ExportFormat.JSONL:
+            return cls.__write_jsonl(chunks, file_path)
+        if export_format == ExportFormat.PARQUET:
+            return cls.__write_parquet(chunks, file_path)
+        raise ValueError(f"Export format '{export_format}' not supported.")
+
+    @classmethod
+    def __iter_rows(cls, chunk: dict[str, list]) -> Iterable[tuple]:
+        return zip(*(chunk[column] for column in cls.COLUMNS))
+
+    @staticmethod
+    def __to_json_value(value: Any) -> Any:
+        return value.isoformat() if hasattr(value, "isoformat") else value
+
+    @classmethod
+    def __write_csv(cls, chunks: Iterable[dict[str, list]], file_path: str) -> int:
+        rows_written = 0
+        with open(file_path, mode="w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(cls.COLUMNS)
+            for chunk in chunks:
+                for row in cls.__iter_rows(chunk):
+                    writer.writerow(cls.__to_json_value(value) for value in row)
+                    rows_written += 1
+        return rows_written
+
+    @classmethod
+    def __write_jsonl(cls, chunks: Iterable[dict[str, list]], file_path: str) -> int:
+        rows_written = 0
+        with open(file_path, mode="w", encoding="utf-8") as file:
+            for chunk in chunks:
+                for row in cls.__iter_rows(chunk):
+                    row_dict = {
+                        column: cls.__to_json_value(value)
+                        for column, value in zip(cls.COLUMNS, row)
+                    }
+                    file.write(json.dumps(row_dict))
+                    file.write("\n")
+                    rows_written += 1
+        return rows_written
+
+    @classmethod
+    def __write_parquet(cls, chunks: Iterable[dict[str, list]], file_path: str) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "pyarrow is required to export to Parquet. Install it with 'pip install pythontextnow[export]'."
+            ) from e
+
+        schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("number", pa.string()),
+                ("datetime", pa.timestamp("us", tz="UTC")),
+                ("message_type", pa.string()),
+                ("message_direction", pa.string()),
+                ("read", pa.bool_()),
+                ("first_contact", pa.bool_()),
+                ("body", pa.string()),
+            ]
+        )
+        rows_written = 0
+        with pq.ParquetWriter(file_path, schema) as writer:
+            for chunk in chunks:
+                chunk = {**chunk, "id": [str(id_) for id_ in chunk["id"]]}
+                writer.write_table(pa.Table.from_pydict(chunk, schema=schema))
+                rows_written += len(chunk["id"])
+        return rows_written
@@ -0,0 +1 @@
+from .MessageExporter import MessageExporter
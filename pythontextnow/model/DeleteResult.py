@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True)
+class DeleteResult:
+    """
+    The outcome of deleting a single message.
+    If deleting failed, error holds the exception that was raised.
+    """
+
+    message_id: str
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
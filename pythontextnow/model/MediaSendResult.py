@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True)
+class MediaSendResult:
+    """
+    The outcome of sending a single media file.
+    If sending failed, error holds the exception that was raised.
+    """
+
+    file_path: str
+    send_to: str
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
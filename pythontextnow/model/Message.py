@@ -1,39 +1,153 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Optional
 
 from pythontextnow.enum import MessageDirection, MessageType
 
 
-@dataclass(kw_only=True)
 class Message:
-    number: str
-    datetime_: datetime
-    first_contact: bool
-    message_type: MessageType
-    read: bool
-    id_: str
-    message_direction: MessageDirection
-    raw: dict
+    """
+    A message in a conversation.
+
+    Messages are read in bulk, so this is kept compact with __slots__.
+    from_dict() builds a message in one pass and leaves datetime_, message_type and message_direction undecoded until they are first used.
+    The raw dict is only kept if keep_raw is True, to_dict() rebuilds it otherwise.
+    """
+
+    __slots__ = (
+        "number",
+        "first_contact",
+        "read",
+        "id_",
+        "raw",
+        "__datetime",
+        "__message_type",
+        "__message_direction",
+    )
+
+    # the fields compared by == and shown by repr()
+    _FIELDS: tuple[str, ...] = (
+        "number",
+        "datetime_",
+        "first_contact",
+        "message_type",
+        "read",
+        "id_",
+        "message_direction",
+        "raw",
+    )
+
+    def __init__(
+        self,
+        *,
+        number: str,
+        datetime_: datetime,
+        first_contact: bool,
+        message_type: MessageType,
+        read: bool,
+        id_: str,
+        message_direction: MessageDirection,
+        raw: Optional[dict] = None,
+    ):
+        self.number = number
+        self.__datetime: datetime | str = datetime_
+        self.first_contact = first_contact
+        self.__message_type: MessageType | str | int = message_type
+        self.read = read
+        self.id_ = id_
+        self.__message_direction: MessageDirection | str | int = message_direction
+        self.raw = raw
 
     @classmethod
-    def from_dict(cls, message_dict: dict) -> Message:
-        number = message_dict["contact_value"]
-        date = datetime.fromisoformat(message_dict["date"].replace("Z", "+00:00"))
-        first_contact = message_dict["conversation_filtering"]["first_time_contact"]
-        type_ = MessageType.from_value(message_dict["message_type"])
-        read = message_dict["read"]
-        id_ = message_dict["id"]
-        direction = MessageDirection.from_value(message_dict["message_direction"])
-        raw = message_dict
-        return Message(
-            number=number,
-            datetime_=date,
-            first_contact=first_contact,
-            message_type=type_,
-            read=read,
-            id_=id_,
-            message_direction=direction,
-            raw=raw,
+    def from_dict(cls, message_dict: dict, *, keep_raw: bool = True) -> Message:
+        message = cls.__new__(cls)
+        message._set_from_dict(message_dict, keep_raw=keep_raw)
+        return message
+
+    def _set_from_dict(self, message_dict: dict, *, keep_raw: bool) -> None:
+        self.number = message_dict["contact_value"]
+        self.__datetime = message_dict["date"]
+        self.first_contact = message_dict["conversation_filtering"][
+            "first_time_contact"
+        ]
+        self.__message_type = message_dict["message_type"]
+        self.read = message_dict["read"]
+        self.id_ = message_dict["id"]
+        self.__message_direction = message_dict["message_direction"]
+        self.raw = message_dict if keep_raw else None
+
+    @property
+    def datetime_(self) -> datetime:
+        if isinstance(self.__datetime, str):
+            self.__datetime = datetime.fromisoformat(
+                self.__datetime.replace("Z", "+00:00")
+            )
+        return self.__datetime
+
+    @datetime_.setter
+    def datetime_(self, datetime_: datetime) -> None:
+        self.__datetime = datetime_
+
+    @property
+    def message_type(self) -> MessageType:
+        if self.__message_type is not None and not isinstance(
+            self.__message_type, MessageType
+        ):
+            self.__message_type = MessageType.from_value(self.__message_type)
+        return self.__message_type
+
+    @message_type.setter
+    def message_type(self, message_type: MessageType) -> None:
+        self.__message_type = message_type
+
+    @property
+    def message_direction(self) -> MessageDirection:
+        if self.__message_direction is not None and not isinstance(
+            self.__message_direction, MessageDirection
+        ):
+            self.__message_direction = MessageDirection.from_value(
+                self.__message_direction
+            )
+        return self.__message_direction
+
+    @message_direction.setter
+    def message_direction(self, message_direction: MessageDirection) -> None:
+        self.__message_direction = message_direction
+
+    def to_dict(self) -> dict:
+        """
+        Returns this message as the dict TextNow returned for it.
+        If the raw dict was not kept, the fields TextNow's messages are read from are rebuilt.
+        """
+        if self.raw is not None:
+            return self.raw
+        date = (
+            self.__datetime
+            if isinstance(self.__datetime, str)
+            else self.__datetime.isoformat()
+        )
+        return {
+            "id": self.id_,
+            "contact_value": self.number,
+            "message_direction": self.message_direction.value,
+            "message_type": self.message_type.value,
+            "read": self.read,
+            "date": date,
+            "conversation_filtering": {"first_time_contact": self.first_contact},
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self._FIELDS
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._FIELDS
         )
+        return f"{self.__class__.__name__}({fields})"
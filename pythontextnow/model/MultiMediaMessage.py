@@ -1,25 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-
 from pythontextnow.model.Message import Message
 
 
-@dataclass
 class MultiMediaMessage(Message):
-    media: str
+    __slots__ = ("media",)
+
+    _FIELDS = Message._FIELDS + ("media",)
+
+    def __init__(self, *, media: str, **kwargs):
+        super().__init__(**kwargs)
+        self.media = media
+
+    def _set_from_dict(self, message_dict: dict, *, keep_raw: bool) -> None:
+        super()._set_from_dict(message_dict, keep_raw=keep_raw)
+        self.media = message_dict["message"]
 
-    @classmethod
-    def from_dict(cls, message_dict: dict) -> MultiMediaMessage:
-        message = Message.from_dict(message_dict)
-        return MultiMediaMessage(
-            number=message.number,
-            datetime_=message.datetime_,
-            first_contact=message.first_contact,
-            message_type=message.message_type,
-            read=message.read,
-            id_=message.id_,
-            message_direction=message.message_direction,
-            raw=message.raw,
-            media=message_dict["message"],
-        )
+    def to_dict(self) -> dict:
+        if self.raw is not None:
+            return self.raw
+        return {**super().to_dict(), "message": self.media}
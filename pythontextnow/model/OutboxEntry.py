@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from pythontextnow.enum import DeliveryStatus
+
+
+@dataclass(kw_only=True)
+class OutboxEntry:
+    """
+    A text message or media waiting to be (or already) sent from an Outbox.
+    Exactly one of message and file_path is set.
+    """
+
+    id_: int
+    conversation_phone_numbers: list[str]
+    message: Optional[str]
+    file_path: Optional[str]
+    status: DeliveryStatus
+    attempts: int
+    last_error: Optional[str]
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(kw_only=True)
+class SendResult:
+    """
+    The outcome of sending a single message.
+    username is the account it was sent from.
+    If sending failed, error holds the exception that was raised.
+    """
+
+    message: str
+    send_to: str
+    username: Optional[str] = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
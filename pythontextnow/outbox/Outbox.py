@@ -0,0 +1,201 @@
+import threading
+from typing import Optional
+
+from pythontextnow.api.Client import ClientConfig
+from pythontextnow.enum import DeliveryStatus
+from pythontextnow.model.OutboxEntry import OutboxEntry
+from pythontextnow.outbox.OutboxStore import OutboxStore
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.util.ConfigReader import ConfigReader
+from pythontextnow.util.CustomLogger import CustomLogger
+
+
+class Outbox:
+    """
+    A durable queue of text messages and media to send.
+
+    Enqueueing only writes to a local SQLite database, so it returns right away.
+    Once started, a pool of worker threads sends queued entries through the usual rate limits.
+    Entries survive crashes and restarts, and are delivered at least once.
+
+    A failed send is tried again after retry_delay_seconds, up to max_attempts times, and is then marked as failed.
+    Settings that are not given are read from [outbox] in app.properties.
+    Entries are sent from the given client_config's account, or the one set with Client.set_client_config().
+    """
+
+    def __init__(
+        self,
+        *,
+        database_path: str,
+        worker_count: Optional[int] = None,
+        poll_interval_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay_seconds: Optional[float] = None,
+        lease_seconds: Optional[float] = None,
+        client_config: Optional[ClientConfig] = None,
+    ):
+        self.__client_config = client_config
+        self.__store = OutboxStore(database_path=database_path)
+        self.__worker_count = (
+            worker_count
+            if worker_count is not None
+            else ConfigReader.get("outbox", "worker_count", as_type=int)
+        )
+        self.__poll_interval_seconds = (
+            poll_interval_seconds
+            if poll_interval_seconds is not None
+            else ConfigReader.get("outbox", "poll_interval_seconds", as_type=float)
+        )
+        self.__max_attempts = (
+            max_attempts
+            if max_attempts is not None
+            else ConfigReader.get("outbox", "max_attempts", as_type=int)
+        )
+        self.__retry_delay_seconds = (
+            retry_delay_seconds
+            if retry_delay_seconds is not None
+            else ConfigReader.get("outbox", "retry_delay_seconds", as_type=float)
+        )
+        self.__lease_seconds = (
+            lease_seconds
+            if lease_seconds is not None
+            else ConfigReader.get("outbox", "lease_seconds", as_type=float)
+        )
+
+        self.__workers: list[threading.Thread] = list()
+        # set to stop the workers of the current start()
+        # each start() makes a new one, so workers left running by stop(wait=False) still stop
+        self.__stopping = threading.Event()
+        self.__new_entry = threading.Event()
+        # conversation phone numbers -> ConversationService, so group numbers are only looked up once
+        self.__conversation_services: dict[tuple[str, ...], ConversationService] = (
+            dict()
+        )
+        self.__conversation_services_lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def enqueue_message(
+        self, *, conversation_phone_numbers: list[str], message: str
+    ) -> int:
+        """
+        Queues a text message to the conversation with the given phone numbers and returns its outbox ID.
+        """
+        id_ = self.__store.add(
+            conversation_phone_numbers=conversation_phone_numbers, message=message
+        )
+        self.__new_entry.set()
+        return id_
+
+    def enqueue_media(
+        self, *, conversation_phone_numbers: list[str], file_path: str
+    ) -> int:
+        """
+        Queues the media at the given file_path to the conversation with the given phone numbers and returns its outbox ID.
+        The file is read when it is sent, so it must still exist then.
+        """
+        id_ = self.__store.add(
+            conversation_phone_numbers=conversation_phone_numbers, file_path=file_path
+        )
+        self.__new_entry.set()
+        return id_
+
+    def get_entry(self, id_: int) -> Optional[OutboxEntry]:
+        return self.__store.get(id_)
+
+    def get_status(self, id_: int) -> DeliveryStatus:
+        entry = self.__store.get(id_)
+        if entry is None:
+            raise ValueError(f"No outbox entry with ID '{id_}'.")
+        return entry.status
+
+    def get_entries(self, *, status: DeliveryStatus) -> list[OutboxEntry]:
+        return self.__store.get_by_status(status)
+
+    def start(self) -> None:
+        """
+        Starts the worker threads that send queued entries.
+        """
+        if self.__workers:
+            return
+        self.__stopping = threading.Event()
+        for i in range(self.__worker_count):
+            worker = threading.Thread(
+                target=self.__work,
+                args=(self.__stopping,),
+                name=f"pythontextnow-outbox-{i}",
+                daemon=True,
+            )
+            worker.start()
+            self.__workers.append(worker)
+
+    def stop(self, *, wait: bool = True) -> None:
+        """
+        Stops the worker threads once they finish the entry they are sending.
+        Entries still queued stay in the outbox until it is started again.
+        If wait is False, this can be started again right away, and the stopping workers do not claim any more entries.
+        If wait is True, the database connections of the worker threads are closed once they have stopped.
+        """
+        self.__stopping.set()
+        self.__new_entry.set()
+        if wait:
+            for worker in self.__workers:
+                worker.join()
+            self.__store.close()
+        self.__workers = list()
+
+    def __get_conversation_service(
+        self, conversation_phone_numbers: list[str]
+    ) -> ConversationService:
+        key = tuple(conversation_phone_numbers)
+        with self.__conversation_services_lock:
+            conversation_service = self.__conversation_services.get(key)
+        if conversation_service is not None:
+            return conversation_service
+        # a group's number may be looked up over the network, so other workers are not made to wait on it
+        conversation_service = ConversationService(
+            conversation_phone_numbers=conversation_phone_numbers,
+            client_config=self.__client_config,
+        )
+        with self.__conversation_services_lock:
+            # another worker may have made one for the same conversation in the meantime
+            return self.__conversation_services.setdefault(key, conversation_service)
+
+    def __work(self, stopping: threading.Event) -> None:
+        while not stopping.is_set():
+            entry = self.__store.claim(
+                lease_seconds=self.__lease_seconds, max_attempts=self.__max_attempts
+            )
+            if entry is None:
+                # wait for a new entry, or poll for ones added by other processes
+                self.__new_entry.wait(self.__poll_interval_seconds)
+                self.__new_entry.clear()
+                continue
+            self.__send(entry)
+
+    def __send(self, entry: OutboxEntry) -> None:
+        try:
+            conversation_service = self.__get_conversation_service(
+                entry.conversation_phone_numbers
+            )
+            if entry.message is not None:
+                conversation_service.send_message(message=entry.message)
+            else:
+                conversation_service.send_media(file_path=entry.file_path)
+        except Exception as e:
+            retry = entry.attempts < self.__max_attempts
+            CustomLogger.getLogger().warning(
+                f"FAILED TO SEND OUTBOX ENTRY {entry.id_} (ATTEMPT {entry.attempts}): {e}"
+            )
+            self.__store.mark_failed(
+                entry.id_,
+                error=repr(e),
+                retry_delay_seconds=self.__retry_delay_seconds if retry else None,
+            )
+        else:
+            self.__store.mark_sent(entry.id_)
@@ -0,0 +1,182 @@
+import json
+import time
+from datetime import datetime
+from typing import Optional
+
+from pythontextnow.enum import DeliveryStatus
+from pythontextnow.model.OutboxEntry import OutboxEntry
+from pythontextnow.util.SQLiteConnections import SQLiteConnections
+
+
+class OutboxStore:
+    """
+    Persists outbox entries in a SQLite database file.
+
+    Entries are claimed inside immediate transactions, so many threads and processes can drain the same store.
+    A claimed entry is leased to its worker for lease_seconds.
+    If the worker dies before finishing, the lease runs out and the entry is claimed again (at-least-once delivery).
+    """
+
+    __COLUMNS = "id, conversation_phone_numbers, message, file_path, status, attempts, last_error, created_at, updated_at"
+
+    def __init__(self, *, database_path: str, timeout_seconds: float = 30):
+        self.__connections = SQLiteConnections(
+            database_path, timeout_seconds=timeout_seconds
+        )
+        connection = self.__connections.get()
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                conversation_phone_numbers TEXT NOT NULL,
+                message TEXT,
+                file_path TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                last_error TEXT,
+                available_at REAL NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS outbox_status_available_at ON outbox (status, available_at)"
+        )
+
+    @staticmethod
+    def __to_entry(row: tuple) -> OutboxEntry:
+        return OutboxEntry(
+            id_=row[0],
+            conversation_phone_numbers=json.loads(row[1]),
+            message=row[2],
+            file_path=row[3],
+            status=DeliveryStatus.from_value(row[4]),
+            attempts=row[5],
+            last_error=row[6],
+            created_at=datetime.fromtimestamp(row[7]),
+            updated_at=datetime.fromtimestamp(row[8]),
+        )
+
+    def add(
+        self,
+        *,
+        conversation_phone_numbers: list[str],
+        message: Optional[str] = None,
+        file_path: Optional[str] = None,
+    ) -> int:
+        """
+        Adds a pending entry and returns its ID.
+        """
+        now = time.time()
+        cursor = self.__connections.get().execute(
+            "INSERT INTO outbox (conversation_phone_numbers, message, file_path, status, attempts, available_at, created_at, updated_at) VALUES (?, ?, ?, ?, 0, ?, ?, ?)",
+            (
+                json.dumps(conversation_phone_numbers),
+                message,
+                file_path,
+                DeliveryStatus.PENDING.value,
+                now,
+                now,
+                now,
+            ),
+        )
+        return cursor.lastrowid
+
+    def get(self, id_: int) -> Optional[OutboxEntry]:
+        row = (
+            self.__connections.get()
+            .execute(f"SELECT {self.__COLUMNS} FROM outbox WHERE id = ?", (id_,))
+            .fetchone()
+        )
+        return self.__to_entry(row) if row is not None else None
+
+    def get_by_status(self, status: DeliveryStatus) -> list[OutboxEntry]:
+        rows = (
+            self.__connections.get()
+            .execute(
+                f"SELECT {self.__COLUMNS} FROM outbox WHERE status = ? ORDER BY id",
+                (status.value,),
+            )
+            .fetchall()
+        )
+        return [self.__to_entry(row) for row in rows]
+
+    def claim(
+        self, *, lease_seconds: float, max_attempts: Optional[int] = None
+    ) -> Optional[OutboxEntry]:
+        """
+        Marks the oldest entry that is ready to be sent as sending and returns it.
+        This includes pending entries and sending entries whose lease has run out.
+        If max_attempts is given, sending entries whose lease has run out after max_attempts tries are marked as failed instead.
+        Returns None if no entry is ready.
+        """
+        connection = self.__connections.get()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            if max_attempts is not None:
+                connection.execute(
+                    "UPDATE outbox SET status = ?, last_error = ?, updated_at = ? WHERE status = ? AND available_at <= ? AND attempts >= ?",
+                    (
+                        DeliveryStatus.FAILED.value,
+                        f"Lease ran out after {max_attempts} attempts.",
+                        now,
+                        DeliveryStatus.SENDING.value,
+                        now,
+                        max_attempts,
+                    ),
+                )
+            row = connection.execute(
+                f"SELECT {self.__COLUMNS} FROM outbox WHERE status IN (?, ?) AND available_at <= ? ORDER BY id LIMIT 1",
+                (DeliveryStatus.PENDING.value, DeliveryStatus.SENDING.value, now),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE outbox SET status = ?, attempts = attempts + 1, available_at = ?, updated_at = ? WHERE id = ?",
+                    (DeliveryStatus.SENDING.value, now + lease_seconds, now, row[0]),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return self.get(row[0])
+
+    def mark_sent(self, id_: int) -> None:
+        self.__connections.get().execute(
+            "UPDATE outbox SET status = ?, last_error = NULL, updated_at = ? WHERE id = ?",
+            (DeliveryStatus.SENT.value, time.time(), id_),
+        )
+
+    def mark_failed(
+        self, id_: int, *, error: str, retry_delay_seconds: Optional[float]
+    ) -> None:
+        """
+        Records a failed try.
+        If retry_delay_seconds is given, the entry is tried again after that long, otherwise it is marked as failed.
+        """
+        now = time.time()
+        if retry_delay_seconds is None:
+            self.__connections.get().execute(
+                "UPDATE outbox SET status = ?, last_error = ?, updated_at = ? WHERE id = ?",
+                (DeliveryStatus.FAILED.value, error, now, id_),
+            )
+        else:
+            self.__connections.get().execute(
+                "UPDATE outbox SET status = ?, last_error = ?, available_at = ?, updated_at = ? WHERE id = ?",
+                (
+                    DeliveryStatus.PENDING.value,
+                    error,
+                    now + retry_delay_seconds,
+                    now,
+                    id_,
+                ),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the connections to the outbox database.
+        """
+        self.__connections.close()
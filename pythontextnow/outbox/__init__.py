@@ -0,0 +1,2 @@
+from .Outbox import Outbox
+from .OutboxStore import OutboxStore
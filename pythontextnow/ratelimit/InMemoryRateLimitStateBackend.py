@@ -0,0 +1,27 @@
+import threading
+import time
+
+from pythontextnow.ratelimit.RateLimit import RateLimit
+from pythontextnow.ratelimit.RateLimitStateBackend import RateLimitStateBackend
+
+
+class InMemoryRateLimitStateBackend(RateLimitStateBackend):
+    """
+    Keeps token bucket state in memory.
+    This is safe to share between threads, but not between processes.
+    """
+
+    def __init__(self):
+        # key -> (tokens, updated_at)
+        self.__state: dict[str, tuple[float, float]] = dict()
+        self.__lock = threading.Lock()
+
+    def reserve(self, key: str, rate_limit: RateLimit) -> float:
+        with self.__lock:
+            now = time.monotonic()
+            tokens, updated_at = self.__state.get(key, (float(rate_limit.burst), now))
+            tokens, wait_seconds = self._take_token(
+                tokens=tokens, updated_at=updated_at, now=now, rate_limit=rate_limit
+            )
+            self.__state[key] = (tokens, now)
+            return wait_seconds
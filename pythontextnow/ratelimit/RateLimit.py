@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True)
+class RateLimit:
+    """
+    rate_per_second is how many calls can be sustained each second.
+    burst is how many calls can be made back to back before calls are spaced out.
+    """
+
+    rate_per_second: float
+    burst: int
+
+    def __post_init__(self):
+        if self.rate_per_second <= 0:
+            raise ValueError("'rate_per_second' must be greater than 0.")
+        if self.burst < 1:
+            raise ValueError("'burst' must be at least 1.")
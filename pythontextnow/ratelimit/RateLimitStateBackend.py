@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+
+from pythontextnow.ratelimit.RateLimit import RateLimit
+
+
+class RateLimitStateBackend(ABC):
+    """
+    Stores the state of token buckets.
+    Every reserve() must read and update the state of a bucket atomically, so buckets can be shared safely.
+    """
+
+    @abstractmethod
+    def reserve(self, key: str, rate_limit: RateLimit) -> float:
+        """
+        Takes a token from the bucket with the given key and returns how many seconds to wait before using it.
+        A bucket that does not exist yet starts full.
+        """
+
+    @staticmethod
+    def _take_token(
+        *, tokens: float, updated_at: float, now: float, rate_limit: RateLimit
+    ) -> tuple[float, float]:
+        """
+        Refills the given bucket state up to now and takes a token from it.
+
+        Calls reserve a token up front, even if the bucket is empty.
+        The bucket then goes into debt, and each caller is told exactly how long to wait for its token.
+
+        Returns the new number of tokens and how many seconds to wait before using the token taken.
+        """
+        elapsed = max(0.0, now - updated_at)
+        tokens = min(
+            float(rate_limit.burst), tokens + elapsed * rate_limit.rate_per_second
+        )
+        tokens -= 1
+        if tokens >= 0:
+            return tokens, 0
+        return tokens, -tokens / rate_limit.rate_per_second
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit.InMemoryRateLimitStateBackend import (
+    InMemoryRateLimitStateBackend,
+)
+from pythontextnow.ratelimit.RateLimit import RateLimit
+from pythontextnow.ratelimit.RateLimitStateBackend import RateLimitStateBackend
+from pythontextnow.ratelimit.TokenBucket import TokenBucket
+from pythontextnow.util.ConfigReader import ConfigReader
+from pythontextnow.util.CustomLogger import CustomLogger
+
+
+class RateLimiter:
+    """
+    Holds a TokenBucket for each EndpointClass.
+    Any EndpointClass without a given RateLimit uses the one set in app.properties.
+
+    Bucket state is kept in the given RateLimitStateBackend, or in memory if none is given.
+    Buckets are stored under "{key_prefix}:{endpoint class}", so RateLimiters with the same key_prefix and backend share limits.
+
+    The rate of each EndpointClass adapts to throttling (additive increase, multiplicative decrease).
+    Each throttled call multiplies the rate by throttle_decrease_factor, down to min_rate_multiplier of the given RateLimit.
+    Each successful call then adds recovery_increase_step back, up to the given RateLimit.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate_limits: Optional[dict[EndpointClass, RateLimit]] = None,
+        backend: Optional[RateLimitStateBackend] = None,
+        key_prefix: str = "default",
+    ):
+        rate_limits = rate_limits if rate_limits is not None else dict()
+        backend = backend if backend is not None else InMemoryRateLimitStateBackend()
+        self.__max_rate_limits: dict[EndpointClass, RateLimit] = dict()
+        self.__rate_multipliers: dict[EndpointClass, float] = dict()
+        self.__buckets: dict[EndpointClass, TokenBucket] = dict()
+        for endpoint_class in EndpointClass:
+            rate_limit = rate_limits.get(endpoint_class)
+            if rate_limit is None:
+                rate_limit = self.get_default_rate_limit(endpoint_class)
+            self.__max_rate_limits[endpoint_class] = rate_limit
+            self.__rate_multipliers[endpoint_class] = 1.0
+            self.__buckets[endpoint_class] = TokenBucket(
+                rate_limit, key=f"{key_prefix}:{endpoint_class.value}", backend=backend
+            )
+        self.__adapt_lock = threading.Lock()
+
+        self.__THROTTLE_DECREASE_FACTOR = ConfigReader.get(
+            "rate_limit", "throttle_decrease_factor", as_type=float
+        )
+        self.__RECOVERY_INCREASE_STEP = ConfigReader.get(
+            "rate_limit", "recovery_increase_step", as_type=float
+        )
+        self.__MIN_RATE_MULTIPLIER = ConfigReader.get(
+            "rate_limit", "min_rate_multiplier", as_type=float
+        )
+
+    @staticmethod
+    def get_default_rate_limit(endpoint_class: EndpointClass) -> RateLimit:
+        return RateLimit(
+            rate_per_second=ConfigReader.get(
+                "rate_limit", f"{endpoint_class.value}_rate_per_second", as_type=float
+            ),
+            burst=ConfigReader.get(
+                "rate_limit", f"{endpoint_class.value}_burst", as_type=int
+            ),
+        )
+
+    def get_rate_limit(self, endpoint_class: EndpointClass) -> RateLimit:
+        """
+        Returns the RateLimit currently used for the given EndpointClass, after adapting to throttling.
+        """
+        return self.__buckets[endpoint_class].rate_limit
+
+    def on_throttled(self, endpoint_class: EndpointClass) -> None:
+        """
+        Slows down calls for the given EndpointClass after TextNow throttled one of them.
+        """
+        with self.__adapt_lock:
+            multiplier = max(
+                self.__MIN_RATE_MULTIPLIER,
+                self.__rate_multipliers[endpoint_class]
+                * self.__THROTTLE_DECREASE_FACTOR,
+            )
+            self.__set_rate_multiplier(endpoint_class, multiplier)
+        CustomLogger.getLogger().warning(
+            f"THROTTLED ON {endpoint_class.name} CALL, RATE LOWERED TO {self.get_rate_limit(endpoint_class).rate_per_second:.3f} PER SECOND..."
+        )
+
+    def on_success(self, endpoint_class: EndpointClass) -> None:
+        """
+        Speeds calls for the given EndpointClass back up after one succeeded.
+        """
+        if self.__rate_multipliers[endpoint_class] >= 1.0:
+            return
+        with self.__adapt_lock:
+            multiplier = min(
+                1.0,
+                self.__rate_multipliers[endpoint_class] + self.__RECOVERY_INCREASE_STEP,
+            )
+            self.__set_rate_multiplier(endpoint_class, multiplier)
+
+    def __set_rate_multiplier(
+        self, endpoint_class: EndpointClass, multiplier: float
+    ) -> None:
+        self.__rate_multipliers[endpoint_class] = multiplier
+        max_rate_limit = self.__max_rate_limits[endpoint_class]
+        self.__buckets[endpoint_class].rate_limit = RateLimit(
+            rate_per_second=max_rate_limit.rate_per_second * multiplier,
+            burst=max(1, int(max_rate_limit.burst * multiplier)),
+        )
+
+    def reserve(self, endpoint_class: EndpointClass) -> float:
+        """
+        Reserves a call for the given EndpointClass and returns how many seconds to wait before making it.
+        """
+        wait_seconds = self.__buckets[endpoint_class].reserve()
+        if wait_seconds > 0:
+            CustomLogger.getLogger().warning(
+                f"ENFORCING RATE LIMIT FOR {wait_seconds:.3f} SECONDS ON {endpoint_class.name} CALL..."
+            )
+        return wait_seconds
+
+    def acquire(self, endpoint_class: EndpointClass) -> None:
+        """
+        Blocks until a call for the given EndpointClass can be made.
+        """
+        wait_seconds = self.reserve(endpoint_class)
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
@@ -0,0 +1,52 @@
+import time
+
+from pythontextnow.ratelimit.RateLimit import RateLimit
+from pythontextnow.ratelimit.RateLimitStateBackend import RateLimitStateBackend
+from pythontextnow.util.SQLiteConnections import SQLiteConnections
+
+
+class SQLiteRateLimitStateBackend(RateLimitStateBackend):
+    """
+    Keeps token bucket state in a SQLite database file.
+    Every process on this host that uses the same database_path shares the same buckets.
+
+    Each reserve() runs in its own immediate transaction, which locks the database for writing.
+    This makes updates to a bucket atomic across threads and processes.
+    """
+
+    def __init__(self, *, database_path: str, timeout_seconds: float = 30):
+        self.__connections = SQLiteConnections(
+            database_path, timeout_seconds=timeout_seconds
+        )
+        self.__connections.get().execute(
+            "CREATE TABLE IF NOT EXISTS token_bucket (key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    def reserve(self, key: str, rate_limit: RateLimit) -> float:
+        connection = self.__connections.get()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            # wall clock time is used since it is shared between processes
+            now = time.time()
+            row = connection.execute(
+                "SELECT tokens, updated_at FROM token_bucket WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated_at = row if row is not None else (rate_limit.burst, now)
+            tokens, wait_seconds = self._take_token(
+                tokens=tokens, updated_at=updated_at, now=now, rate_limit=rate_limit
+            )
+            connection.execute(
+                "INSERT OR REPLACE INTO token_bucket (key, tokens, updated_at) VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return wait_seconds
+
+    def close(self) -> None:
+        """
+        Closes the connections to the shared state database.
+        """
+        self.__connections.close()
@@ -0,0 +1,44 @@
+from typing import Optional
+
+from pythontextnow.ratelimit.InMemoryRateLimitStateBackend import (
+    InMemoryRateLimitStateBackend,
+)
+from pythontextnow.ratelimit.RateLimit import RateLimit
+from pythontextnow.ratelimit.RateLimitStateBackend import RateLimitStateBackend
+
+
+class TokenBucket:
+    """
+    A token bucket that holds up to rate_limit.burst tokens and refills at rate_limit.rate_per_second.
+
+    The state of the bucket lives in the given RateLimitStateBackend under the given key.
+    Buckets with the same key and backend share their tokens, even between processes if the backend allows it.
+    If no backend is given, the bucket keeps its state in memory.
+    """
+
+    def __init__(
+        self,
+        rate_limit: RateLimit,
+        *,
+        key: str = "default",
+        backend: Optional[RateLimitStateBackend] = None,
+    ):
+        self.__rate_limit = rate_limit
+        self.__key = key
+        self.__backend = (
+            backend if backend is not None else InMemoryRateLimitStateBackend()
+        )
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self.__rate_limit
+
+    @rate_limit.setter
+    def rate_limit(self, rate_limit: RateLimit) -> None:
+        self.__rate_limit = rate_limit
+
+    def reserve(self) -> float:
+        """
+        Takes a token and returns how many seconds to wait before using it.
+        """
+        return self.__backend.reserve(self.__key, self.__rate_limit)
@@ -0,0 +1,6 @@
+from .InMemoryRateLimitStateBackend import InMemoryRateLimitStateBackend
+from .RateLimit import RateLimit
+from .RateLimiter import RateLimiter
+from .RateLimitStateBackend import RateLimitStateBackend
+from .SQLiteRateLimitStateBackend import SQLiteRateLimitStateBackend
+from .TokenBucket import TokenBucket
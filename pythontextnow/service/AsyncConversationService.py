@@ -0,0 +1,259 @@
+import asyncio
+from datetime import datetime
+from typing import AsyncGenerator, Callable, Iterable, Optional
+
+from pythontextnow.api.AsyncTextNowAPI import AsyncTextNowAPI
+from pythontextnow.api.Client import ClientConfig
+from pythontextnow.model.DeleteResult import DeleteResult
+from pythontextnow.model.Message import Message
+from pythontextnow.service.BaseConversationService import BaseConversationService
+from pythontextnow.store.GroupIndex import GroupIndex
+from pythontextnow.store.MediaCache import MediaCache
+from pythontextnow.util import general, media
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class AsyncConversationService(BaseConversationService):
+    """
+    The asyncio counterpart of ConversationService.
+
+    Since a constructor cannot be awaited, the group number of a group chat is looked up on the first call that needs it.
+    """
+
+    def __init__(
+        self,
+        *,
+        conversation_phone_numbers: list[str],
+        client_config: Optional[ClientConfig] = None,
+        group_index: Optional[GroupIndex] = None,
+        media_cache: Optional[MediaCache] = None,
+    ):
+        """
+        If a client_config is given, this acts as that account instead of the one set with Client.set_client_config().
+        Group numbers are looked up in the given group_index, or the shared GroupIndex.get_default() if not given.
+        If a media_cache is given, send_media() reuses the upload of any media that has been sent before.
+        """
+        super().__init__(conversation_phone_numbers=conversation_phone_numbers)
+        self.__group_index = (
+            group_index if group_index is not None else GroupIndex.get_default()
+        )
+        self.__media_cache = media_cache
+        self.__text_now_api = AsyncTextNowAPI(client_config=client_config)
+        self.__cached_conversation_number: Optional[str] = None
+        self.__conversation_number_lock = asyncio.Lock()
+
+    async def __get_conversation_number(self) -> str:
+        """
+        For a chat with a single number, returns the only conversation_phone_number.
+        For interfacing with group chats, a single phone number is used that is assigned by TextNow.
+        This retrieves (and caches) the group phone number for this group chat.
+        """
+        # check if this is a chat with a single number
+        if not self._is_group:
+            return self._conversation_phone_numbers[0]
+        async with self.__conversation_number_lock:
+            if self.__cached_conversation_number is None:
+                self.__cached_conversation_number = await general.call_off_event_loop(
+                    self.__group_index.get,
+                    username=self.__text_now_api.username,
+                    phone_numbers=self._conversation_phone_numbers,
+                    blocking=self.__group_index.is_persistent,
+                )
+            if self.__cached_conversation_number is None:
+                user = await self.__text_now_api.get_user()
+                groups = await self.__text_now_api.get_groups()
+                group_number = self._find_group_number(user=user, groups=groups)
+                if group_number is None:
+                    # unable to find a group that matched all conversation phone numbers
+                    # create a new group
+                    new_group = await self.__text_now_api.create_group(
+                        phone_numbers=self._conversation_phone_numbers
+                    )
+                    group_number = self._get_group_number(new_group)
+                await general.call_off_event_loop(
+                    self.__group_index.put,
+                    username=self.__text_now_api.username,
+                    phone_numbers=self._conversation_phone_numbers,
+                    group_number=group_number,
+                    blocking=self.__group_index.is_persistent,
+                )
+                self.__cached_conversation_number = group_number
+        return self.__cached_conversation_number
+
+    async def send_message(self, *, message: str):
+        """
+        Sends a text message to this instance's conversation_phone_number.
+        """
+        message = general.replace_newlines(message)
+        await self.__text_now_api.send_message(
+            message=message, send_to=await self.__get_conversation_number()
+        )
+
+    async def get_messages(
+        self,
+        *,
+        num_messages: Optional[int] = None,
+        include_archived: bool = True,
+        since: Optional[datetime] = None,
+        prefetch_pages: int = 0,
+        keep_raw: bool = True,
+    ) -> AsyncGenerator[list[Message], None]:
+        """
+        The async generator version of ConversationService.get_messages.
+        Use it with "async for".
+        """
+        pages = self.__get_pages(
+            num_messages=num_messages,
+            include_archived=include_archived,
+            since=since,
+            keep_raw=keep_raw,
+        )
+        async for messages in general.prefetch_async(pages, depth=prefetch_pages):
+            yield messages
+
+    async def __get_pages(
+        self,
+        *,
+        num_messages: Optional[int],
+        include_archived: bool,
+        since: Optional[datetime],
+        keep_raw: bool,
+    ) -> AsyncGenerator[list[Message], None]:
+        conversation_number = await self.__get_conversation_number()
+        start_message_id: Optional[str] = None
+
+        messages_yielded = 0
+        while True:
+            page_size = self._get_page_size(
+                num_messages=num_messages, messages_yielded=messages_yielded
+            )
+            if page_size <= 0:
+                return
+            messages = await self.__text_now_api.get_messages(
+                conversation_number,
+                start_message_id=start_message_id,
+                get_archived=include_archived,
+                page_size=page_size,
+                keep_raw=keep_raw,
+            )
+            if len(messages) == 0:
+                return
+            start_message_id = messages[-1].id_
+            reached_since = False
+            if since is not None:
+                messages, reached_since = self._take_since(messages, since)
+            messages_yielded += len(messages)
+            if len(messages) > 0:
+                yield messages
+            if reached_since:
+                return
+
+    async def mark_as_read(
+        self, *, message: Message = None, messages: list[Message] = None
+    ) -> None:
+        """
+        Marks the given message/s as read.
+        Only the newest given message in each conversation is marked, which marks every message before it as read too.
+        So this makes one call per conversation rather than one per message.
+        Each call waits on the rate limit.
+        """
+        if message is None and messages is None:
+            raise ValueError("'message' and 'messages' cannot both be None.")
+        all_messages = messages
+        if all_messages is None:
+            all_messages = [message]
+        for newest_message in self._get_newest_messages(all_messages):
+            await self.__text_now_api.mark_message_as_read(newest_message)
+
+    async def delete_message(
+        self, *, message: Optional[Message] = None, message_id: Optional[str] = None
+    ) -> None:
+        """
+        Deletes the given message or message with the given ID.
+        """
+        if message is None and message_id is None:
+            raise ValueError("'message' and 'message_id' cannot both be None.")
+
+        message_id = message_id if message_id is not None else message.id_
+        await self.__text_now_api.delete_message(message_id=message_id)
+
+    async def __delete(
+        self, message_id: str, *, semaphore: asyncio.Semaphore
+    ) -> DeleteResult:
+        async with semaphore:
+            try:
+                await self.__text_now_api.delete_message(message_id=message_id)
+            except Exception as e:
+                return DeleteResult(message_id=message_id, error=e)
+        return DeleteResult(message_id=message_id)
+
+    async def delete_messages(
+        self,
+        *,
+        messages: Optional[Iterable[Message]] = None,
+        message_ids: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[DeleteResult]:
+        """
+        Deletes the given messages and messages with the given IDs.
+        Up to max_workers deletes ([api] pool_maxsize by default) are made concurrently, each still waiting on the rate limit.
+        Returns a DeleteResult for each message, with the given messages first and then the given IDs.
+        """
+        if messages is None and message_ids is None:
+            raise ValueError("'messages' and 'message_ids' cannot both be None.")
+        all_message_ids = [message.id_ for message in messages or list()]
+        all_message_ids.extend(message_ids or list())
+        semaphore = asyncio.Semaphore(
+            max_workers
+            if max_workers is not None
+            else ConfigReader.get("api", "pool_maxsize", as_type=int)
+        )
+        return list(
+            await asyncio.gather(
+                *(
+                    self.__delete(message_id, semaphore=semaphore)
+                    for message_id in all_message_ids
+                )
+            )
+        )
+
+    async def send_media(
+        self,
+        *,
+        file_path: str,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        Sends the given media to this instance's conversation_phone_number.
+        Supports sending:
+            - Images
+            - Videos
+            - GIFs
+        The file is streamed as it is uploaded, so it is never read into memory all at once.
+        If on_progress is given, it is called with (bytes uploaded, total bytes) as the upload goes.
+        If this instance has a media_cache and the same content has been uploaded before, the upload is skipped.
+        """
+        await media.send_async(
+            self.__text_now_api,
+            file_path=file_path,
+            conversation_phone_number=await self.__get_conversation_number(),
+            on_progress=on_progress,
+            media_cache=self.__media_cache,
+        )
+
+    async def delete_conversation(self) -> None:
+        """
+        Deletes this conversation.
+        """
+        await self.__text_now_api.delete_conversation(
+            conversation_phone_number=await self.__get_conversation_number()
+        )
+        if self._is_group:
+            # the group is gone, so it is looked up (or created) again if this is used again
+            await general.call_off_event_loop(
+                self.__group_index.invalidate,
+                username=self.__text_now_api.username,
+                phone_numbers=self._conversation_phone_numbers,
+                blocking=self.__group_index.is_persistent,
+            )
+            self.__cached_conversation_number = None
@@ -0,0 +1,128 @@
+from datetime import datetime
+from typing import Iterable, Optional
+
+from pythontextnow.enum import MessageType
+from pythontextnow.model.Group import Group
+from pythontextnow.model.Message import Message
+from pythontextnow.model.User import User
+from pythontextnow.util import media, phone_number
+
+
+class BaseConversationService:
+    """
+    Holds everything ConversationService and AsyncConversationService have in common.
+    Nothing in here makes an API call.
+    """
+
+    def __init__(self, *, conversation_phone_numbers: list[str]):
+        self._conversation_phone_numbers = conversation_phone_numbers
+        # check that given phone numbers are well-formed
+        self._validate_conversation_phone_numbers()
+
+        self._DEFAULT_PAGE_SIZE = 30
+
+    def _validate_conversation_phone_numbers(self) -> None:
+        """
+        Checks that every conversation phone number is valid and puts it in canonical E.164 format.
+        """
+        if len(self._conversation_phone_numbers) == 0:
+            raise ValueError("'conversation_phone_numbers' cannot be empty.")
+        self._conversation_phone_numbers = [
+            phone_number.validate(conversation_phone_number)
+            for conversation_phone_number in self._conversation_phone_numbers
+        ]
+
+    def _get_page_size(
+        self, *, num_messages: Optional[int], messages_yielded: int
+    ) -> int:
+        """
+        Returns the page size for the next get_messages call.
+        Every page is as large as allowed, except the last page of an exact count, which only asks for what is left.
+        So reading n messages takes ceil(n / 30) calls.
+        """
+        if num_messages is None:
+            return self._DEFAULT_PAGE_SIZE
+        return min(self._DEFAULT_PAGE_SIZE, num_messages - messages_yielded)
+
+    @staticmethod
+    def _take_since(
+        messages: list[Message], since: datetime
+    ) -> tuple[list[Message], bool]:
+        """
+        Returns the given messages (ordered most recent -> least recent) that were sent at or after since,
+        and whether an older message was reached (so there is no need to fetch any more pages).
+        A naive since is taken to be in local time.
+        """
+        if since.tzinfo is None:
+            since = since.astimezone()
+        messages_since = [message for message in messages if message.datetime_ >= since]
+        return messages_since, len(messages_since) < len(messages)
+
+    @property
+    def _is_group(self) -> bool:
+        return len(self._conversation_phone_numbers) > 1
+
+    @staticmethod
+    def _get_group_number(group: Group) -> str:
+        return (
+            group.e164_contact_value
+            if group.e164_contact_value is not None
+            else group.contact_value
+        )
+
+    @staticmethod
+    def _get_member_numbers(group: Group) -> frozenset[str]:
+        """
+        Returns the E.164 numbers of every member of the given group.
+        """
+        return frozenset(
+            phone_number.to_e164(
+                member.e164_contact_value
+                if member.e164_contact_value is not None
+                else member.contact_value
+            )
+            for member in group.members
+        )
+
+    def _find_group_number(self, *, user: User, groups: list[Group]) -> Optional[str]:
+        """
+        Returns the number of the group whose members are exactly all conversation_phone_numbers + the given user's TextNow number.
+        Numbers are compared in E.164 format.
+        Returns None if there is no such group.
+        """
+        needed_numbers = frozenset(
+            [
+                phone_number.to_e164(user.phone_number),
+                *self._conversation_phone_numbers,
+            ]
+        )
+        for group in groups:
+            # a group with fewer members can never match, so skip normalizing its members
+            # one with more may still match, as a member can be listed more than once in different formats
+            if len(group.members) < len(needed_numbers):
+                continue
+            if self._get_member_numbers(group) == needed_numbers:
+                return self._get_group_number(group)
+        return None
+
+    @staticmethod
+    def _get_newest_messages(messages: Iterable[Message]) -> list[Message]:
+        """
+        Returns the newest of the given messages in each conversation.
+        Marking a message as read marks every message before it in its conversation as read too, so only these need to be marked.
+        """
+        # conversation number -> newest message
+        newest_messages: dict[str, Message] = dict()
+        for message in messages:
+            key = phone_number.to_e164(message.number)
+            newest_message = newest_messages.get(key)
+            if newest_message is None or message.datetime_ > newest_message.datetime_:
+                newest_messages[key] = message
+        return list(newest_messages.values())
+
+    @staticmethod
+    def _get_media_info(file_path: str) -> tuple[str, str, bool, MessageType]:
+        """
+        Returns the (media_type, file_type, is_video, message_type) for the media at the given file_path.
+        """
+        return media.get_media_info(file_path)
@@ -0,0 +1,67 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+from pythontextnow.api.Client import ClientConfig
+from pythontextnow.api.TextNowAPI import TextNowAPI
+from pythontextnow.model.DeleteResult import DeleteResult
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class BulkDeleteService:
+    """
+    Deletes many messages at once, each delete still waiting on the delete rate limit.
+    Up to max_workers deletes are in flight at a time, one for each pooled connection unless given.
+    Messages are deleted from the given client_config's account, or the one set with Client.set_client_config().
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        client_config: Optional[ClientConfig] = None,
+    ):
+        self.__text_now_api = TextNowAPI(client_config=client_config)
+        max_workers = (
+            max_workers
+            if max_workers is not None
+            else ConfigReader.get("api", "pool_maxsize", as_type=int)
+        )
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pythontextnow-delete"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def __delete(self, message_id: str) -> DeleteResult:
+        try:
+            self.__text_now_api.delete_message(message_id=message_id)
+        except Exception as e:
+            return DeleteResult(message_id=message_id, error=e)
+        return DeleteResult(message_id=message_id)
+
+    def submit(self, *, message_id: str) -> Future[DeleteResult]:
+        """
+        Schedules the message with the given ID to be deleted and returns a Future for its DeleteResult.
+        The Future never raises, a failed delete is reported in DeleteResult.error.
+        """
+        return self.__executor.submit(self.__delete, message_id)
+
+    def delete_messages(
+        self, *, message_ids: Iterable[str]
+    ) -> list[Future[DeleteResult]]:
+        """
+        Schedules the messages with every given ID to be deleted.
+        Returns a Future for each delete, in the order the IDs were given.
+        """
+        return [self.submit(message_id=message_id) for message_id in message_ids]
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """
+        Stops accepting new deletions.
+        If wait is True, blocks until every scheduled deletion is done.
+        """
+        self.__executor.shutdown(wait=wait)
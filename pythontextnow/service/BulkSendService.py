@@ -0,0 +1,110 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+
+from pythontextnow.api.Client import Client, ClientConfig
+from pythontextnow.api.ClientPool import ClientPool
+from pythontextnow.api.TextNowAPI import TextNowAPI
+from pythontextnow.model.SendResult import SendResult
+from pythontextnow.util import general
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class BulkSendService:
+    """
+    Sends many text messages at once, each send still waiting on the send rate limit of its account.
+    Each account gets max_workers threads, or as many as its connection pool holds.
+
+    Messages are sent from the given client_config's account, or the one set with Client.set_client_config().
+    If a client_pool is given instead, sends are spread across its accounts in turn.
+
+    THINGS TO NOTE:
+        - Sends are dispatched in the order they are submitted
+        - If the rate limit allows calls to overlap, messages to the same recipient may arrive out of order
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        client_config: Optional[ClientConfig] = None,
+        client_pool: Optional[ClientPool] = None,
+    ):
+        if client_config is not None and client_pool is not None:
+            raise ValueError("'client_config' and 'client_pool' cannot both be given.")
+        if client_pool is None:
+            client_pool = ClientPool(
+                [
+                    client_config
+                    if client_config is not None
+                    else Client.get_client_config()
+                ]
+            )
+        self.__client_pool = client_pool
+        max_workers = (
+            max_workers
+            if max_workers is not None
+            else ConfigReader.get("api", "pool_maxsize", as_type=int) * len(client_pool)
+        )
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pythontextnow-send"
+        )
+        # username -> TextNowAPI
+        self.__text_now_apis: dict[str, TextNowAPI] = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def __get_text_now_api(self, client_config: ClientConfig) -> TextNowAPI:
+        text_now_api = self.__text_now_apis.get(client_config.username)
+        if text_now_api is None:
+            text_now_api = self.__text_now_apis.setdefault(
+                client_config.username, TextNowAPI(client_config=client_config)
+            )
+        return text_now_api
+
+    def __send(self, message: str, send_to: str) -> SendResult:
+        client_config = self.__client_pool.get_next_client_config()
+        try:
+            self.__get_text_now_api(client_config).send_message(
+                message=general.replace_newlines(message), send_to=send_to
+            )
+        except Exception as e:
+            return SendResult(
+                message=message,
+                send_to=send_to,
+                username=client_config.username,
+                error=e,
+            )
+        return SendResult(
+            message=message, send_to=send_to, username=client_config.username
+        )
+
+    def submit(self, *, message: str, send_to: str) -> Future[SendResult]:
+        """
+        Schedules the given message to be sent and returns a Future for its SendResult.
+        The Future never raises, a failed send is reported in SendResult.error.
+        """
+        return self.__executor.submit(self.__send, message, send_to)
+
+    def send_messages(
+        self, *, messages: Iterable[str], recipients: list[str]
+    ) -> list[Future[SendResult]]:
+        """
+        Schedules every given message to be sent to every given recipient.
+        Returns a Future for each send, in the order messages are sent to each recipient.
+        """
+        futures = list()
+        for message in messages:
+            for recipient in recipients:
+                futures.append(self.submit(message=message, send_to=recipient))
+        return futures
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """
+        Stops accepting new messages.
+        If wait is True, blocks until every scheduled message has been sent.
+        """
+        self.__executor.shutdown(wait=wait)
@@ -1,24 +1,60 @@
-import mimetypes
-from typing import Generator, Optional
+from __future__ import annotations
 
-import phonenumbers
+import itertools
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, Optional
 
+from pythontextnow.api.Client import ClientConfig
 from pythontextnow.api.TextNowAPI import TextNowAPI
-from pythontextnow.enum import MessageType
+from pythontextnow.enum import ExportFormat
+from pythontextnow.export.MessageExporter import MessageExporter
+from pythontextnow.model.DeleteResult import DeleteResult
 from pythontextnow.model.Message import Message
-from pythontextnow.util import general
+from pythontextnow.model.SendResult import SendResult
+from pythontextnow.service.BaseConversationService import BaseConversationService
+from pythontextnow.service.BulkDeleteService import BulkDeleteService
+from pythontextnow.service.BulkSendService import BulkSendService
+from pythontextnow.store.GroupIndex import GroupIndex
+from pythontextnow.store.MediaCache import MediaCache
+from pythontextnow.store.MessageStore import MessageStore
+from pythontextnow.util import general, media
+from pythontextnow.util.ConfigReader import ConfigReader
 
+if TYPE_CHECKING:
+    from pythontextnow.outbox.Outbox import Outbox
 
-class ConversationService:
-    def __init__(self, *, conversation_phone_numbers: list[str]):
-        self.__conversation_phone_numbers = conversation_phone_numbers
-        # check that given phone numbers are well-formed
-        self.__validate_conversation_phone_numbers()
-        self.__text_now_api = TextNowAPI()
-        self.__cached_conversation_number: str = self.__get_conversation_number()
 
-        self.__DEFAULT_PAGE_SIZE = 30
-        self.__BANNED_MEDIA_TYPES = ["audio"]
+class ConversationService(BaseConversationService):
+    def __init__(
+        self,
+        *,
+        conversation_phone_numbers: list[str],
+        outbox: Optional[Outbox] = None,
+        client_config: Optional[ClientConfig] = None,
+        message_store: Optional[MessageStore] = None,
+        group_index: Optional[GroupIndex] = None,
+        media_cache: Optional[MediaCache] = None,
+    ):
+        """
+        If an outbox is given, send_message() and send_media() queue into it instead of sending right away.
+        If a client_config is given, this acts as that account instead of the one set with Client.set_client_config().
+        If a message_store is given, sync() copies this conversation's messages into it.
+        Group numbers are looked up in the given group_index, or the shared GroupIndex.get_default() if not given.
+        If a media_cache is given, send_media() reuses the upload of any media that has been sent before.
+        """
+        super().__init__(conversation_phone_numbers=conversation_phone_numbers)
+        self.__group_index = (
+            group_index if group_index is not None else GroupIndex.get_default()
+        )
+        self.__media_cache = media_cache
+        self.__outbox = outbox
+        self.__message_store = message_store
+        # the most recent message seen by poll_new()
+        self.__high_water_mark: Optional[Message] = None
+        self.__has_polled = False
+        self.__client_config = client_config
+        self.__text_now_api = TextNowAPI(client_config=client_config)
+        self.__cached_conversation_number: str = self.__get_conversation_number()
 
     @property
     def __conversation_number(self) -> str:
@@ -26,90 +62,98 @@ class ConversationService:
         Returns the conversation number for this conversation.
         """
         if self.__cached_conversation_number is None:
-            if len(self.__conversation_phone_numbers) == 1:
-                # this is a single contact conversation
-                self.__cached_conversation_number = self.__conversation_phone_numbers[0]
-            else:
-                # this is a group chat
-                conversation_number = self.__get_conversation_number()
-                self.__cached_conversation_number = conversation_number
+            self.__cached_conversation_number = self.__get_conversation_number()
         return self.__cached_conversation_number
 
-    def __validate_conversation_phone_numbers(self) -> None:
-        if len(self.__conversation_phone_numbers) == 0:
-            raise ValueError("'conversation_phone_numbers' cannot be empty.")
-        for phone_number in self.__conversation_phone_numbers:
-            parsed_number = phonenumbers.parse(phone_number)
-            if not phonenumbers.is_valid_number(parsed_number):
-                raise ValueError(f"'{phone_number}' is not a possible phone number.")
-
     def __get_conversation_number(self) -> str:
         """
         For a chat with a single number, returns the only conversation_phone_number.
         For interfacing with group chats, a single phone number is used that is assigned by TextNow.
-        This retrieves the group phone number for this group chat.
+        This retrieves the group phone number for this group chat, from the group index if it is there.
         This will not be needed or used if this is not a group chat.
         """
         # check if this is a chat with a single number
-        if len(self.__conversation_phone_numbers) == 1:
-            return self.__conversation_phone_numbers[0]
+        if not self._is_group:
+            return self._conversation_phone_numbers[0]
+        group_number = self.__group_index.get(
+            username=self.__text_now_api.username,
+            phone_numbers=self._conversation_phone_numbers,
+        )
+        if group_number is not None:
+            return group_number
+        group_number = self.__find_or_create_group_number()
+        self.__group_index.put(
+            username=self.__text_now_api.username,
+            phone_numbers=self._conversation_phone_numbers,
+            group_number=group_number,
+        )
+        return group_number
+
+    def __find_or_create_group_number(self) -> str:
         # get this user
         user = self.__text_now_api.get_user()
         # get this user's groups
         groups = self.__text_now_api.get_groups()
 
-        # find the group that contains exactly all conversation_phone_numbers + this user's TextNow number
-        for group in groups:
-            # keep track of all numbers that should be in the group we are looking for
-            all_needed_group_numbers = [
-                user.phone_number
-            ] + self.__conversation_phone_numbers
-            # keep track of all numbers that have are a match
-            matching_numbers = list()
-            if len(group.members) == len(all_needed_group_numbers):
-                # correct amount of members, see if all the numbers match
-                for member in group.members:
-                    for needed_number in all_needed_group_numbers:
-                        member_number = (
-                            member.e164_contact_value
-                            if member.e164_contact_value is not None
-                            else member.contact_value
-                        )
-                        if (
-                            needed_number in member_number
-                            or member_number in needed_number
-                        ):
-                            # in the group we are looking for
-                            matching_numbers.append(member_number)
-            if len(matching_numbers) == len(all_needed_group_numbers):
-                return (
-                    group.e164_contact_value
-                    if group.e164_contact_value is not None
-                    else group.contact_value
-                )
+        group_number = self._find_group_number(user=user, groups=groups)
+        if group_number is not None:
+            return group_number
 
         # unable to find a group that matched all conversation phone numbers
         # create a new group
         new_group = self.__text_now_api.create_group(
-            phone_numbers=self.__conversation_phone_numbers
-        )
-        return (
-            new_group.e164_contact_value
-            if new_group.e164_contact_value is not None
-            else new_group.contact_value
+            phone_numbers=self._conversation_phone_numbers
         )
+        return self._get_group_number(new_group)
 
-    def send_message(self, *, message: str):
+    def send_message(self, *, message: str) -> Optional[int]:
         """
         Sends a text message to this instance's conversation_phone_number.
+        If this instance has an outbox, the message is queued and its outbox ID is returned.
         """
+        if self.__outbox is not None:
+            return self.__outbox.enqueue_message(
+                conversation_phone_numbers=self._conversation_phone_numbers,
+                message=message,
+            )
         message = general.replace_newlines(message)
         self.__text_now_api.send_message(
             message=message, send_to=self.__conversation_number
         )
 
+    def send_messages(
+        self, *, messages: Iterable[str], max_workers: Optional[int] = None
+    ) -> list[SendResult] | list[int]:
+        """
+        Sends every given text message to this instance's conversation_phone_number.
+        Messages are sent concurrently (see BulkSendService) and this blocks until they have all been sent.
+        Returns a SendResult for each message, in the order they were given.
+        If this instance has an outbox, the messages are queued instead and their outbox IDs are returned, in the order they were given.
+        """
+        if self.__outbox is not None:
+            return [
+                self.__outbox.enqueue_message(
+                    conversation_phone_numbers=self._conversation_phone_numbers,
+                    message=message,
+                )
+                for message in messages
+            ]
+        with BulkSendService(
+            max_workers=max_workers, client_config=self.__client_config
+        ) as bulk_send_service:
+            futures = bulk_send_service.send_messages(
+                messages=messages, recipients=[self.__conversation_number]
+            )
+        return [future.result() for future in futures]
+
     def get_messages(
-        self, *, num_messages: Optional[int] = None, include_archived: bool = True
+        self,
+        *,
+        num_messages: Optional[int] = None,
+        include_archived: bool = True,
+        since: Optional[datetime] = None,
+        prefetch_pages: int = 0,
+        keep_raw: bool = True,
     ) -> Generator[list[Message], None, None]:
         """
         This yields the last n messages in the conversation with this instance's conversation_phone_number.
@@ -119,29 +163,208 @@ class ConversationService:
             - num_messages is the number of messages to return before stopping iteration
             - if num_messages is not given, this generator will keep yielding until there are no more messages found
             - The returned message list will be ordered most recent -> least recent
-            - This enforces a cooldown time between each call
+            - Each call waits on the rate limit
+            - If since is given, iteration stops at the first message sent before it
+            - If keep_raw is False, messages do not keep the raw dicts they were parsed from, which saves memory on large reads
+            - Every call asks for as many messages as allowed (30), so reading n messages takes ceil(n / 30) calls
+            - If prefetch_pages is given, up to that many pages are fetched in the background while the current one is used
         """
-        start_message_id: Optional[str] = None
+        pages = self.__get_pages(
+            num_messages=num_messages,
+            include_archived=include_archived,
+            since=since,
+            keep_raw=keep_raw,
+        )
+        yield from general.prefetch(pages, depth=prefetch_pages)
 
-        messages_yielded = 0
-        page_size = (
-            num_messages if num_messages is not None else self.__DEFAULT_PAGE_SIZE
+    def get_message_columns(
+        self,
+        *,
+        chunk_size: Optional[int] = None,
+        num_messages: Optional[int] = None,
+        include_archived: bool = True,
+        since: Optional[datetime] = None,
+    ) -> Generator[dict[str, list], None, None]:
+        """
+        This yields the messages in this conversation as chunks of columns (see MessageExporter.to_columns()).
+        Each chunk has up to chunk_size messages, ordered most recent -> least recent.
+        If chunk_size is not given, it defaults to the value in app.properties.
+
+        Only one chunk of messages is held at a time, so this can read a whole conversation into pandas without holding every message:
+            pandas.concat(pandas.DataFrame(columns) for columns in conversation_service.get_message_columns())
+        """
+        chunk_size = (
+            chunk_size
+            if chunk_size is not None
+            else ConfigReader.get("export", "chunk_size", as_type=int)
+        )
+        chunk = list()
+        for messages in self.get_messages(
+            num_messages=num_messages,
+            include_archived=include_archived,
+            since=since,
+            prefetch_pages=1,
+            keep_raw=False,
+        ):
+            chunk += messages
+            while len(chunk) >= chunk_size:
+                yield MessageExporter.to_columns(chunk[:chunk_size])
+                chunk = chunk[chunk_size:]
+        if len(chunk) > 0:
+            yield MessageExporter.to_columns(chunk)
+
+    def export_messages(
+        self,
+        *,
+        file_path: str,
+        export_format: ExportFormat,
+        chunk_size: Optional[int] = None,
+        num_messages: Optional[int] = None,
+        include_archived: bool = True,
+        since: Optional[datetime] = None,
+    ) -> int:
+        """
+        Writes the messages in this conversation to the given file, one chunk at a time.
+        Returns how many messages were written.
+        """
+        return MessageExporter.write(
+            self.get_message_columns(
+                chunk_size=chunk_size,
+                num_messages=num_messages,
+                include_archived=include_archived,
+                since=since,
+            ),
+            file_path=file_path,
+            export_format=export_format,
+        )
+
+    def poll_new(self) -> list[Message]:
+        """
+        Returns the messages in this conversation that are newer than the most recent message seen by the last call, ordered most recent -> least recent.
+        The first call only records the most recent message and returns an empty list.
+
+        Paging stops as soon as an already seen message is reached, so a quiet conversation costs one call.
+        """
+        if not self.__has_polled:
+            messages = next(self.__get_pages(num_messages=1, include_archived=True), [])
+            self.__high_water_mark = messages[0] if len(messages) > 0 else None
+            self.__has_polled = True
+            return list()
+
+        high_water_mark = self.__high_water_mark
+
+        def is_new(message: Message) -> bool:
+            # the datetime check stops at older messages even if the high water mark has been deleted
+            return high_water_mark is None or (
+                message.id_ != high_water_mark.id_
+                and message.datetime_ >= high_water_mark.datetime_
+            )
+
+        new_messages = list()
+        for messages in self.__get_pages(num_messages=None, include_archived=True):
+            page_new_messages = list(itertools.takewhile(is_new, messages))
+            new_messages += page_new_messages
+            if len(page_new_messages) < len(messages):
+                break
+        if len(new_messages) > 0:
+            self.__high_water_mark = new_messages[0]
+        return new_messages
+
+    def sync(self) -> int:
+        """
+        Copies any messages in this conversation that are not yet in this instance's message store into it.
+        Returns how many messages were added.
+
+        Pages back from the most recent message and stops at the first message that is already stored, so only new messages are fetched.
+        If an earlier sync stopped before reaching the start of the conversation, this carries on from the oldest stored message.
+        Messages that are already stored are not updated.
+        """
+        message_store = self.__get_message_store()
+        conversation_number = self.__conversation_number
+        history_complete = message_store.is_history_complete(conversation_number)
+        oldest_message_id = message_store.get_oldest_message_id(conversation_number)
+
+        messages_added = 0
+        for messages in self.__get_pages(num_messages=None, include_archived=True):
+            new_messages = list(
+                itertools.takewhile(
+                    lambda message: not message_store.has_message(
+                        conversation_number, message.id_
+                    ),
+                    messages,
+                )
+            )
+            messages_added += message_store.add_messages(
+                conversation_number, new_messages
+            )
+            if len(new_messages) < len(messages):
+                break
+        else:
+            # paged back to the start of the conversation
+            message_store.set_history_complete(conversation_number)
+            return messages_added
+
+        if not history_complete:
+            for messages in self.__get_pages(
+                num_messages=None,
+                include_archived=True,
+                start_message_id=oldest_message_id,
+            ):
+                messages_added += message_store.add_messages(
+                    conversation_number, messages
+                )
+            message_store.set_history_complete(conversation_number)
+        return messages_added
+
+    def get_stored_messages(
+        self, *, num_messages: Optional[int] = None, since: Optional[datetime] = None
+    ) -> list[Message]:
+        """
+        Returns the messages in this instance's message store for this conversation, ordered most recent -> least recent.
+        This does not call TextNow, call sync() first to pick up new messages.
+        """
+        return self.__get_message_store().get_messages(
+            self.__conversation_number, num_messages=num_messages, since=since
         )
 
-        while num_messages is None or messages_yielded < num_messages and page_size > 0:
+    def __get_message_store(self) -> MessageStore:
+        if self.__message_store is None:
+            raise ValueError("This ConversationService has no message store.")
+        return self.__message_store
+
+    def __get_pages(
+        self,
+        *,
+        num_messages: Optional[int],
+        include_archived: bool,
+        since: Optional[datetime] = None,
+        start_message_id: Optional[str] = None,
+        keep_raw: bool = True,
+    ) -> Generator[list[Message], None, None]:
+        messages_yielded = 0
+        while True:
+            page_size = self._get_page_size(
+                num_messages=num_messages, messages_yielded=messages_yielded
+            )
+            if page_size <= 0:
+                return
             messages = self.__text_now_api.get_messages(
                 self.__conversation_number,
                 start_message_id=start_message_id,
                 get_archived=include_archived,
                 page_size=page_size,
+                keep_raw=keep_raw,
             )
+            if len(messages) == 0:
+                return
+            start_message_id = messages[-1].id_
+            reached_since = False
+            if since is not None:
+                messages, reached_since = self._take_since(messages, since)
+            messages_yielded += len(messages)
             if len(messages) > 0:
-                start_message_id = messages[-1].id_
-                messages_yielded += len(messages)
-                if num_messages:
-                    page_size -= messages_yielded
                 yield messages
-            else:
+            if reached_since:
                 return
 
     def mark_as_read(
@@ -149,15 +372,17 @@ class ConversationService:
     ) -> None:
         """
         Marks the given message/s as read.
-        This enforces a cooldown time between each call.
+        Only the newest given message in each conversation is marked, which marks every message before it as read too.
+        So this makes one call per conversation rather than one per message.
+        Each call waits on the rate limit.
         """
         if message is None and messages is None:
             raise ValueError("'message' and 'messages' cannot both be None.")
         all_messages = messages
         if all_messages is None:
             all_messages = [message]
-        for message in all_messages:
-            self.__text_now_api.mark_message_as_read(message)
+        for newest_message in self._get_newest_messages(all_messages):
+            self.__text_now_api.mark_message_as_read(newest_message)
 
     def delete_message(
         self, *, message: Optional[Message] = None, message_id: Optional[str] = None
@@ -171,44 +396,59 @@ class ConversationService:
         message_id = message_id if message_id is not None else message.id_
         self.__text_now_api.delete_message(message_id=message_id)
 
-    def send_media(self, *, file_path: str):
+    def delete_messages(
+        self,
+        *,
+        messages: Optional[Iterable[Message]] = None,
+        message_ids: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[DeleteResult]:
+        """
+        Deletes the given messages and messages with the given IDs.
+        Messages are deleted concurrently (see BulkDeleteService) and this blocks until they have all been deleted.
+        Returns a DeleteResult for each message, with the given messages first and then the given IDs.
+        """
+        if messages is None and message_ids is None:
+            raise ValueError("'messages' and 'message_ids' cannot both be None.")
+        all_message_ids = itertools.chain(
+            (message.id_ for message in messages or list()), message_ids or list()
+        )
+        with BulkDeleteService(
+            max_workers=max_workers, client_config=self.__client_config
+        ) as bulk_delete_service:
+            futures = bulk_delete_service.delete_messages(message_ids=all_message_ids)
+        return [future.result() for future in futures]
+
+    def send_media(
+        self,
+        *,
+        file_path: str,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Optional[int]:
         """
         Sends the given media to this instance's conversation_phone_number.
         Supports sending:
             - Images
             - Videos
             - GIFs
+        The file is streamed as it is uploaded, so it is never read into memory all at once.
+        If on_progress is given, it is called with (bytes uploaded, total bytes) as the upload goes.
+        If this instance has a media_cache and the same content has been uploaded before, the upload is skipped.
+        If this instance has an outbox, the media is queued and its outbox ID is returned.
         """
-
-        mime_type = mimetypes.guess_type(file_path)
-        if mime_type is None:
-            raise ValueError("Cannot get media type from media at 'file_path'.")
-        media_type = mime_type[0]  # will be something like "video/mp4" or "image/png"
-        file_type = media_type[0].split("/")[
-            0
-        ]  # will be something like "video" or "image" or "gif"
-        if file_type in self.__BANNED_MEDIA_TYPES:
-            raise ValueError(f"'{file_type} is not an allowed media type.'")
-        is_video = file_type == "video"
-        message_type = MessageType.IMAGE if file_type == "image" else MessageType.VIDEO
-
-        with open(file_path, mode="rb") as media:
-            raw_media = media.read()
-
-        attachment_url = self.__text_now_api.get_attachment_url(
-            message_type=message_type
-        )
-
-        self.__text_now_api.upload_raw_media(
-            attachment_url=attachment_url, raw_media=raw_media, media_type=media_type
-        )
-
-        self.__text_now_api.send_attachment(
+        if self.__outbox is not None:
+            # fail now rather than in the outbox if this media cannot be sent
+            self._get_media_info(file_path)
+            return self.__outbox.enqueue_media(
+                conversation_phone_numbers=self._conversation_phone_numbers,
+                file_path=file_path,
+            )
+        media.send(
+            self.__text_now_api,
+            file_path=file_path,
             conversation_phone_number=self.__conversation_number,
-            message_type=message_type,
-            file_type=file_type,
-            is_video=is_video,
-            attachment_url=attachment_url,
+            on_progress=on_progress,
+            media_cache=self.__media_cache,
         )
 
     def delete_conversation(self) -> None:
@@ -219,3 +459,10 @@ class ConversationService:
         self.__text_now_api.delete_conversation(
             conversation_phone_number=conversation_number
         )
+        if self._is_group:
+            # the group is gone, so it is looked up (or created) again if this is used again
+            self.__group_index.invalidate(
+                username=self.__text_now_api.username,
+                phone_numbers=self._conversation_phone_numbers,
+            )
+            self.__cached_conversation_number = None
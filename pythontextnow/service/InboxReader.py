@@ -0,0 +1,150 @@
+import heapq
+import itertools
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Generator, Iterable, Optional
+
+from pythontextnow.model.Message import Message
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class InboxReader:
+    """
+    Reads the messages of many conversations at once from one pool of worker threads.
+
+    Conversations take turns, so each one makes progress at the same pace.
+    Pages still wait on the read rate limit of their account, and up to max_workers ([api] pool_maxsize by default) are fetched at once.
+
+    THINGS TO NOTE:
+        - Only one page of each conversation is fetched at a time, so pages of a conversation arrive in order
+        - If ordered is False, messages are yielded as soon as their page arrives
+        - If ordered is True, messages from every conversation are merged most recent -> least recent
+        - An ordered read keeps up to two pages of each conversation in memory, as a message can only be yielded once every conversation has a page to compare it with
+    """
+
+    def __init__(
+        self,
+        conversation_services: Iterable[ConversationService],
+        *,
+        max_workers: Optional[int] = None,
+    ):
+        # a conversation given more than once is only read once
+        self.__conversation_services = list(dict.fromkeys(conversation_services))
+        self.__max_workers = (
+            max_workers
+            if max_workers is not None
+            else ConfigReader.get("api", "pool_maxsize", as_type=int)
+        )
+
+    @staticmethod
+    def __get_sort_key(message: Message) -> float:
+        # heapq pops the smallest key first, and the most recent message should come first
+        return -message.datetime_.timestamp()
+
+    def get_messages(
+        self,
+        *,
+        num_messages: Optional[int] = None,
+        include_archived: bool = True,
+        since: Optional[datetime] = None,
+        keep_raw: bool = True,
+        ordered: bool = False,
+    ) -> Generator[tuple[ConversationService, Message], None, None]:
+        """
+        This yields (conversation service, message) for messages in every conversation.
+        num_messages, include_archived, since and keep_raw apply to each conversation as they do in ConversationService.get_messages().
+        If any page cannot be fetched, the error is raised to the caller and reading stops.
+        """
+        pages = {
+            conversation_service: conversation_service.get_messages(
+                num_messages=num_messages,
+                include_archived=include_archived,
+                since=since,
+                keep_raw=keep_raw,
+            )
+            for conversation_service in self.__conversation_services
+        }
+        # conversations whose next page should be fetched, in the order they take turns
+        waiting: deque[ConversationService] = deque(self.__conversation_services)
+        # conversations that are waiting or being fetched
+        scheduled: set[ConversationService] = set(self.__conversation_services)
+        in_flight: dict[Future, ConversationService] = dict()
+        # conversations with no pages left to fetch
+        exhausted: set[ConversationService] = set()
+        # conversations with no pages left to fetch or messages left to yield
+        finished: set[ConversationService] = set()
+        # used when ordered, the messages of each conversation that have not been yielded yet
+        buffers: dict[ConversationService, deque[Message]] = {
+            conversation_service: deque()
+            for conversation_service in self.__conversation_services
+        }
+        # used when ordered, (sort key, tiebreaker, conversation service) for the next message of each buffered conversation
+        heads: list[tuple[float, int, ConversationService]] = list()
+        counter = itertools.count()
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.__max_workers, thread_name_prefix="pythontextnow-inbox"
+        )
+        try:
+            while waiting or in_flight or heads:
+                while waiting and len(in_flight) < self.__max_workers:
+                    conversation_service = waiting.popleft()
+                    future = executor.submit(next, pages[conversation_service], None)
+                    in_flight[future] = conversation_service
+
+                if in_flight:
+                    completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        conversation_service = in_flight.pop(future)
+                        scheduled.discard(conversation_service)
+                        page = future.result()
+                        if page is None:
+                            exhausted.add(conversation_service)
+                            if not buffers[conversation_service]:
+                                finished.add(conversation_service)
+                            continue
+                        if not ordered:
+                            for message in page:
+                                yield conversation_service, message
+                            scheduled.add(conversation_service)
+                            waiting.append(conversation_service)
+                            continue
+                        buffer = buffers[conversation_service]
+                        if not buffer:
+                            heapq.heappush(
+                                heads,
+                                (
+                                    self.__get_sort_key(page[0]),
+                                    next(counter),
+                                    conversation_service,
+                                ),
+                            )
+                            # fetch one page ahead while this one is merged
+                            scheduled.add(conversation_service)
+                            waiting.append(conversation_service)
+                        buffer.extend(page)
+
+                # a message can only be yielded once every conversation that is not exhausted has a message to compare it with
+                while heads and len(heads) + len(finished) == len(buffers):
+                    _, _, conversation_service = heapq.heappop(heads)
+                    buffer = buffers[conversation_service]
+                    yield conversation_service, buffer.popleft()
+                    if buffer:
+                        heapq.heappush(
+                            heads,
+                            (
+                                self.__get_sort_key(buffer[0]),
+                                next(counter),
+                                conversation_service,
+                            ),
+                        )
+                    elif conversation_service in exhausted:
+                        finished.add(conversation_service)
+                    elif conversation_service not in scheduled:
+                        scheduled.add(conversation_service)
+                        waiting.append(conversation_service)
+        finally:
+            # stop fetching if the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
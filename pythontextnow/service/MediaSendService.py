@@ -0,0 +1,132 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from pythontextnow.api.AttachmentUrlPool import AttachmentUrlPool
+from pythontextnow.api.Client import ClientConfig
+from pythontextnow.api.TextNowAPI import TextNowAPI
+from pythontextnow.enum import MessageType
+from pythontextnow.model.MediaSendResult import MediaSendResult
+from pythontextnow.store.MediaCache import MediaCache
+from pythontextnow.util import media
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class MediaSendService:
+    """
+    Sends many media files at once, overlapping the three steps of each send.
+
+    Attachment URLs are fetched into an AttachmentUrlPool while earlier files are still uploading.
+    Uploads go to TextNow's storage host, which is not rate limited, on up to max_workers threads ([media] upload_workers by default).
+
+    If a media_cache is given, content that has been uploaded before is not uploaded again.
+    Sends of the same content wait for a single upload rather than each uploading it.
+
+    Media is sent from the given client_config's account, or the one set with Client.set_client_config().
+
+    THINGS TO NOTE:
+        - Uploads start in the order they are submitted, but smaller files may be sent before larger ones
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        client_config: Optional[ClientConfig] = None,
+        attachment_url_pool_size: Optional[int] = None,
+        media_cache: Optional[MediaCache] = None,
+    ):
+        self.__text_now_api = TextNowAPI(client_config=client_config)
+        self.__media_cache = media_cache
+        self.__attachment_url_pool = AttachmentUrlPool(
+            self.__text_now_api, pool_size=attachment_url_pool_size
+        )
+        max_workers = (
+            max_workers
+            if max_workers is not None
+            else ConfigReader.get("media", "upload_workers", as_type=int)
+        )
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pythontextnow-media"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def __send(
+        self,
+        file_path: str,
+        send_to: str,
+        on_progress: Optional[Callable[[int, int], None]],
+        prefetched_message_type: Optional[MessageType],
+    ) -> MediaSendResult:
+        took_attachment_url = False
+
+        def get_attachment_url(message_type: MessageType) -> str:
+            nonlocal took_attachment_url
+            took_attachment_url = True
+            return self.__attachment_url_pool.get(message_type)
+
+        try:
+            media.send(
+                self.__text_now_api,
+                file_path=file_path,
+                conversation_phone_number=send_to,
+                on_progress=on_progress,
+                media_cache=self.__media_cache,
+                get_attachment_url=get_attachment_url,
+            )
+        except Exception as e:
+            return MediaSendResult(file_path=file_path, send_to=send_to, error=e)
+        finally:
+            # a send that did not upload (it failed first, or its media was cached) does not need the URL fetched for it
+            if prefetched_message_type is not None and not took_attachment_url:
+                self.__attachment_url_pool.cancel(prefetched_message_type)
+        return MediaSendResult(file_path=file_path, send_to=send_to)
+
+    def submit(
+        self,
+        *,
+        file_path: str,
+        send_to: str,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Future[MediaSendResult]:
+        """
+        Schedules the media at the given file_path to be sent and returns a Future for its MediaSendResult.
+        If on_progress is given, it is called with (bytes uploaded, total bytes) as the upload goes.
+        The Future never raises, a failed send is reported in MediaSendResult.error.
+        """
+        try:
+            message_type = media.get_media_info(file_path)[3]
+        except ValueError:
+            # this media cannot be sent, which is reported in its MediaSendResult
+            message_type = None
+        else:
+            # start fetching an attachment URL now, while earlier files are still uploading
+            self.__attachment_url_pool.prefetch(message_type)
+        return self.__executor.submit(
+            self.__send, file_path, send_to, on_progress, message_type
+        )
+
+    def send_media(
+        self, *, file_paths: Iterable[str], recipients: list[str]
+    ) -> list[Future[MediaSendResult]]:
+        """
+        Schedules the media at every given file path to be sent to every given recipient.
+        Returns a Future for each send, in the order files are sent to each recipient.
+        """
+        futures = list()
+        for file_path in file_paths:
+            for recipient in recipients:
+                futures.append(self.submit(file_path=file_path, send_to=recipient))
+        return futures
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """
+        Stops accepting new media.
+        If wait is True, blocks until every scheduled file has been sent.
+        """
+        self.__executor.shutdown(wait=wait)
+        self.__attachment_url_pool.close(wait=wait)
@@ -0,0 +1,209 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+
+from pythontextnow.model.Message import Message
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.util.ConfigReader import ConfigReader
+from pythontextnow.util.CustomLogger import CustomLogger
+
+
+class MessageWatcher:
+    """
+    Polls many conversations for new messages from one pool of worker threads.
+
+    When new messages are found in a conversation, they are passed to on_new_messages along with its ConversationService.
+    Each conversation is polled with ConversationService.poll_new(), so a quiet conversation costs one call per poll.
+
+    Poll intervals adapt to each conversation's activity.
+    A conversation is polled again after min_poll_interval_seconds when it has new messages.
+    Each time nothing new is found, its interval grows by backoff_factor, up to max_poll_interval_seconds.
+    This keeps replies quick in busy conversations while the number of calls grows with activity rather than with the number of conversations.
+
+    Settings that are not given come from the [watch] section of app.properties.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_new_messages: Callable[[ConversationService, list[Message]], None],
+        min_poll_interval_seconds: Optional[float] = None,
+        max_poll_interval_seconds: Optional[float] = None,
+        backoff_factor: Optional[float] = None,
+        worker_count: Optional[int] = None,
+    ):
+        self.__on_new_messages = on_new_messages
+        self.__min_poll_interval_seconds = (
+            min_poll_interval_seconds
+            if min_poll_interval_seconds is not None
+            else ConfigReader.get("watch", "min_poll_interval_seconds", as_type=float)
+        )
+        self.__max_poll_interval_seconds = (
+            max_poll_interval_seconds
+            if max_poll_interval_seconds is not None
+            else ConfigReader.get("watch", "max_poll_interval_seconds", as_type=float)
+        )
+        self.__backoff_factor = (
+            backoff_factor
+            if backoff_factor is not None
+            else ConfigReader.get("watch", "backoff_factor", as_type=float)
+        )
+        self.__worker_count = (
+            worker_count
+            if worker_count is not None
+            else ConfigReader.get("watch", "worker_count", as_type=int)
+        )
+
+        # (next poll time, tiebreaker, generation, conversation service), soonest first
+        self.__schedule: list[tuple[float, int, int, ConversationService]] = list()
+        # conversation service -> its current poll interval
+        self.__poll_intervals: dict[ConversationService, float] = dict()
+        # conversation service -> the generation it was last watched in
+        # entries scheduled before it was unwatched have an older generation and are skipped
+        self.__generations: dict[ConversationService, int] = dict()
+        # conversation services that are being polled
+        self.__polling: set[ConversationService] = set()
+        self.__counter = itertools.count()
+        self.__condition = threading.Condition()
+        self.__stopping = False
+        self.__workers: list[threading.Thread] = list()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def watch(self, conversation_service: ConversationService) -> None:
+        """
+        Starts polling the given conversation.
+        Only messages that arrive after its first poll are passed to on_new_messages.
+        """
+        with self.__condition:
+            if conversation_service in self.__poll_intervals:
+                return
+            self.__poll_intervals[conversation_service] = (
+                self.__min_poll_interval_seconds
+            )
+            self.__generations[conversation_service] = next(self.__counter)
+            # if it is still being polled from before it was unwatched, it is scheduled once that poll is done
+            # so it is never polled twice at once
+            if conversation_service not in self.__polling:
+                self.__schedule_poll(conversation_service, delay_seconds=0)
+
+    def unwatch(self, conversation_service: ConversationService) -> None:
+        """
+        Stops polling the given conversation.
+        """
+        with self.__condition:
+            self.__poll_intervals.pop(conversation_service, None)
+            self.__generations.pop(conversation_service, None)
+
+    def start(self) -> None:
+        """
+        Starts the worker threads that poll watched conversations.
+        """
+        if self.__workers:
+            return
+        with self.__condition:
+            self.__stopping = False
+        for i in range(self.__worker_count):
+            worker = threading.Thread(
+                target=self.__work, name=f"pythontextnow-watch-{i}", daemon=True
+            )
+            worker.start()
+            self.__workers.append(worker)
+
+    def stop(self, *, wait: bool = True) -> None:
+        """
+        Stops the worker threads once they finish the poll they are making.
+        """
+        with self.__condition:
+            self.__stopping = True
+            self.__condition.notify_all()
+        if wait:
+            for worker in self.__workers:
+                worker.join()
+        self.__workers = list()
+
+    def __schedule_poll(
+        self, conversation_service: ConversationService, *, delay_seconds: float
+    ) -> None:
+        # must be called while holding self.__condition
+        heapq.heappush(
+            self.__schedule,
+            (
+                time.monotonic() + delay_seconds,
+                next(self.__counter),
+                self.__generations[conversation_service],
+                conversation_service,
+            ),
+        )
+        self.__condition.notify()
+
+    def __get_next_due(self) -> Optional[ConversationService]:
+        """
+        Waits until a conversation is due to be polled and returns it.
+        Returns None once stopping.
+        """
+        with self.__condition:
+            while not self.__stopping:
+                if len(self.__schedule) == 0:
+                    self.__condition.wait()
+                    continue
+                poll_at, _, generation, conversation_service = self.__schedule[0]
+                wait_seconds = poll_at - time.monotonic()
+                if wait_seconds > 0:
+                    self.__condition.wait(wait_seconds)
+                    continue
+                heapq.heappop(self.__schedule)
+                if self.__generations.get(conversation_service) == generation:
+                    self.__polling.add(conversation_service)
+                    return conversation_service
+            return None
+
+    def __work(self) -> None:
+        while True:
+            conversation_service = self.__get_next_due()
+            if conversation_service is None:
+                return
+            found_new_messages = self.__poll(conversation_service)
+            with self.__condition:
+                self.__polling.discard(conversation_service)
+                poll_interval_seconds = self.__poll_intervals.get(conversation_service)
+                if poll_interval_seconds is None:
+                    # unwatched while it was being polled
+                    continue
+                if found_new_messages:
+                    poll_interval_seconds = self.__min_poll_interval_seconds
+                else:
+                    poll_interval_seconds = min(
+                        poll_interval_seconds * self.__backoff_factor,
+                        self.__max_poll_interval_seconds,
+                    )
+                self.__poll_intervals[conversation_service] = poll_interval_seconds
+                self.__schedule_poll(
+                    conversation_service, delay_seconds=poll_interval_seconds
+                )
+
+    def __poll(self, conversation_service: ConversationService) -> bool:
+        """
+        Polls the given conversation and returns whether it had new messages.
+        """
+        try:
+            new_messages = conversation_service.poll_new()
+        except Exception as e:
+            CustomLogger.getLogger().warning(f"FAILED TO POLL CONVERSATION: {e}")
+            return False
+        if len(new_messages) == 0:
+            return False
+        try:
+            self.__on_new_messages(conversation_service, new_messages)
+        except Exception as e:
+            CustomLogger.getLogger().warning(
+                f"ERROR HANDLING NEW MESSAGES FROM CONVERSATION: {e}"
+            )
+        return True
@@ -1 +1,7 @@
+from .AsyncConversationService import AsyncConversationService
+from .BulkDeleteService import BulkDeleteService
+from .BulkSendService import BulkSendService
 from .ConversationService import ConversationService
+from .InboxReader import InboxReader
+from .MediaSendService import MediaSendService
+from .MessageWatcher import MessageWatcher
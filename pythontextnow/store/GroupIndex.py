@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Iterable, Optional
+
+from pythontextnow.util import phone_number
+from pythontextnow.util.ConfigReader import ConfigReader
+from pythontextnow.util.SQLiteConnections import SQLiteConnections
+
+
+class GroupIndex:
+    """
+    Remembers the group number TextNow assigned to each group conversation, so it does not have to be looked up again.
+
+    Entries are scoped to an account (username) and keyed by the group's phone numbers in E.164 format, sorted and deduplicated.
+    They expire after ttl_seconds.
+    If not given, ttl_seconds defaults to the value in app.properties.
+
+    Entries are kept in memory.
+    If a database_path is given, they are also kept in a SQLite database file, so they survive restarts and can be shared between processes.
+    """
+
+    __default: Optional[GroupIndex] = None
+    __default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        database_path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        timeout_seconds: float = 30,
+    ):
+        self.__ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else ConfigReader.get("group_index", "ttl_seconds", as_type=float)
+        )
+        self.__connections = (
+            SQLiteConnections(database_path, timeout_seconds=timeout_seconds)
+            if database_path is not None
+            else None
+        )
+        # (username, key) -> (group number, indexed at)
+        self.__entries: dict[tuple[str, tuple[str, ...]], tuple[str, float]] = dict()
+        self.__lock = threading.Lock()
+        if database_path is not None:
+            self.__connections.get().execute(
+                """
+                CREATE TABLE IF NOT EXISTS group_index (
+                    username TEXT NOT NULL,
+                    phone_numbers TEXT NOT NULL,
+                    group_number TEXT NOT NULL,
+                    indexed_at REAL NOT NULL,
+                    PRIMARY KEY (username, phone_numbers)
+                )
+                """
+            )
+
+    @classmethod
+    def get_default(cls) -> GroupIndex:
+        """
+        Returns the in-memory GroupIndex shared by every conversation service that is not given one.
+        """
+        with cls.__default_lock:
+            if cls.__default is None:
+                cls.__default = GroupIndex()
+            return cls.__default
+
+    @property
+    def is_persistent(self) -> bool:
+        """
+        Whether entries are kept in a SQLite database file, making each call blocking I/O.
+        """
+        return self.__connections is not None
+
+    @staticmethod
+    def _get_key(phone_numbers: Iterable[str]) -> tuple[str, ...]:
+        return tuple(
+            sorted(
+                {
+                    phone_number.to_e164(group_phone_number)
+                    for group_phone_number in phone_numbers
+                }
+            )
+        )
+
+    def get(self, *, username: str, phone_numbers: Iterable[str]) -> Optional[str]:
+        """
+        Returns the group number of the group with the given phone numbers.
+        Returns None if it is not indexed or its entry has expired.
+        """
+        key = self._get_key(phone_numbers)
+        with self.__lock:
+            entry = self.__entries.get((username, key))
+        if entry is None and self.__connections is not None:
+            row = (
+                self.__connections.get()
+                .execute(
+                    "SELECT group_number, indexed_at FROM group_index WHERE username = ? AND phone_numbers = ?",
+                    (username, json.dumps(key)),
+                )
+                .fetchone()
+            )
+            if row is not None:
+                entry = (row[0], row[1])
+                with self.__lock:
+                    self.__entries[(username, key)] = entry
+        if entry is None:
+            return None
+        group_number, indexed_at = entry
+        if time.time() - indexed_at > self.__ttl_seconds:
+            self.invalidate(username=username, phone_numbers=key)
+            return None
+        return group_number
+
+    def put(
+        self, *, username: str, phone_numbers: Iterable[str], group_number: str
+    ) -> None:
+        key = self._get_key(phone_numbers)
+        indexed_at = time.time()
+        with self.__lock:
+            self.__entries[(username, key)] = (group_number, indexed_at)
+        if self.__connections is not None:
+            self.__connections.get().execute(
+                "INSERT OR REPLACE INTO group_index (username, phone_numbers, group_number, indexed_at) VALUES (?, ?, ?, ?)",
+                (username, json.dumps(key), group_number, indexed_at),
+            )
+
+    def invalidate(
+        self, *, username: str, phone_numbers: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Removes the entry for the group with the given phone numbers.
+        If no phone numbers are given, every entry for the given username is removed.
+        """
+        if phone_numbers is None:
+            with self.__lock:
+                for entry_key in [
+                    entry_key
+                    for entry_key in self.__entries
+                    if entry_key[0] == username
+                ]:
+                    del self.__entries[entry_key]
+            if self.__connections is not None:
+                self.__connections.get().execute(
+                    "DELETE FROM group_index WHERE username = ?", (username,)
+                )
+            return
+        key = self._get_key(phone_numbers)
+        with self.__lock:
+            self.__entries.pop((username, key), None)
+        if self.__connections is not None:
+            self.__connections.get().execute(
+                "DELETE FROM group_index WHERE username = ? AND phone_numbers = ?",
+                (username, json.dumps(key)),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connections, if entries are kept in a file.
+        """
+        if self.__connections is not None:
+            self.__connections.close()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from pythontextnow.util.ConfigReader import ConfigReader
+from pythontextnow.util.SQLiteConnections import SQLiteConnections
+
+
+class MediaCache:
+    """
+    Remembers the attachment URL each media file was uploaded to, so the same content is not uploaded again.
+
+    Entries are scoped to an account (username) and keyed by the SHA-256 digest of the file's contents.
+    They expire after ttl_seconds, and only the max_entries most recently used are kept in memory.
+    If not given, ttl_seconds and max_entries default to the values in app.properties.
+
+    If a database_path is given, entries are also kept in a SQLite database file, so they survive restarts and can be shared between processes.
+
+    Digests are remembered for each file's path, size and modification time, so an unchanged file is only read once.
+    """
+
+    __HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        *,
+        database_path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        timeout_seconds: float = 30,
+    ):
+        self.__ttl_seconds = (
+            ttl_seconds
+            if ttl_seconds is not None
+            else ConfigReader.get("media_cache", "ttl_seconds", as_type=float)
+        )
+        self.__max_entries = (
+            max_entries
+            if max_entries is not None
+            else ConfigReader.get("media_cache", "max_entries", as_type=int)
+        )
+        self.__connections = (
+            SQLiteConnections(database_path, timeout_seconds=timeout_seconds)
+            if database_path is not None
+            else None
+        )
+        # (username, digest) -> (attachment URL, uploaded at), least recently used first
+        self.__entries: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        # (file path, size, modification time) -> digest, least recently used first
+        self.__digests: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+        self.__lock = threading.Lock()
+        # digest -> (lock held while that content is uploaded, how many threads hold or wait on it)
+        # an entry is removed once no thread needs it, so this only grows with the uploads in progress
+        self.__upload_locks: dict[str, tuple[threading.Lock, int]] = dict()
+        if database_path is not None:
+            self.__connections.get().execute(
+                """
+                CREATE TABLE IF NOT EXISTS media_cache (
+                    username TEXT NOT NULL,
+                    digest TEXT NOT NULL,
+                    attachment_url TEXT NOT NULL,
+                    uploaded_at REAL NOT NULL,
+                    PRIMARY KEY (username, digest)
+                )
+                """
+            )
+
+    @property
+    def is_persistent(self) -> bool:
+        """
+        Whether entries are kept in a SQLite database file, making get(), put() and invalidate() blocking I/O.
+        """
+        return self.__connections is not None
+
+    def __remember(self, key: tuple, value: object, entries: OrderedDict) -> None:
+        # must be called while holding the lock
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.__max_entries:
+            entries.popitem(last=False)
+
+    def get_digest(self, file_path: str) -> str:
+        """
+        Returns the SHA-256 digest of the contents of the file at the given file_path, as a hex string.
+        """
+        stat = os.stat(file_path)
+        key = (os.path.realpath(file_path), stat.st_size, stat.st_mtime_ns)
+        with self.__lock:
+            digest = self.__digests.get(key)
+            if digest is not None:
+                self.__digests.move_to_end(key)
+                return digest
+        sha256 = hashlib.sha256()
+        with open(file_path, mode="rb") as media:
+            while chunk := media.read(self.__HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+        digest = sha256.hexdigest()
+        with self.__lock:
+            self.__remember(key, digest, self.__digests)
+        return digest
+
+    @contextmanager
+    def lock_upload(self, digest: str) -> Iterator[None]:
+        """
+        Holds the lock for media with the given digest while checking for and uploading it.
+        This lets threads sending the same content wait for one upload rather than each uploading it.
+        """
+        with self.__lock:
+            upload_lock, users = self.__upload_locks.get(digest, (threading.Lock(), 0))
+            self.__upload_locks[digest] = (upload_lock, users + 1)
+        try:
+            with upload_lock:
+                yield
+        finally:
+            with self.__lock:
+                users = self.__upload_locks[digest][1] - 1
+                if users == 0:
+                    del self.__upload_locks[digest]
+                else:
+                    self.__upload_locks[digest] = (upload_lock, users)
+
+    def get(self, *, username: str, digest: str) -> Optional[str]:
+        """
+        Returns the attachment URL that media with the given digest was uploaded to.
+        Returns None if it is not cached or its entry has expired.
+        """
+        with self.__lock:
+            entry = self.__entries.get((username, digest))
+            if entry is not None:
+                self.__entries.move_to_end((username, digest))
+        if entry is None and self.__connections is not None:
+            row = (
+                self.__connections.get()
+                .execute(
+                    "SELECT attachment_url, uploaded_at FROM media_cache WHERE username = ? AND digest = ?",
+                    (username, digest),
+                )
+                .fetchone()
+            )
+            if row is not None:
+                entry = (row[0], row[1])
+                with self.__lock:
+                    self.__remember((username, digest), entry, self.__entries)
+        if entry is None:
+            return None
+        attachment_url, uploaded_at = entry
+        if time.time() - uploaded_at > self.__ttl_seconds:
+            self.invalidate(username=username, digest=digest)
+            return None
+        return attachment_url
+
+    def put(self, *, username: str, digest: str, attachment_url: str) -> None:
+        uploaded_at = time.time()
+        with self.__lock:
+            self.__remember(
+                (username, digest), (attachment_url, uploaded_at), self.__entries
+            )
+        if self.__connections is not None:
+            self.__connections.get().execute(
+                "INSERT OR REPLACE INTO media_cache (username, digest, attachment_url, uploaded_at) VALUES (?, ?, ?, ?)",
+                (username, digest, attachment_url, uploaded_at),
+            )
+
+    def invalidate(self, *, username: str, digest: Optional[str] = None) -> None:
+        """
+        Removes the entry for media with the given digest.
+        If no digest is given, every entry for the given username is removed.
+        """
+        if digest is None:
+            with self.__lock:
+                for entry_key in [
+                    entry_key
+                    for entry_key in self.__entries
+                    if entry_key[0] == username
+                ]:
+                    del self.__entries[entry_key]
+            if self.__connections is not None:
+                self.__connections.get().execute(
+                    "DELETE FROM media_cache WHERE username = ?", (username,)
+                )
+            return
+        with self.__lock:
+            self.__entries.pop((username, digest), None)
+        if self.__connections is not None:
+            self.__connections.get().execute(
+                "DELETE FROM media_cache WHERE username = ? AND digest = ?",
+                (username, digest),
+            )
+
+    def close(self) -> None:
+        """
+        Closes the database connections of a SQLite-backed cache.
+        """
+        if self.__connections is not None:
+            self.__connections.close()
@@ -0,0 +1,148 @@
+import json
+from datetime import datetime
+from typing import Iterable, Optional
+
+from pythontextnow.api.BaseTextNowAPI import BaseTextNowAPI
+from pythontextnow.model.Message import Message
+from pythontextnow.util import general
+from pythontextnow.util.SQLiteConnections import SQLiteConnections
+
+
+class MessageStore:
+    """
+    Keeps a local copy of messages in a SQLite database file, so reading them again does not call TextNow.
+
+    Messages are indexed by conversation number, message ID and datetime.
+    Each message is stored as the dict TextNow returned for it (see Message.to_dict()), and parsed again when read.
+    """
+
+    def __init__(self, *, database_path: str, timeout_seconds: float = 30):
+        self.__connections = SQLiteConnections(
+            database_path, timeout_seconds=timeout_seconds
+        )
+        connection = self.__connections.get()
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS messages (
+                conversation_number TEXT NOT NULL,
+                id TEXT NOT NULL,
+                datetime REAL NOT NULL,
+                raw TEXT NOT NULL,
+                PRIMARY KEY (conversation_number, id)
+            )
+            """
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS messages_conversation_number_datetime ON messages (conversation_number, datetime)"
+        )
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_state (
+                conversation_number TEXT PRIMARY KEY,
+                history_complete INTEGER NOT NULL
+            )
+            """
+        )
+
+    def add_messages(
+        self, conversation_number: str, messages: Iterable[Message]
+    ) -> int:
+        """
+        Stores the given messages for the given conversation number.
+        Messages that are already stored are left as they are.
+        Returns how many messages were added.
+        """
+        connection = self.__connections.get()
+        connection.execute("BEGIN")
+        try:
+            cursor = connection.executemany(
+                "INSERT OR IGNORE INTO messages (conversation_number, id, datetime, raw) VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        conversation_number,
+                        str(message.id_),
+                        message.datetime_.timestamp(),
+                        json.dumps(message.to_dict()),
+                    )
+                    for message in messages
+                ],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return cursor.rowcount
+
+    def has_message(self, conversation_number: str, message_id: str) -> bool:
+        row = (
+            self.__connections.get()
+            .execute(
+                "SELECT 1 FROM messages WHERE conversation_number = ? AND id = ?",
+                (conversation_number, str(message_id)),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def get_messages(
+        self,
+        conversation_number: str,
+        *,
+        num_messages: Optional[int] = None,
+        since: Optional[datetime] = None,
+    ) -> list[Message]:
+        """
+        Returns the stored messages for the given conversation number, ordered most recent -> least recent.
+        If num_messages is given, only that many of the most recent messages are returned.
+        If since is given, only messages sent at or after it are returned.
+        """
+        query = "SELECT raw FROM messages WHERE conversation_number = ?"
+        parameters: list = [conversation_number]
+        if since is not None:
+            query += " AND datetime >= ?"
+            parameters.append(since.timestamp())
+        query += " ORDER BY datetime DESC, id DESC"
+        if num_messages is not None:
+            query += " LIMIT ?"
+            parameters.append(num_messages)
+        rows = self.__connections.get().execute(query, parameters).fetchall()
+        return list(
+            BaseTextNowAPI._iter_messages(general.loads_json(row[0]) for row in rows)
+        )
+
+    def get_oldest_message_id(self, conversation_number: str) -> Optional[str]:
+        row = (
+            self.__connections.get()
+            .execute(
+                "SELECT id FROM messages WHERE conversation_number = ? ORDER BY datetime, id LIMIT 1",
+                (conversation_number,),
+            )
+            .fetchone()
+        )
+        return row[0] if row is not None else None
+
+    def is_history_complete(self, conversation_number: str) -> bool:
+        """
+        Returns whether every message back to the start of the conversation has been stored.
+        """
+        row = (
+            self.__connections.get()
+            .execute(
+                "SELECT history_complete FROM sync_state WHERE conversation_number = ?",
+                (conversation_number,),
+            )
+            .fetchone()
+        )
+        return row is not None and bool(row[0])
+
+    def set_history_complete(self, conversation_number: str) -> None:
+        self.__connections.get().execute(
+            "INSERT OR REPLACE INTO sync_state (conversation_number, history_complete) VALUES (?, 1)",
+            (conversation_number,),
+        )
+
+    def close(self) -> None:
+        """
+        Closes the connections to the message database.
+        """
+        self.__connections.close()
@@ -0,0 +1,3 @@
+from .GroupIndex import GroupIndex
+from .MediaCache import MediaCache
+from .MessageStore import MessageStore
@@ -1,31 +1,102 @@
 import configparser
 import os
+import threading
+from types import MappingProxyType
+from typing import Any, Optional
 
 
 class ConfigReader:
     """
     Used to read from .properties files
+
+    The properties file is only read once, the first time a value is needed.
+    After that, values come from an immutable in-memory snapshot, and each converted value is cached.
+
+    Any value can be overridden by an environment variable named PYTHONTEXTNOW_{SECTION}_{NAME}.
+    For example: PYTHONTEXTNOW_API_POOL_MAXSIZE=20
+    Values can also be overridden in code with reload(overrides={"api": {"pool_maxsize": 20}}).
     """
 
     __propertiesFileName = "app.properties"
+    __ENVIRONMENT_VARIABLE_PREFIX = "PYTHONTEXTNOW"
+
+    __snapshot: Optional[MappingProxyType] = None
+    __converted_values: dict[tuple, Any] = dict()
+    __lock = threading.Lock()
 
     @classmethod
-    def get(cls, section: str, name: str, as_type=None) -> str | list | float:
-        configParser = configparser.ConfigParser(
-            converters={"list": lambda x: [i.strip() for i in x.split(",")]}
-        )
-        propertiesFilePath = os.path.abspath(
-            os.path.join(
-                os.path.dirname(os.path.realpath(__file__)),
-                f"../{cls.__propertiesFileName}",
-            )
-        )
-        configParser.read(propertiesFilePath)
+    def get(
+        cls, section: str, name: str, as_type=None
+    ) -> str | list | float | int | bool:
+        key = (section, name, as_type)
+        try:
+            return cls.__converted_values[key]
+        except KeyError:
+            pass
+        snapshot = cls.__snapshot if cls.__snapshot is not None else cls.__load()
+        value = snapshot[section][name]
         if as_type == list:
-            return configParser.getlist(section, name)
+            converted_value = [i.strip() for i in value.split(",")]
         elif as_type == float:
-            return configParser.getfloat(section, name)
+            converted_value = float(value)
+        elif as_type == int:
+            converted_value = int(value)
+        elif as_type == bool:
+            if value.lower() not in configparser.ConfigParser.BOOLEAN_STATES:
+                raise ValueError(f"Not a boolean: {value}")
+            converted_value = configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
         elif as_type is None:
-            return configParser[section][name]
+            converted_value = value
         else:
             raise ValueError(f"Type conversion for '{as_type}' not supported.")
+        cls.__converted_values[key] = converted_value
+        return converted_value
+
+    @classmethod
+    def reload(cls, *, overrides: Optional[dict[str, dict[str, Any]]] = None) -> None:
+        """
+        Reads the properties file again.
+        The given overrides ({section: {name: value}}) take precedence over both the file and environment variables.
+        Overrides are kept until the next reload.
+        """
+        cls.__load(overrides=overrides)
+
+    @classmethod
+    def __load(
+        cls, *, overrides: Optional[dict[str, dict[str, Any]]] = None
+    ) -> MappingProxyType:
+        with cls.__lock:
+            configParser = configparser.ConfigParser()
+            propertiesFilePath = os.path.abspath(
+                os.path.join(
+                    os.path.dirname(os.path.realpath(__file__)),
+                    f"../{cls.__propertiesFileName}",
+                )
+            )
+            configParser.read(propertiesFilePath)
+
+            sections = dict()
+            for section in configParser.sections():
+                values = dict(configParser[section])
+                for name in values:
+                    environment_value = os.environ.get(
+                        f"{cls.__ENVIRONMENT_VARIABLE_PREFIX}_{section}_{name}".upper()
+                    )
+                    if environment_value is not None:
+                        values[name] = environment_value
+                sections[section] = values
+            for section, values in (overrides or dict()).items():
+                sections.setdefault(section, dict())
+                for name, value in values.items():
+                    sections[section][name] = (
+                        str(value).lower() if isinstance(value, bool) else str(value)
+                    )
+
+            cls.__snapshot = MappingProxyType(
+                {
+                    section: MappingProxyType(values)
+                    for section, values in sections.items()
+                }
+            )
+            cls.__converted_values = dict()
+            return cls.__snapshot
@@ -0,0 +1,54 @@
+import sqlite3
+import threading
+
+
+class SQLiteConnections:
+    """
+    Hands out connections to a SQLite database file, one for each thread that uses it.
+    sqlite connections cannot be shared between threads, so each thread gets its own the first time it calls get().
+    Connections are opened in autocommit mode, so transactions must be started explicitly (for example with "BEGIN IMMEDIATE").
+    """
+
+    def __init__(self, database_path: str, *, timeout_seconds: float = 30):
+        self.__database_path = database_path
+        self.__timeout_seconds = timeout_seconds
+        self.__local = threading.local()
+        self.__connections: list[sqlite3.Connection] = list()
+        # bumped by close(), so threads know their connection has been closed
+        self.__generation = 0
+        self.__lock = threading.Lock()
+
+    def get(self) -> sqlite3.Connection:
+        """
+        Returns this thread's connection, opening it if needed.
+        """
+        connection = getattr(self.__local, "connection", None)
+        if (
+            connection is None
+            or getattr(self.__local, "generation", None) != self.__generation
+        ):
+            # only ever used by this thread, but may be closed from another one by close()
+            connection = sqlite3.connect(
+                self.__database_path,
+                timeout=self.__timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            with self.__lock:
+                self.__connections.append(connection)
+                self.__local.generation = self.__generation
+            self.__local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """
+        Closes the connection of every thread that has called get(), even threads that have since finished.
+        A thread that calls get() after this is given a new connection.
+        This must not be called while another thread is using its connection.
+        """
+        with self.__lock:
+            connections = self.__connections
+            self.__connections = list()
+            self.__generation += 1
+        for connection in connections:
+            connection.close()
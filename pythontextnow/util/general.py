@@ -1,23 +1,168 @@
+import asyncio
+import functools
+import json
+import queue
 import random
 import re
-from typing import Optional
+import threading
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+)
 
-from random_user_agent.params import OperatingSystem, SoftwareName
-from random_user_agent.user_agent import UserAgent
+T = TypeVar("T")
+
+# put on a prefetch queue once the iterable is exhausted
+_PREFETCH_DONE = object()
 
 
 def replace_newlines(text: str):
     return re.sub(r"(?<!\\)\n", r"\\n", text)
 
 
-def get_random_user_agent(seed: Optional[int] = None) -> str:
+@functools.cache
+def _get_user_agent_pool() -> tuple[str, ...]:
+    """
+    Returns the user agents to choose from.
+    This is only built once per process, and random_user_agent is only imported the first time it is needed.
+    """
+    from random_user_agent.params import OperatingSystem, SoftwareName
+    from random_user_agent.user_agent import UserAgent
+
     software_names = [SoftwareName.CHROME.value]
     operating_systems = [OperatingSystem.WINDOWS.value, OperatingSystem.LINUX.value]
     user_agent_rotator = UserAgent(
         software_names=software_names, operating_systems=operating_systems, limit=100
     )
+    return tuple(
+        user_agent["user_agent"] for user_agent in user_agent_rotator.get_user_agents()
+    )
+
+
+def get_random_user_agent(seed: Optional[int] = None) -> str:
+    """
+    Returns a random user agent.
+    The same seed always gives the same user agent.
+    A private random number generator is used, so the global random module is not reseeded.
+    """
+    return random.Random(seed).choice(_get_user_agent_pool())
+
+
+@functools.cache
+def _get_json_loads() -> Callable[[bytes | str], Any]:
+    """
+    Returns orjson.loads if orjson is installed, as it decodes much faster than the json module, otherwise json.loads.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def loads_json(content: bytes | str) -> Any:
+    """
+    Decodes the given JSON document.
+    Install orjson to make this faster: pip install pythontextnow[fast]
+    """
+    return _get_json_loads()(content)
+
+
+def prefetch(iterable: Iterable[T], *, depth: int) -> Iterator[T]:
+    """
+    Iterates over the given iterable in a background thread, keeping up to depth items ready ahead of the caller.
+    Errors raised by the iterable are raised to the caller.
+    If the caller stops early, the background thread stops once it finishes the item it is getting.
+    """
+    if depth < 1:
+        yield from iterable
+        return
+
+    items: queue.Queue = queue.Queue(maxsize=depth)
+    stopping = threading.Event()
+
+    def put(item: tuple) -> bool:
+        # give up if the caller has stopped, so a full queue cannot block this thread forever
+        while not stopping.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_PREFETCH_DONE, e))
+        else:
+            put((_PREFETCH_DONE, None))
+
+    threading.Thread(target=produce, name="pythontextnow-prefetch", daemon=True).start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _PREFETCH_DONE:
+                return
+            yield item
+    finally:
+        stopping.set()
+
+
+async def prefetch_async(
+    async_iterable: AsyncIterable[T], *, depth: int
+) -> AsyncIterator[T]:
+    """
+    The asyncio version of prefetch().
+    Iterates over the given async iterable in a background task, keeping up to depth items ready ahead of the caller.
+    """
+    if depth < 1:
+        async for item in async_iterable:
+            yield item
+        return
+
+    items: asyncio.Queue = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for item in async_iterable:
+                await items.put((item, None))
+        except Exception as e:
+            await items.put((_PREFETCH_DONE, e))
+        else:
+            await items.put((_PREFETCH_DONE, None))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await items.get()
+            if error is not None:
+                raise error
+            if item is _PREFETCH_DONE:
+                return
+            yield item
+    finally:
+        task.cancel()
 
-    if seed is not None:
-        random.seed(seed)
 
-    return random.choice(user_agent_rotator.get_user_agents())["user_agent"]
+async def call_off_event_loop(
+    function: Callable[..., T], /, *args, blocking: bool, **kwargs
+) -> T:
+    """
+    Calls the given function with the given arguments.
+    If blocking is True (like when it reads or writes a SQLite file), it is called in a worker thread so the event loop is not held up.
+    """
+    if blocking:
+        return await asyncio.to_thread(function, *args, **kwargs)
+    return function(*args, **kwargs)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import mimetypes
+from typing import TYPE_CHECKING, Callable, Optional
+
+from pythontextnow.api.MediaStream import MediaStream
+from pythontextnow.enum import MessageType
+from pythontextnow.util import general
+
+if TYPE_CHECKING:
+    from pythontextnow.api.AsyncTextNowAPI import AsyncTextNowAPI
+    from pythontextnow.api.TextNowAPI import TextNowAPI
+    from pythontextnow.store.MediaCache import MediaCache
+
+BANNED_MEDIA_TYPES = ("audio",)
+
+
+def get_media_info(file_path: str) -> tuple[str, str, bool, MessageType]:
+    """
+    Returns the (media_type, file_type, is_video, message_type) for the media at the given file_path.
+    """
+    media_type = mimetypes.guess_type(file_path)[0]
+    if media_type is None:
+        raise ValueError("Cannot get media type from media at 'file_path'.")
+    # media_type will be something like "video/mp4" or "image/png" or "image/gif"
+    file_type = media_type.split("/")[0]  # will be something like "video" or "image"
+    if file_type in BANNED_MEDIA_TYPES:
+        raise ValueError(f"'{file_type} is not an allowed media type.'")
+    is_video = file_type == "video"
+    message_type = MessageType.IMAGE if file_type == "image" else MessageType.VIDEO
+    return media_type, file_type, is_video, message_type
+
+
+def send(
+    text_now_api: TextNowAPI,
+    *,
+    file_path: str,
+    conversation_phone_number: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    media_cache: Optional[MediaCache] = None,
+    get_attachment_url: Optional[Callable[[MessageType], str]] = None,
+) -> None:
+    """
+    Uploads the media at the given file_path and sends it to the given conversation_phone_number.
+
+    If a media_cache is given and the same content has been uploaded before, that upload is sent instead.
+    Sends of the same content wait for a single upload rather than each uploading it.
+    If sending fails, the upload is removed from the media_cache, as its attachment URL may have expired.
+    If get_attachment_url is given, attachment URLs come from it rather than from text_now_api.
+    """
+    media_type, file_type, is_video, message_type = get_media_info(file_path)
+    # checks the size of the file before anything is uploaded
+    media_stream = MediaStream(file_path, on_progress=on_progress)
+
+    def upload() -> str:
+        attachment_url = (
+            get_attachment_url(message_type)
+            if get_attachment_url is not None
+            else text_now_api.get_attachment_url(message_type=message_type)
+        )
+        text_now_api.upload_raw_media(
+            attachment_url=attachment_url, raw_media=media_stream, media_type=media_type
+        )
+        return attachment_url
+
+    digest = None
+    if media_cache is None:
+        attachment_url = upload()
+    else:
+        digest = media_cache.get_digest(file_path)
+        with media_cache.lock_upload(digest):
+            attachment_url = media_cache.get(
+                username=text_now_api.username, digest=digest
+            )
+            if attachment_url is None:
+                attachment_url = upload()
+                media_cache.put(
+                    username=text_now_api.username,
+                    digest=digest,
+                    attachment_url=attachment_url,
+                )
+
+    try:
+        text_now_api.send_attachment(
+            conversation_phone_number=conversation_phone_number,
+            message_type=message_type,
+            file_type=file_type,
+            is_video=is_video,
+            attachment_url=attachment_url,
+        )
+    except Exception:
+        if digest is not None:
+            media_cache.invalidate(username=text_now_api.username, digest=digest)
+        raise
+
+
+async def send_async(
+    text_now_api: AsyncTextNowAPI,
+    *,
+    file_path: str,
+    conversation_phone_number: str,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    media_cache: Optional[MediaCache] = None,
+) -> None:
+    """
+    The asyncio version of send().
+    Uploads of the same content are not shared between concurrent sends, as that would block the event loop.
+    A SQLite-backed media_cache is read and written in a worker thread for the same reason.
+    """
+    media_type, file_type, is_video, message_type = get_media_info(file_path)
+    # checks the size of the file before anything is uploaded
+    media_stream = MediaStream(file_path, on_progress=on_progress)
+
+    digest = None
+    attachment_url = None
+    if media_cache is not None:
+        # hashing reads the file, so do it off the event loop
+        digest = await asyncio.to_thread(media_cache.get_digest, file_path)
+        attachment_url = await general.call_off_event_loop(
+            media_cache.get,
+            username=text_now_api.username,
+            digest=digest,
+            blocking=media_cache.is_persistent,
+        )
+
+    if attachment_url is None:
+        attachment_url = await text_now_api.get_attachment_url(
+            message_type=message_type
+        )
+        await text_now_api.upload_raw_media(
+            attachment_url=attachment_url, raw_media=media_stream, media_type=media_type
+        )
+        if digest is not None:
+            await general.call_off_event_loop(
+                media_cache.put,
+                username=text_now_api.username,
+                digest=digest,
+                attachment_url=attachment_url,
+                blocking=media_cache.is_persistent,
+            )
+
+    try:
+        await text_now_api.send_attachment(
+            conversation_phone_number=conversation_phone_number,
+            message_type=message_type,
+            file_type=file_type,
+            is_video=is_video,
+            attachment_url=attachment_url,
+        )
+    except Exception:
+        if digest is not None:
+            await general.call_off_event_loop(
+                media_cache.invalidate,
+                username=text_now_api.username,
+                digest=digest,
+                blocking=media_cache.is_persistent,
+            )
+        raise
@@ -0,0 +1,51 @@
+import functools
+from typing import Optional
+
+import phonenumbers
+
+# numbers without a country code are taken to be North American, as TextNow numbers are
+DEFAULT_REGION = "US"
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse(phone_number: str, region: Optional[str]) -> Optional[tuple[str, bool]]:
+    """
+    Returns the (E.164 form, whether it is a valid number) of the given phone number, or None if it cannot be parsed.
+    Parsing is slow compared to everything else done with a number, so results are cached (least recently used are dropped first).
+    """
+    try:
+        parsed_number = phonenumbers.parse(phone_number, region)
+    except phonenumbers.NumberParseException:
+        return None
+    return (
+        phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164),
+        phonenumbers.is_valid_number(parsed_number),
+    )
+
+
+def to_e164(phone_number: str) -> str:
+    """
+    Returns the given phone number in E.164 format.
+    A number without a country code is read as North American if that makes it a valid number.
+    Otherwise it is read as starting with its country code, so "447911123456" becomes "+447911123456".
+    A number that is not valid either way is only given a leading "+".
+    """
+    parsed = _parse(phone_number, DEFAULT_REGION)
+    if parsed is not None and parsed[1]:
+        return parsed[0]
+    with_plus = phone_number if phone_number.startswith("+") else f"+{phone_number}"
+    parsed = _parse(with_plus, None)
+    if parsed is not None and parsed[1]:
+        return parsed[0]
+    return with_plus
+
+
+def validate(phone_number: str) -> str:
+    """
+    Returns the given phone number in E.164 format.
+    Raises a ValueError if it is not a valid number, or is not given with its country code.
+    """
+    parsed = _parse(phone_number, None)
+    if parsed is None or not parsed[1]:
+        raise ValueError(f"'{phone_number}' is not a possible phone number.")
+    return parsed[0]
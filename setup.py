@@ -18,5 +18,6 @@ setuptools.setup(
     license="MIT",
     include_package_data=True,
     packages=setuptools.find_packages(exclude=("test", "docs")),
-    install_requires=["requests", "setuptools", "phonenumbers"],
+    install_requires=["requests", "setuptools", "phonenumbers", "random-user-agent"],
+    extras_require={"async": ["httpx"], "fast": ["orjson"], "export": ["pyarrow"]},
 )
@@ -1,11 +1,24 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterable, Optional
+from unittest import mock
+
+import httpx
 from requests import HTTPError
 
+from pythontextnow.api.BaseTextNowAPI import BaseTextNowAPI
+from pythontextnow.model.Message import Message
+
 
 class MockResponse:
     def __init__(self, data: dict | list | str, status_code: int, **kwargs):
         self.__data = data
         self.text = kwargs.pop("text", None)
-        self.content = kwargs.pop("content", None)
+        self.content = kwargs.pop(
+            "content",
+            json.dumps(data).encode() if isinstance(data, (dict, list)) else None,
+        )
+        self.headers = kwargs.pop("headers", dict())
         self.status_code = status_code
 
     def json(self) -> dict | list:
@@ -25,3 +38,73 @@ class MockResponse:
 
         if http_error_msg:
             raise HTTPError(http_error_msg, response=self)
+
+
+def get_message_dicts(ids: Iterable[int], *, read: bool = True) -> list[dict]:
+    """
+    Returns the dicts TextNow sends for text messages with the given ids, in the given order.
+    Each message is sent one minute after the one before it, so a higher id is more recent.
+    """
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": str(id_),
+            "contact_value": "contact_value",
+            "message_direction": 2,
+            "message_type": 1,
+            "message": f"message {id_}",
+            "read": read,
+            "date": (start + timedelta(minutes=id_)).isoformat(),
+            "conversation_filtering": {"first_time_contact": False},
+        }
+        for id_ in ids
+    ]
+
+
+def get_messages(ids: Iterable[int], *, read: bool = True) -> list[Message]:
+    """
+    Returns text messages with the given ids, parsed from get_message_dicts().
+    """
+    return BaseTextNowAPI._parse_messages(
+        {"messages": get_message_dicts(ids, read=read)}
+    )
+
+
+def mock_async_client(handler: Callable[[httpx.Request], httpx.Response]):
+    """
+    Patches httpx.AsyncClient so every async API call is handled by the given handler instead of being sent.
+    Only clients made while this is active are patched, so use it with a new ClientConfig.
+    """
+    async_client = httpx.AsyncClient
+    return mock.patch(
+        "httpx.AsyncClient",
+        side_effect=lambda **kwargs: async_client(
+            transport=httpx.MockTransport(handler), **kwargs
+        ),
+    )
+
+
+class FakeConversation:
+    """
+    A conversation on TextNow, with messages most recent first.
+    get_page() stands in for TextNowAPI.get_messages(), returning at most max_page_size messages if given.
+    """
+
+    def __init__(self, messages: list[Message], *, max_page_size: Optional[int] = None):
+        self.messages = messages
+        self.__max_page_size = max_page_size
+
+    def get_page(
+        self,
+        conversation_phone_number: str,
+        *,
+        start_message_id: Optional[str] = None,
+        get_archived: bool,
+        page_size: int,
+        keep_raw: bool = True,
+    ) -> list[Message]:
+        if self.__max_page_size is not None:
+            page_size = min(page_size, self.__max_page_size)
+        ids = [message.id_ for message in self.messages]
+        start = 0 if start_message_id is None else ids.index(start_message_id) + 1
+        return self.messages[start : start + page_size]
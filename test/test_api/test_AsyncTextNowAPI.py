@@ -0,0 +1,76 @@
+from unittest import IsolatedAsyncioTestCase, mock
+
+from pythontextnow.api.AsyncTextNowAPI import AsyncTextNowAPI
+from pythontextnow.api.Client import Client
+from pythontextnow.enum import MessageType
+from pythontextnow.model.TextMessage import TextMessage
+from test.helper.helper_classes import MockResponse
+
+
+class TestAsyncTextNowAPI(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    @mock.patch(
+        "pythontextnow.api.AsyncTransport.AsyncTransport.request",
+        new_callable=mock.AsyncMock,
+    )
+    async def test_send_message_happy_path(self, mock_transport_request):
+        mock_transport_request.return_value = MockResponse(dict(), 200)
+        text_now_api = AsyncTextNowAPI()
+        response = await text_now_api.send_message.__wrapped__(
+            text_now_api, message="hello world", send_to="5555555555"
+        )
+
+        self.assertIsNone(response)
+        self.assertEqual("POST", mock_transport_request.call_args.args[0])
+
+    @mock.patch(
+        "pythontextnow.api.AsyncTransport.AsyncTransport.request",
+        new_callable=mock.AsyncMock,
+    )
+    async def test_get_messages_happy_path(self, mock_transport_request):
+        mock_message_dict = {
+            "id": "id",
+            "username": "username",
+            "contact_value": "contact_value",
+            "message_direction": 2,
+            "message_type": 1,
+            "message": "hello world",
+            "read": True,
+            "date": "2000-01-01T01:01:00Z",
+            "conversation_filtering": {"first_time_contact": True},
+        }
+        mock_transport_request.return_value = MockResponse(
+            {"status": {}, "messages": [mock_message_dict]}, 200
+        )
+        text_now_api = AsyncTextNowAPI()
+        response = await text_now_api.get_messages.__wrapped__(
+            text_now_api,
+            conversation_phone_number="1111111111",
+            page_size=10,
+            get_archived=True,
+        )
+
+        self.assertEqual(1, len(response))
+        self.assertIsInstance(response[0], TextMessage)
+        self.assertEqual(MessageType.TEXT, response[0].message_type)
+        self.assertEqual("hello world", response[0].text)
+
+    @mock.patch(
+        "pythontextnow.api.AsyncTransport.AsyncTransport.request",
+        new_callable=mock.AsyncMock,
+    )
+    async def test_get_attachment_url_happy_path(self, mock_transport_request):
+        mock_transport_request.return_value = MockResponse(
+            {"result": "https://test"}, 200
+        )
+        text_now_api = AsyncTextNowAPI()
+        response = await text_now_api.get_attachment_url.__wrapped__(
+            text_now_api, message_type=MessageType.IMAGE
+        )
+
+        self.assertEqual("https://test", response)
@@ -0,0 +1,186 @@
+import asyncio
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import IsolatedAsyncioTestCase, TestCase, mock
+
+import httpx
+
+from pythontextnow.api.AsyncTextNowAPI import AsyncTextNowAPI
+from pythontextnow.api.AsyncTransport import AsyncTransport
+from pythontextnow.api.Client import Client
+from pythontextnow.api.MediaStream import MediaStream
+from pythontextnow.api.RetryPolicy import RetryPolicy
+from test.helper.helper_classes import mock_async_client
+
+
+class TestAsyncTransport(IsolatedAsyncioTestCase):
+    RETRY_POLICY = RetryPolicy(
+        max_retries=2, backoff_base_seconds=0.01, backoff_max_seconds=0.01
+    )
+
+    async def asyncSetUp(self):
+        self.requests = list()
+        self.async_transport = AsyncTransport(
+            pool_maxsize=1, retry_policy=self.RETRY_POLICY
+        )
+
+    async def asyncTearDown(self):
+        await self.async_transport.close()
+
+    async def test_request_retries_get_on_server_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(503 if len(self.requests) == 1 else 200, json={})
+
+        with mock_async_client(handler):
+            response = await self.async_transport.request("GET", "https://test")
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(self.requests))
+
+    async def test_request_does_not_retry_post_on_server_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(500, json={})
+
+        with mock_async_client(handler):
+            response = await self.async_transport.request(
+                "POST", "https://test", data={"a": 1}
+            )
+
+        self.assertEqual(500, response.status_code)
+        self.assertEqual(1, len(self.requests))
+
+    async def test_request_retries_post_when_connection_cannot_be_made(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if len(self.requests) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={})
+
+        with mock_async_client(handler):
+            response = await self.async_transport.request(
+                "POST", "https://test", data={"a": 1}
+            )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(self.requests))
+
+    async def test_request_sends_whole_streamed_body_on_retry(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(503 if len(self.requests) == 1 else 200)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "image.png")
+            with open(file_path, mode="wb") as media:
+                media.write(b"media" * 1000)
+            with mock_async_client(handler):
+                await self.async_transport.request(
+                    "PUT", "https://test", data=MediaStream(file_path)
+                )
+
+        self.assertEqual(2, len(self.requests))
+        for request in self.requests:
+            self.assertEqual(b"media" * 1000, request.content)
+
+
+class TestAsyncClientConfig(IsolatedAsyncioTestCase):
+    async def test_rate_limit_is_reserved_off_the_event_loop(self):
+        client_config = Client.create_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+        reserve = client_config.rate_limiter.reserve
+        reserving_threads = list()
+
+        def reserve_and_record(endpoint_class):
+            reserving_threads.append(threading.current_thread())
+            return reserve(endpoint_class)
+
+        with (
+            mock_async_client(lambda request: httpx.Response(200, json={})),
+            mock.patch.object(
+                client_config.rate_limiter, "reserve", side_effect=reserve_and_record
+            ),
+        ):
+            await AsyncTextNowAPI(client_config=client_config).send_message(
+                message="hello", send_to="+12015550123"
+            )
+        await client_config.async_transport.close()
+
+        self.assertEqual(1, len(reserving_threads))
+        self.assertIsNot(threading.current_thread(), reserving_threads[0])
+
+    async def test_replacing_client_config_closes_its_async_client(self):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+        async_transport = Client.get_client_config().async_transport
+        with mock_async_client(lambda request: httpx.Response(200, json={})):
+            await async_transport.request("GET", "https://test")
+        async_client = async_transport.client
+
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+        # the close is scheduled on the running event loop
+        await asyncio.sleep(0.01)
+
+        self.assertTrue(async_client.is_closed)
+
+
+class TestAsyncTransportCloseNowait(TestCase):
+    def test_close_nowait_runs_close_on_idle_event_loop(self):
+        async_transport = AsyncTransport(pool_maxsize=1)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        with mock_async_client(lambda request: httpx.Response(200, json={})):
+            loop.run_until_complete(async_transport.request("GET", "https://test"))
+        async_client = loop.run_until_complete(self.__get_client(async_transport))
+
+        async_transport.close_nowait()
+
+        self.assertTrue(async_client.is_closed)
+
+    def test_close_nowait_drops_client_of_closed_event_loop(self):
+        async_transport = AsyncTransport(pool_maxsize=1)
+        with mock_async_client(lambda request: httpx.Response(200, json={})):
+            asyncio.run(async_transport.request("GET", "https://test"))
+
+        # does not raise, even though the client's event loop is gone
+        async_transport.close_nowait()
+
+    def test_request_works_in_each_asyncio_run(self):
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, so the first client holds on to its connection
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        url = f"http://127.0.0.1:{server.server_port}/"
+        async_transport = AsyncTransport(pool_maxsize=1)
+
+        first_response = asyncio.run(async_transport.request("GET", url))
+        # the client made on the first (now closed) event loop is replaced
+        second_response = asyncio.run(async_transport.request("GET", url))
+        asyncio.run(async_transport.close())
+
+        self.assertEqual(200, first_response.status_code)
+        self.assertEqual(200, second_response.status_code)
+
+    @staticmethod
+    async def __get_client(async_transport: AsyncTransport) -> httpx.AsyncClient:
+        return async_transport.client
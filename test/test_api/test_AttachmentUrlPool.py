@@ -0,0 +1,93 @@
+import threading
+from unittest import TestCase, mock
+
+from pythontextnow.api.AttachmentUrlPool import AttachmentUrlPool
+from pythontextnow.enum import MessageType
+
+
+class TestAttachmentUrlPool(TestCase):
+    def setUp(self):
+        self.text_now_api = mock.Mock()
+        self.text_now_api.get_attachment_url.side_effect = [
+            f"url_{i}" for i in range(10)
+        ]
+
+    @staticmethod
+    def __wait_for_refill(attachment_url_pool: AttachmentUrlPool) -> None:
+        attachment_url_pool._AttachmentUrlPool__executor.submit(lambda: None).result()
+
+    def test_get_without_prefetch_fetches_one_url(self):
+        with AttachmentUrlPool(
+            self.text_now_api, pool_size=4, ttl_seconds=60
+        ) as attachment_url_pool:
+            self.assertEqual("url_0", attachment_url_pool.get(MessageType.IMAGE))
+
+        self.text_now_api.get_attachment_url.assert_called_once_with(
+            message_type=MessageType.IMAGE
+        )
+
+    def test_only_prefetched_urls_are_fetched(self):
+        with AttachmentUrlPool(
+            self.text_now_api, pool_size=4, ttl_seconds=60
+        ) as attachment_url_pool:
+            attachment_url_pool.prefetch(MessageType.VIDEO, count=2)
+            self.__wait_for_refill(attachment_url_pool)
+
+            self.assertEqual(
+                ["url_0", "url_1"],
+                [attachment_url_pool.get(MessageType.VIDEO) for _ in range(2)],
+            )
+        self.assertEqual(2, self.text_now_api.get_attachment_url.call_count)
+
+    def test_pool_size_caps_urls_fetched_ahead(self):
+        with AttachmentUrlPool(
+            self.text_now_api, pool_size=2, ttl_seconds=60
+        ) as attachment_url_pool:
+            attachment_url_pool.prefetch(MessageType.IMAGE, count=5)
+            self.__wait_for_refill(attachment_url_pool)
+
+            self.assertEqual(2, self.text_now_api.get_attachment_url.call_count)
+
+    def test_cancelled_prefetch_is_not_fetched(self):
+        release = threading.Event()
+        with AttachmentUrlPool(
+            self.text_now_api, pool_size=4, ttl_seconds=60
+        ) as attachment_url_pool:
+            # hold up the refill thread until the prefetch has been cancelled
+            attachment_url_pool._AttachmentUrlPool__executor.submit(release.wait)
+            attachment_url_pool.prefetch(MessageType.IMAGE)
+            attachment_url_pool.cancel(MessageType.IMAGE)
+            release.set()
+            self.__wait_for_refill(attachment_url_pool)
+
+        self.text_now_api.get_attachment_url.assert_not_called()
+
+    def test_expired_urls_are_not_handed_out(self):
+        with AttachmentUrlPool(
+            self.text_now_api, pool_size=1, ttl_seconds=0
+        ) as attachment_url_pool:
+            attachment_url_pool.prefetch(MessageType.IMAGE)
+            self.__wait_for_refill(attachment_url_pool)
+
+            self.assertEqual("url_1", attachment_url_pool.get(MessageType.IMAGE))
+
+    def test_close_stops_running_refill(self):
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def get_attachment_url(*, message_type: MessageType) -> str:
+            fetching.set()
+            release.wait()
+            return "url"
+
+        self.text_now_api.get_attachment_url.side_effect = get_attachment_url
+        attachment_url_pool = AttachmentUrlPool(
+            self.text_now_api, pool_size=5, ttl_seconds=60
+        )
+        attachment_url_pool.prefetch(MessageType.IMAGE, count=5)
+        fetching.wait()
+        attachment_url_pool.close(wait=False)
+        release.set()
+        attachment_url_pool._AttachmentUrlPool__executor.shutdown(wait=True)
+
+        self.text_now_api.get_attachment_url.assert_called_once()
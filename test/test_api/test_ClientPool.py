@@ -0,0 +1,40 @@
+import unittest
+
+from pythontextnow.api.Client import Client
+from pythontextnow.api.ClientPool import ClientPool
+
+
+class TestClientPool(unittest.TestCase):
+    def test_get_next_client_config_round_robins(self):
+        client_config_1 = Client.create_client_config(
+            username="username_1", sid_cookie="sid_cookie_1"
+        )
+        client_config_2 = Client.create_client_config(
+            username="username_2", sid_cookie="sid_cookie_2"
+        )
+        client_pool = ClientPool([client_config_1, client_config_2])
+
+        self.assertEqual(
+            ["username_1", "username_2", "username_1"],
+            [client_pool.get_next_client_config().username for _ in range(3)],
+        )
+
+    def test_remove(self):
+        client_pool = ClientPool(
+            [
+                Client.create_client_config(
+                    username="username_1", sid_cookie="sid_cookie_1"
+                ),
+                Client.create_client_config(
+                    username="username_2", sid_cookie="sid_cookie_2"
+                ),
+            ]
+        )
+        client_pool.remove(username="username_1")
+
+        self.assertEqual(1, len(client_pool))
+        self.assertEqual("username_2", client_pool.get_next_client_config().username)
+
+    def test_get_next_client_config_empty_pool_raises_error(self):
+        with self.assertRaises(ValueError):
+            ClientPool().get_next_client_config()
@@ -0,0 +1,42 @@
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+from pythontextnow.api.MediaStream import MediaStream
+
+
+class TestMediaStream(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.file_path = os.path.join(temp_dir.name, "media.png")
+        self.media = os.urandom(2500)
+        with open(self.file_path, mode="wb") as media:
+            media.write(self.media)
+
+    def test_iterates_in_chunks_with_progress(self):
+        progress = list()
+        media_stream = MediaStream(
+            self.file_path,
+            chunk_size=1000,
+            on_progress=lambda sent, total: progress.append((sent, total)),
+        )
+
+        self.assertEqual(2500, len(media_stream))
+        self.assertEqual([1000, 1000, 500], [len(chunk) for chunk in media_stream])
+        self.assertEqual([(1000, 2500), (2000, 2500), (2500, 2500)], progress)
+        # can be read again to retry an upload
+        self.assertEqual(self.media, b"".join(media_stream))
+
+    def test_async_iteration(self):
+        media_stream = MediaStream(self.file_path, chunk_size=1000)
+
+        async def read():
+            return b"".join([chunk async for chunk in media_stream])
+
+        self.assertEqual(self.media, asyncio.run(read()))
+
+    def test_file_over_max_size_raises_error(self):
+        with self.assertRaises(ValueError):
+            MediaStream(self.file_path, max_size=2499)
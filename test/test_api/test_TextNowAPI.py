@@ -31,10 +31,10 @@ class TestTextNowAPI(TestCase):
             username="dummy_username", sid_cookie="dummy_sid_cookie"
         )
 
-    @mock.patch("requests.post")
-    def test_send_message_happy_path(self, mock_requests_post):
+    @mock.patch("requests.Session.request")
+    def test_send_message_happy_path(self, mock_session_request):
         mock_response = MockResponse(dict(), 200)
-        mock_requests_post.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.send_message.__wrapped__(
             text_now_api, message="hello world", send_to="5555555555"
@@ -42,8 +42,8 @@ class TestTextNowAPI(TestCase):
 
         self.assertIsNone(response)
 
-    @mock.patch("requests.get")
-    def test_get_messages_text_message_happy_path(self, mock_requests_get):
+    @mock.patch("requests.Session.request")
+    def test_get_messages_text_message_happy_path(self, mock_session_request):
         mock_message_dict = {
             "id": "id",
             "username": "username",
@@ -57,7 +57,7 @@ class TestTextNowAPI(TestCase):
         }
         mock_response_dict = {"status": {}, "messages": [mock_message_dict]}
         mock_response = MockResponse(mock_response_dict, 200)
-        mock_requests_get.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.get_messages.__wrapped__(
             text_now_api,
@@ -83,8 +83,8 @@ class TestTextNowAPI(TestCase):
         self.assertEqual(mock_message_dict, message.raw)
         self.assertEqual("hello world", message.text)
 
-    @mock.patch("requests.get")
-    def test_get_messages_multi_media_message_happy_path(self, mock_requests_get):
+    @mock.patch("requests.Session.request")
+    def test_get_messages_multi_media_message_happy_path(self, mock_session_request):
         mock_message_dict = {
             "id": "id",
             "username": "username",
@@ -98,7 +98,7 @@ class TestTextNowAPI(TestCase):
         }
         mock_response_dict = {"status": {}, "messages": [mock_message_dict]}
         mock_response = MockResponse(mock_response_dict, 200)
-        mock_requests_get.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.get_messages.__wrapped__(
             text_now_api,
@@ -124,10 +124,10 @@ class TestTextNowAPI(TestCase):
         self.assertEqual(mock_message_dict, message.raw)
         self.assertEqual("https://test", message.media)
 
-    @mock.patch("requests.patch")
-    def test_mark_message_as_read_happy_path(self, mock_requests_patch):
+    @mock.patch("requests.Session.request")
+    def test_mark_message_as_read_happy_path(self, mock_session_request):
         mock_response = MockResponse(dict(), 200)
-        mock_requests_patch.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         dummy_message = TextMessage(
             text=None,
@@ -146,10 +146,10 @@ class TestTextNowAPI(TestCase):
 
         self.assertIsNone(response)
 
-    @mock.patch("requests.delete")
-    def test_delete_message_happy_path(self, mock_requests_delete):
+    @mock.patch("requests.Session.request")
+    def test_delete_message_happy_path(self, mock_session_request):
         mock_response = MockResponse(dict(), 200)
-        mock_requests_delete.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.delete_message.__wrapped__(
             text_now_api, message_id="12345"
@@ -157,11 +157,11 @@ class TestTextNowAPI(TestCase):
 
         self.assertIsNone(response)
 
-    @mock.patch("requests.get")
-    def test_get_attachment_url_happy_path(self, mock_requests_get):
+    @mock.patch("requests.Session.request")
+    def test_get_attachment_url_happy_path(self, mock_session_request):
         mock_response_dict = {"result": "https://test"}
         mock_response = MockResponse(mock_response_dict, 200)
-        mock_requests_get.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.get_attachment_url.__wrapped__(
             text_now_api, message_type=MessageType.IMAGE
@@ -170,13 +170,12 @@ class TestTextNowAPI(TestCase):
         self.assertIsInstance(response, str)
         self.assertEqual("https://test", response)
 
-    @mock.patch("requests.put")
-    def test_upload_raw_media_happy_path(self, mock_requests_put):
+    @mock.patch("requests.Session.request")
+    def test_upload_raw_media_happy_path(self, mock_session_request):
         mock_response = MockResponse(dict(), 200)
-        mock_requests_put.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
-        response = text_now_api.upload_raw_media.__wrapped__(
-            text_now_api,
+        response = text_now_api.upload_raw_media(
             attachment_url="https://test",
             raw_media=bytes("some_image_bytes", "utf-8"),
             media_type="image/png",
@@ -184,10 +183,10 @@ class TestTextNowAPI(TestCase):
 
         self.assertIsNone(response)
 
-    @mock.patch("requests.post")
-    def test_send_attachment_happy_path(self, mock_requests_post):
+    @mock.patch("requests.Session.request")
+    def test_send_attachment_happy_path(self, mock_session_request):
         mock_response = MockResponse(dict(), 200)
-        mock_requests_post.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.send_attachment.__wrapped__(
             text_now_api,
@@ -200,8 +199,8 @@ class TestTextNowAPI(TestCase):
 
         self.assertIsNone(response)
 
-    @mock.patch("requests.get")
-    def test_get_groups_happy_path(self, mock_requests_get):
+    @mock.patch("requests.Session.request")
+    def test_get_groups_happy_path(self, mock_session_request):
         dummy_group = {
             "title": "group",
             "avatar": {
@@ -227,7 +226,7 @@ class TestTextNowAPI(TestCase):
             "e164_contact_value": "+1111111111",
         }
         mock_response = MockResponse([dummy_group], 200)
-        mock_requests_get.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.get_groups.__wrapped__(text_now_api)
 
@@ -250,8 +249,8 @@ class TestTextNowAPI(TestCase):
         self.assertEqual("1111111111", response[0].contact_value)
         self.assertEqual("+1111111111", response[0].e164_contact_value)
 
-    @mock.patch("requests.get")
-    def test_get_user_happy_path(self, mock_requests_get):
+    @mock.patch("requests.Session.request")
+    def test_get_user_happy_path(self, mock_session_request):
         dummy_user = {
             "user_id": 123,
             "username": "user",
@@ -259,7 +258,7 @@ class TestTextNowAPI(TestCase):
             "phone_number": "1111111111",
         }
         mock_response = MockResponse(dummy_user, 200)
-        mock_requests_get.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.get_user.__wrapped__(text_now_api)
 
@@ -269,8 +268,8 @@ class TestTextNowAPI(TestCase):
         self.assertEqual("123@email.com", response.email)
         self.assertEqual("1111111111", response.phone_number)
 
-    @mock.patch("requests.post")
-    def test_create_group_happy_path(self, mock_requests_post):
+    @mock.patch("requests.Session.request")
+    def test_create_group_happy_path(self, mock_session_request):
         dummy_group = {
             "title": "group",
             "avatar": {
@@ -296,7 +295,7 @@ class TestTextNowAPI(TestCase):
             "e164_contact_value": "+1111111111",
         }
         mock_response = MockResponse(dummy_group, 200)
-        mock_requests_post.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.create_group.__wrapped__(
             text_now_api, phone_numbers=["1111111111"]
@@ -320,13 +319,20 @@ class TestTextNowAPI(TestCase):
         self.assertEqual("1111111111", response.contact_value)
         self.assertEqual("+1111111111", response.e164_contact_value)
 
-    @mock.patch("requests.delete")
-    def test_delete_conversation_happy_path(self, mock_requests_delete):
+    @mock.patch("requests.Session.request")
+    def test_delete_conversation_happy_path(self, mock_session_request):
         mock_response = MockResponse(dict(), 200)
-        mock_requests_delete.return_value = mock_response
+        mock_session_request.return_value = mock_response
         text_now_api = TextNowAPI()
         response = text_now_api.delete_conversation.__wrapped__(
             text_now_api, conversation_phone_number="+1111111111"
         )
 
         self.assertIsNone(response)
+
+    def test_build_delete_conversation_keeps_international_country_code(self):
+        _, url, _ = TextNowAPI()._build_delete_conversation(
+            conversation_phone_number="447911123456"
+        )
+
+        self.assertTrue(url.endswith("/conversations/%2B447911123456"))
@@ -0,0 +1,110 @@
+from unittest import TestCase, mock
+
+import requests
+
+from pythontextnow.api.RetryPolicy import RetryPolicy
+from pythontextnow.api.Transport import Transport
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit import RateLimit, RateLimiter
+from test.helper.helper_classes import MockResponse
+
+
+class TestTransport(TestCase):
+    RETRY_POLICY = RetryPolicy(
+        max_retries=2, backoff_base_seconds=0.1, backoff_max_seconds=1
+    )
+
+    def test_adapter_uses_given_pool_sizes(self):
+        transport = Transport(pool_connections=3, pool_maxsize=7, pool_block=True)
+        adapter = transport.session.get_adapter("https://www.textnow.com")
+
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    @mock.patch("requests.Session.request")
+    def test_request_reuses_session(self, mock_session_request):
+        mock_session_request.return_value = MockResponse(dict(), 200)
+        transport = Transport(pool_connections=1, pool_maxsize=1)
+        transport.request("GET", "https://test")
+        transport.request("POST", "https://test", data={"a": 1})
+
+        self.assertEqual(2, mock_session_request.call_count)
+        mock_session_request.assert_called_with("POST", "https://test", data={"a": 1})
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_request_retries_throttled_call_and_slows_rate_limiter(
+        self, mock_session_request, mock_sleep
+    ):
+        mock_session_request.side_effect = [
+            MockResponse(dict(), 429, headers={"Retry-After": "7"}),
+            MockResponse(dict(), 200),
+        ]
+        rate_limiter = RateLimiter(
+            rate_limits={EndpointClass.SEND: RateLimit(rate_per_second=4, burst=4)}
+        )
+        transport = Transport(
+            pool_connections=1,
+            pool_maxsize=1,
+            retry_policy=self.RETRY_POLICY,
+            rate_limiter=rate_limiter,
+        )
+        response = transport.request(
+            "POST", "https://test", endpoint_class=EndpointClass.SEND
+        )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, mock_session_request.call_count)
+        # Retry-After is honoured
+        self.assertEqual(7, mock_sleep.call_args_list[0].args[0])
+        self.assertLess(
+            rate_limiter.get_rate_limit(EndpointClass.SEND).rate_per_second, 4
+        )
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_request_does_not_retry_post_on_server_error(
+        self, mock_session_request, mock_sleep
+    ):
+        mock_session_request.return_value = MockResponse(dict(), 500)
+        transport = Transport(
+            pool_connections=1, pool_maxsize=1, retry_policy=self.RETRY_POLICY
+        )
+        response = transport.request("POST", "https://test")
+
+        self.assertEqual(500, response.status_code)
+        self.assertEqual(1, mock_session_request.call_count)
+        mock_sleep.assert_not_called()
+
+    @mock.patch("time.sleep")
+    @mock.patch("requests.Session.request")
+    def test_request_retries_get_until_max_retries(
+        self, mock_session_request, mock_sleep
+    ):
+        mock_session_request.side_effect = requests.ConnectionError("reset")
+        transport = Transport(
+            pool_connections=1, pool_maxsize=1, retry_policy=self.RETRY_POLICY
+        )
+
+        with self.assertRaises(requests.ConnectionError):
+            transport.request("GET", "https://test")
+        self.assertEqual(3, mock_session_request.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
+
+
+class TestRetryPolicy(TestCase):
+    def test_parse_retry_after(self):
+        self.assertEqual(5, RetryPolicy.parse_retry_after("5"))
+        self.assertEqual(
+            0, RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT")
+        )
+        self.assertIsNone(RetryPolicy.parse_retry_after("not a date"))
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
+
+    def test_get_delay_seconds_is_capped(self):
+        retry_policy = RetryPolicy(
+            max_retries=10, backoff_base_seconds=1, backoff_max_seconds=3
+        )
+        for attempt in range(10):
+            self.assertLessEqual(retry_policy.get_delay_seconds(attempt=attempt), 3)
@@ -0,0 +1,85 @@
+import csv
+import importlib.util
+import os
+import tempfile
+from datetime import datetime, timezone
+from unittest import TestCase, skipUnless
+
+from pythontextnow.api.BaseTextNowAPI import BaseTextNowAPI
+from pythontextnow.enum import ExportFormat
+from pythontextnow.export import MessageExporter
+from test.helper.helper_classes import get_message_dicts
+
+
+class TestMessageExporter(TestCase):
+    def setUp(self):
+        message_dicts = get_message_dicts([3, 2, 1])
+        # make the last message a media message
+        message_dicts[2] = {
+            **message_dicts[2],
+            "message_type": 2,
+            "message": "https://media/1.png",
+        }
+        messages = BaseTextNowAPI._parse_messages({"messages": message_dicts})
+        # two chunks, to check every chunk is written
+        self.chunks = [
+            MessageExporter.to_columns(messages[:2]),
+            MessageExporter.to_columns(messages[2:]),
+        ]
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = temp_dir.name
+
+    def test_write_csv(self):
+        file_path = os.path.join(self.directory, "messages.csv")
+        rows_written = MessageExporter.write(
+            self.chunks, file_path=file_path, export_format=ExportFormat.CSV
+        )
+        with open(file_path, newline="", encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+
+        self.assertEqual(3, rows_written)
+        self.assertEqual(list(MessageExporter.COLUMNS), rows[0])
+        self.assertEqual(
+            [
+                "3",
+                "contact_value",
+                "2000-01-01T00:03:00+00:00",
+                "TEXT",
+                "INCOMING",
+                "True",
+                "False",
+                "message 3",
+            ],
+            rows[1],
+        )
+        self.assertEqual(["3", "2", "1"], [row[0] for row in rows[1:]])
+        self.assertEqual(["IMAGE", "https://media/1.png"], [rows[3][3], rows[3][7]])
+
+    @skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_write_parquet(self):
+        import pyarrow.parquet as pq
+
+        file_path = os.path.join(self.directory, "messages.parquet")
+        rows_written = MessageExporter.write(
+            self.chunks, file_path=file_path, export_format=ExportFormat.PARQUET
+        )
+        rows = pq.read_table(file_path).to_pylist()
+
+        self.assertEqual(3, rows_written)
+        self.assertEqual(list(MessageExporter.COLUMNS), list(rows[0]))
+        self.assertEqual(
+            {
+                "id": "3",
+                "number": "contact_value",
+                "datetime": datetime(2000, 1, 1, 0, 3, tzinfo=timezone.utc),
+                "message_type": "TEXT",
+                "message_direction": "INCOMING",
+                "read": True,
+                "first_contact": False,
+                "body": "message 3",
+            },
+            rows[0],
+        )
+        self.assertEqual(["3", "2", "1"], [row["id"] for row in rows])
+        self.assertEqual("https://media/1.png", rows[2]["body"])
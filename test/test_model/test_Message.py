@@ -0,0 +1,55 @@
+import datetime
+from unittest import TestCase
+
+from pythontextnow.enum import MessageDirection, MessageType
+from pythontextnow.model.MultiMediaMessage import MultiMediaMessage
+from pythontextnow.model.TextMessage import TextMessage
+
+
+class TestMessage(TestCase):
+    MESSAGE_DICT = {
+        "id": "id",
+        "username": "username",
+        "contact_value": "contact_value",
+        "message_direction": 2,
+        "message_type": 1,
+        "message": "hello world",
+        "read": True,
+        "date": "2000-01-01T01:01:00Z",
+        "conversation_filtering": {"first_time_contact": True},
+    }
+
+    def test_from_dict_without_raw(self):
+        message = TextMessage.from_dict(self.MESSAGE_DICT, keep_raw=False)
+
+        self.assertIsNone(message.raw)
+        self.assertFalse(hasattr(message, "__dict__"))
+        self.assertEqual(
+            datetime.datetime(2000, 1, 1, 1, 1, tzinfo=datetime.timezone.utc),
+            message.datetime_,
+        )
+        self.assertEqual(MessageType.TEXT, message.message_type)
+        self.assertEqual(MessageDirection.INCOMING, message.message_direction)
+        self.assertEqual("hello world", message.text)
+
+    def test_to_dict_rebuilds_dict_without_raw(self):
+        message = TextMessage.from_dict(self.MESSAGE_DICT, keep_raw=False)
+        rebuilt_message = TextMessage.from_dict(message.to_dict())
+
+        self.assertEqual(
+            TextMessage.from_dict(self.MESSAGE_DICT, keep_raw=False),
+            TextMessage.from_dict(rebuilt_message.to_dict(), keep_raw=False),
+        )
+        self.assertIs(
+            self.MESSAGE_DICT, TextMessage.from_dict(self.MESSAGE_DICT).to_dict()
+        )
+
+    def test_equality(self):
+        self.assertEqual(
+            TextMessage.from_dict(self.MESSAGE_DICT),
+            TextMessage.from_dict(self.MESSAGE_DICT),
+        )
+        self.assertNotEqual(
+            TextMessage.from_dict(self.MESSAGE_DICT),
+            MultiMediaMessage.from_dict(self.MESSAGE_DICT),
+        )
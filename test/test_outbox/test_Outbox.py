@@ -0,0 +1,204 @@
+import os
+import tempfile
+import threading
+import time
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.enum import DeliveryStatus
+from pythontextnow.outbox import Outbox, OutboxStore
+from pythontextnow.service.ConversationService import ConversationService
+
+
+class TestOutbox(TestCase):
+    PHONE_NUMBER = "+12015550123"
+
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.database_path = os.path.join(temp_dir.name, "outbox.db")
+
+    def __wait_for_status(self, outbox: Outbox, id_: int, status: DeliveryStatus):
+        deadline = time.monotonic() + 5
+        while outbox.get_status(id_) != status and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(status, outbox.get_status(id_))
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_queued_message_is_sent_by_worker(self, mock_send_message):
+        outbox = Outbox(database_path=self.database_path, poll_interval_seconds=0.01)
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER], outbox=outbox
+        )
+        id_ = conversation_service.send_message(message="hello world")
+
+        self.assertEqual(DeliveryStatus.PENDING, outbox.get_status(id_))
+        mock_send_message.assert_not_called()
+
+        with outbox:
+            self.__wait_for_status(outbox, id_, DeliveryStatus.SENT)
+        mock_send_message.assert_called_once_with(
+            message="hello world", send_to=self.PHONE_NUMBER
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_send_messages_queues_every_message(self, mock_send_message):
+        outbox = Outbox(database_path=self.database_path, poll_interval_seconds=0.01)
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER], outbox=outbox
+        )
+        ids = conversation_service.send_messages(messages=["hello", "world"])
+
+        self.assertEqual(
+            ["hello", "world"], [outbox.get_entry(id_).message for id_ in ids]
+        )
+        mock_send_message.assert_not_called()
+
+        with outbox:
+            for id_ in ids:
+                self.__wait_for_status(outbox, id_, DeliveryStatus.SENT)
+        self.assertEqual(2, mock_send_message.call_count)
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_failed_message_is_retried_then_marked_failed(self, mock_send_message):
+        mock_send_message.side_effect = ValueError("failed")
+        outbox = Outbox(
+            database_path=self.database_path,
+            poll_interval_seconds=0.01,
+            max_attempts=2,
+            retry_delay_seconds=0,
+        )
+        id_ = outbox.enqueue_message(
+            conversation_phone_numbers=[self.PHONE_NUMBER], message="hello world"
+        )
+
+        with outbox:
+            self.__wait_for_status(outbox, id_, DeliveryStatus.FAILED)
+        entry = outbox.get_entry(id_)
+        self.assertEqual(2, entry.attempts)
+        self.assertIn("failed", entry.last_error)
+        self.assertEqual(2, mock_send_message.call_count)
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_restart_without_waiting_does_not_add_workers(self, mock_send_message):
+        first_send_started = threading.Event()
+        release_first_send = threading.Event()
+        sending_threads = list()
+
+        def send_message(**kwargs):
+            sending_threads.append(threading.current_thread())
+            if len(sending_threads) == 1:
+                first_send_started.set()
+                release_first_send.wait(5)
+            else:
+                time.sleep(0.02)
+
+        mock_send_message.side_effect = send_message
+        outbox = Outbox(
+            database_path=self.database_path, worker_count=1, poll_interval_seconds=0.01
+        )
+        ids = [
+            outbox.enqueue_message(
+                conversation_phone_numbers=[self.PHONE_NUMBER], message=f"hello {i}"
+            )
+            for i in range(5)
+        ]
+
+        outbox.start()
+        self.assertTrue(first_send_started.wait(5))
+        old_worker = sending_threads[0]
+        outbox.stop(wait=False)
+        outbox.start()
+        release_first_send.set()
+        for id_ in ids:
+            self.__wait_for_status(outbox, id_, DeliveryStatus.SENT)
+        outbox.stop()
+        old_worker.join(5)
+
+        # the stopped worker finished the entry it was sending, and claimed no more
+        self.assertEqual(1, sending_threads.count(old_worker))
+        self.assertEqual(5, len(sending_threads))
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_slow_conversation_lookup_does_not_hold_up_other_workers(
+        self, mock_send_message
+    ):
+        other_phone_number = "+12015550124"
+        release_lookup = threading.Event()
+
+        def build_conversation_service(*, conversation_phone_numbers, client_config):
+            if conversation_phone_numbers == [self.PHONE_NUMBER]:
+                # like looking up a group number
+                release_lookup.wait(5)
+            return ConversationService(
+                conversation_phone_numbers=conversation_phone_numbers,
+                client_config=client_config,
+            )
+
+        outbox = Outbox(
+            database_path=self.database_path, worker_count=2, poll_interval_seconds=0.01
+        )
+        slow_id = outbox.enqueue_message(
+            conversation_phone_numbers=[self.PHONE_NUMBER], message="hello"
+        )
+        fast_id = outbox.enqueue_message(
+            conversation_phone_numbers=[other_phone_number], message="hello"
+        )
+
+        with mock.patch(
+            "pythontextnow.outbox.Outbox.ConversationService",
+            side_effect=build_conversation_service,
+        ):
+            with outbox:
+                self.__wait_for_status(outbox, fast_id, DeliveryStatus.SENT)
+                self.assertEqual(DeliveryStatus.SENDING, outbox.get_status(slow_id))
+                release_lookup.set()
+                self.__wait_for_status(outbox, slow_id, DeliveryStatus.SENT)
+
+
+class TestOutboxStore(TestCase):
+    def test_entry_with_expired_lease_is_claimed_again(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outbox_store = OutboxStore(
+                database_path=os.path.join(temp_dir, "outbox.db")
+            )
+            id_ = outbox_store.add(
+                conversation_phone_numbers=["+12015550123"], message="hello"
+            )
+
+            first_claim = outbox_store.claim(lease_seconds=0)
+            # the worker that claimed it "died", so its lease runs out
+            second_claim = outbox_store.claim(lease_seconds=60)
+
+            self.assertEqual(id_, first_claim.id_)
+            self.assertEqual(id_, second_claim.id_)
+            self.assertEqual(2, second_claim.attempts)
+            self.assertEqual(DeliveryStatus.SENDING, second_claim.status)
+            self.assertIsNone(outbox_store.claim(lease_seconds=60))
+
+    def test_entry_with_expired_lease_is_failed_after_max_attempts(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            outbox_store = OutboxStore(
+                database_path=os.path.join(temp_dir, "outbox.db")
+            )
+            id_ = outbox_store.add(
+                conversation_phone_numbers=["+12015550123"], message="hello"
+            )
+
+            outbox_store.claim(lease_seconds=0, max_attempts=2)
+            outbox_store.claim(lease_seconds=0, max_attempts=2)
+            # both workers "died", and the entry has been tried max_attempts times
+            third_claim = outbox_store.claim(lease_seconds=60, max_attempts=2)
+            entry = outbox_store.get(id_)
+            outbox_store.close()
+
+            self.assertIsNone(third_claim)
+            self.assertEqual(DeliveryStatus.FAILED, entry.status)
+            self.assertEqual(2, entry.attempts)
+            self.assertIn("Lease ran out", entry.last_error)
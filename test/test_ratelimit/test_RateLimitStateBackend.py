@@ -0,0 +1,59 @@
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase, mock
+
+from pythontextnow.ratelimit import (
+    InMemoryRateLimitStateBackend,
+    RateLimit,
+    SQLiteRateLimitStateBackend,
+)
+
+
+class TestInMemoryRateLimitStateBackend(TestCase):
+    @mock.patch("time.monotonic")
+    def test_reserve_from_many_threads_gives_each_caller_its_own_slot(
+        self, mock_monotonic
+    ):
+        mock_monotonic.return_value = 100.0
+        backend = InMemoryRateLimitStateBackend()
+        rate_limit = RateLimit(rate_per_second=10, burst=1)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            wait_seconds = list(
+                executor.map(lambda _: backend.reserve("key", rate_limit), range(50))
+            )
+
+        self.assertEqual(
+            [round(i * 0.1, 6) for i in range(50)],
+            sorted(round(w, 6) for w in wait_seconds),
+        )
+
+    @mock.patch("time.monotonic")
+    def test_reserve_keeps_keys_separate(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        backend = InMemoryRateLimitStateBackend()
+        rate_limit = RateLimit(rate_per_second=1, burst=1)
+
+        self.assertEqual(0, backend.reserve("a", rate_limit))
+        self.assertEqual(0, backend.reserve("b", rate_limit))
+        self.assertAlmostEqual(1.0, backend.reserve("a", rate_limit))
+
+
+class TestSQLiteRateLimitStateBackend(TestCase):
+    @mock.patch("time.time")
+    def test_backends_with_same_database_share_buckets(self, mock_time):
+        mock_time.return_value = 1000.0
+        rate_limit = RateLimit(rate_per_second=2, burst=2)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "rate_limit.db")
+            backend_1 = SQLiteRateLimitStateBackend(database_path=database_path)
+            backend_2 = SQLiteRateLimitStateBackend(database_path=database_path)
+
+            self.assertEqual(0, backend_1.reserve("key", rate_limit))
+            self.assertEqual(0, backend_2.reserve("key", rate_limit))
+            self.assertAlmostEqual(0.5, backend_1.reserve("key", rate_limit))
+            self.assertAlmostEqual(1.0, backend_2.reserve("key", rate_limit))
+
+            mock_time.return_value = 1010.0
+            self.assertEqual(0, backend_1.reserve("key", rate_limit))
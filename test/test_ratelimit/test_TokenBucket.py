@@ -0,0 +1,77 @@
+from unittest import TestCase, mock
+
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit import RateLimit, RateLimiter, TokenBucket
+
+
+class TestTokenBucket(TestCase):
+    @mock.patch("time.monotonic")
+    def test_reserve_allows_burst_then_spaces_calls(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        token_bucket = TokenBucket(RateLimit(rate_per_second=2, burst=3))
+
+        self.assertEqual(0, token_bucket.reserve())
+        self.assertEqual(0, token_bucket.reserve())
+        self.assertEqual(0, token_bucket.reserve())
+        # bucket is empty, each following call waits for its own token
+        self.assertAlmostEqual(0.5, token_bucket.reserve())
+        self.assertAlmostEqual(1.0, token_bucket.reserve())
+
+    @mock.patch("time.monotonic")
+    def test_reserve_only_waits_remaining_time(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        token_bucket = TokenBucket(RateLimit(rate_per_second=1, burst=1))
+
+        self.assertEqual(0, token_bucket.reserve())
+        mock_monotonic.return_value = 100.75
+        self.assertAlmostEqual(0.25, token_bucket.reserve())
+
+    @mock.patch("time.monotonic")
+    def test_reserve_refills_up_to_burst(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        token_bucket = TokenBucket(RateLimit(rate_per_second=1, burst=2))
+
+        token_bucket.reserve()
+        token_bucket.reserve()
+        mock_monotonic.return_value = 200.0
+        self.assertEqual(0, token_bucket.reserve())
+        self.assertEqual(0, token_bucket.reserve())
+        self.assertAlmostEqual(1.0, token_bucket.reserve())
+
+    def test_rate_limit_validates_values(self):
+        with self.assertRaises(ValueError):
+            RateLimit(rate_per_second=0, burst=1)
+        with self.assertRaises(ValueError):
+            RateLimit(rate_per_second=1, burst=0)
+
+
+class TestRateLimiter(TestCase):
+    def test_given_rate_limits_override_defaults(self):
+        send_rate_limit = RateLimit(rate_per_second=10, burst=20)
+        rate_limiter = RateLimiter(rate_limits={EndpointClass.SEND: send_rate_limit})
+
+        self.assertEqual(
+            send_rate_limit, rate_limiter.get_rate_limit(EndpointClass.SEND)
+        )
+        self.assertEqual(
+            RateLimiter.get_default_rate_limit(EndpointClass.READ),
+            rate_limiter.get_rate_limit(EndpointClass.READ),
+        )
+
+    def test_rate_adapts_to_throttling(self):
+        rate_limiter = RateLimiter(
+            rate_limits={EndpointClass.READ: RateLimit(rate_per_second=4, burst=4)}
+        )
+
+        rate_limiter.on_throttled(EndpointClass.READ)
+        self.assertEqual(
+            RateLimit(rate_per_second=2, burst=2),
+            rate_limiter.get_rate_limit(EndpointClass.READ),
+        )
+
+        for _ in range(100):
+            rate_limiter.on_success(EndpointClass.READ)
+        self.assertEqual(
+            RateLimit(rate_per_second=4, burst=4),
+            rate_limiter.get_rate_limit(EndpointClass.READ),
+        )
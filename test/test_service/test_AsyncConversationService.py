@@ -0,0 +1,221 @@
+import asyncio
+import os
+import tempfile
+import threading
+from unittest import IsolatedAsyncioTestCase, mock
+from urllib import parse
+
+import httpx
+
+from pythontextnow.api.Client import Client
+from pythontextnow.api.RetryPolicy import RetryPolicy
+from pythontextnow.enum import EndpointClass
+from pythontextnow.ratelimit import RateLimit
+from pythontextnow.service.AsyncConversationService import AsyncConversationService
+from pythontextnow.store import GroupIndex, MediaCache
+from test.helper.helper_classes import get_message_dicts, mock_async_client
+
+
+class TestAsyncConversationService(IsolatedAsyncioTestCase):
+    PHONE_NUMBER = "+12015550123"
+    ATTACHMENT_URL = "https://upload.test/attachment"
+
+    async def asyncSetUp(self):
+        # the conversation on TextNow, most recent first
+        self.conversation = get_message_dicts(range(70, 0, -1))
+        self.requests: list[httpx.Request] = list()
+        self.failing_message_ids: set[str] = set()
+        self.client_config = Client.create_client_config(
+            username="dummy_username",
+            sid_cookie="dummy_sid_cookie",
+            rate_limits={
+                endpoint_class: RateLimit(rate_per_second=1000, burst=100)
+                for endpoint_class in EndpointClass
+            },
+            retry_policy=RetryPolicy(
+                max_retries=2, backoff_base_seconds=0.01, backoff_max_seconds=0.01
+            ),
+        )
+        patcher = mock_async_client(self.__handle)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.conversation_service = AsyncConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER],
+            client_config=self.client_config,
+        )
+
+    async def asyncTearDown(self):
+        await self.client_config.async_transport.close()
+
+    def __handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Stands in for TextNow.
+        The first call for a page of messages fails with a 503, to check it is retried.
+        """
+        self.requests.append(request)
+        path = request.url.path
+        if request.method == "GET" and path.endswith("/messages"):
+            if len(self.requests) == 1:
+                return httpx.Response(503)
+            params = dict(request.url.params)
+            ids = [message_dict["id"] for message_dict in self.conversation]
+            start = (
+                ids.index(params["start_message_id"]) + 1
+                if "start_message_id" in params
+                else 0
+            )
+            page_size = int(params["page_size"])
+            return httpx.Response(
+                200,
+                json={
+                    "status": {},
+                    "messages": self.conversation[start : start + page_size],
+                },
+            )
+        if request.method == "POST" and path.endswith("/messages"):
+            return httpx.Response(200, json={})
+        if request.method == "DELETE":
+            message_id = path.rsplit("/", 1)[1]
+            return httpx.Response(
+                400 if message_id in self.failing_message_ids else 200
+            )
+        if request.method == "GET" and path.endswith("/attachment_url"):
+            return httpx.Response(200, json={"result": self.ATTACHMENT_URL})
+        if request.method == "PUT" and str(request.url) == self.ATTACHMENT_URL:
+            return httpx.Response(200)
+        if request.method == "POST" and path.endswith("/send_attachment"):
+            return httpx.Response(200, json={})
+        return httpx.Response(404)
+
+    async def test_get_messages_pages_through_conversation(self):
+        pages = [page async for page in self.conversation_service.get_messages()]
+
+        self.assertEqual([30, 30, 10], [len(page) for page in pages])
+        self.assertEqual(
+            [str(id_) for id_ in range(70, 0, -1)],
+            [message.id_ for page in pages for message in page],
+        )
+        # one retried call, three pages and one empty page
+        self.assertEqual(5, len(self.requests))
+
+    async def test_sqlite_group_index_is_used_off_the_event_loop(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            group_index = GroupIndex(database_path=os.path.join(temp_dir, "groups.db"))
+            phone_numbers = [self.PHONE_NUMBER, "+12015550124"]
+            group_index.put(
+                username="dummy_username",
+                phone_numbers=phone_numbers,
+                group_number="+12015550001",
+            )
+            get = group_index.get
+            calling_threads = list()
+
+            def get_and_record(**kwargs):
+                calling_threads.append(threading.current_thread())
+                return get(**kwargs)
+
+            conversation_service = AsyncConversationService(
+                conversation_phone_numbers=phone_numbers,
+                client_config=self.client_config,
+                group_index=group_index,
+            )
+            with mock.patch.object(group_index, "get", side_effect=get_and_record):
+                await conversation_service.send_message(message="hello")
+            group_index.close()
+
+        self.assertEqual(1, len(calling_threads))
+        self.assertIsNot(threading.current_thread(), calling_threads[0])
+        self.assertIn(
+            "+12015550001", parse.unquote_plus(self.requests[0].content.decode())
+        )
+
+    async def test_delete_messages_returns_result_for_each_message(self):
+        self.failing_message_ids = {"2"}
+
+        results = await self.conversation_service.delete_messages(
+            message_ids=["1", "2", "3"]
+        )
+
+        self.assertEqual(["1", "2", "3"], [result.message_id for result in results])
+        self.assertEqual(
+            [True, False, True], [result.error is None for result in results]
+        )
+        self.assertIsInstance(results[1].error, httpx.HTTPStatusError)
+
+    async def test_delete_messages_makes_at_most_max_workers_deletes_at_once(self):
+        deletes_in_progress = 0
+        max_deletes_in_progress = 0
+
+        async def delete_message(*, message_id: str) -> None:
+            nonlocal deletes_in_progress, max_deletes_in_progress
+            deletes_in_progress += 1
+            max_deletes_in_progress = max(max_deletes_in_progress, deletes_in_progress)
+            await asyncio.sleep(0.01)
+            deletes_in_progress -= 1
+
+        with mock.patch(
+            "pythontextnow.api.AsyncTextNowAPI.AsyncTextNowAPI.delete_message",
+            side_effect=delete_message,
+        ):
+            results = await self.conversation_service.delete_messages(
+                message_ids=[str(id_) for id_ in range(10)], max_workers=3
+            )
+
+        self.assertEqual(10, len(results))
+        self.assertEqual(3, max_deletes_in_progress)
+
+    async def test_send_media_uploads_file_then_sends_it(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "image.png")
+            with open(file_path, mode="wb") as media:
+                media.write(b"media" * 1000)
+            await self.conversation_service.send_media(file_path=file_path)
+
+        self.assertEqual(
+            ["GET", "PUT", "POST"], [request.method for request in self.requests]
+        )
+        upload, send_attachment = self.requests[1], self.requests[2]
+        self.assertEqual(b"media" * 1000, upload.content)
+        self.assertEqual("image/png", upload.headers["content-type"])
+        form = parse.parse_qs(send_attachment.content.decode())
+        self.assertEqual([self.ATTACHMENT_URL], form["attachment_url"])
+        self.assertEqual([self.PHONE_NUMBER], form["contact_value"])
+
+    async def test_sqlite_media_cache_is_used_off_the_event_loop(self):
+        calling_threads = list()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "image.png")
+            with open(file_path, mode="wb") as media:
+                media.write(b"media" * 1000)
+            media_cache = MediaCache(database_path=os.path.join(temp_dir, "media.db"))
+            get, put = media_cache.get, media_cache.put
+
+            def record(function):
+                def call_and_record(**kwargs):
+                    calling_threads.append(threading.current_thread())
+                    return function(**kwargs)
+
+                return call_and_record
+
+            conversation_service = AsyncConversationService(
+                conversation_phone_numbers=[self.PHONE_NUMBER],
+                client_config=self.client_config,
+                media_cache=media_cache,
+            )
+            with (
+                mock.patch.object(media_cache, "get", side_effect=record(get)),
+                mock.patch.object(media_cache, "put", side_effect=record(put)),
+            ):
+                await conversation_service.send_media(file_path=file_path)
+                await conversation_service.send_media(file_path=file_path)
+            media_cache.close()
+
+        # the second send reuses the upload
+        self.assertEqual(
+            ["GET", "PUT", "POST", "POST"],
+            [request.method for request in self.requests],
+        )
+        # get, put, then get
+        self.assertEqual(3, len(calling_threads))
+        for calling_thread in calling_threads:
+            self.assertIsNot(threading.current_thread(), calling_thread)
@@ -0,0 +1,85 @@
+from unittest import TestCase, mock
+
+from pythontextnow.enum import MessageType
+from pythontextnow.service.BaseConversationService import BaseConversationService
+
+
+class TestBaseConversationService(TestCase):
+    @staticmethod
+    def __get_group(group_number: str, member_numbers: list[str]) -> mock.Mock:
+        return mock.Mock(
+            e164_contact_value=group_number,
+            members=[
+                mock.Mock(e164_contact_value=None, contact_value=member_number)
+                for member_number in member_numbers
+            ],
+        )
+
+    def test_find_group_number_matches_exact_members(self):
+        base_conversation_service = BaseConversationService(
+            conversation_phone_numbers=["+12015550123", "+12015550124"]
+        )
+        user = mock.Mock(phone_number="2015550100")
+        groups = [
+            # a number that contains one of the conversation phone numbers is not a match
+            self.__get_group(
+                "+12015550001", ["2015550100", "2015550123", "+1201555012"]
+            ),
+            # neither is a group with an extra member
+            self.__get_group(
+                "+12015550002",
+                ["2015550100", "2015550123", "2015550124", "2015550125"],
+            ),
+            self.__get_group(
+                "+12015550003", ["(201) 555-0124", "+12015550100", "2015550123"]
+            ),
+        ]
+
+        self.assertEqual(
+            "+12015550003",
+            base_conversation_service._find_group_number(user=user, groups=groups),
+        )
+
+    def test_find_group_number_matches_member_listed_in_two_formats(self):
+        base_conversation_service = BaseConversationService(
+            conversation_phone_numbers=["+12015550123", "+12015550124"]
+        )
+        user = mock.Mock(phone_number="2015550100")
+        groups = [
+            self.__get_group(
+                "+12015550001",
+                ["2015550100", "2015550123", "(201) 555-0124", "+12015550124"],
+            )
+        ]
+
+        self.assertEqual(
+            "+12015550001",
+            base_conversation_service._find_group_number(user=user, groups=groups),
+        )
+
+    def test_find_group_number_no_match_returns_none(self):
+        base_conversation_service = BaseConversationService(
+            conversation_phone_numbers=["+12015550123", "+12015550124"]
+        )
+        user = mock.Mock(phone_number="2015550100")
+        groups = [self.__get_group("+12015550001", ["2015550100", "2015550123"])]
+
+        self.assertIsNone(
+            base_conversation_service._find_group_number(user=user, groups=groups)
+        )
+
+    def test_get_media_info(self):
+        base_conversation_service = BaseConversationService(
+            conversation_phone_numbers=["+12015550123"]
+        )
+
+        self.assertEqual(
+            ("video/mp4", "video", True, MessageType.VIDEO),
+            base_conversation_service._get_media_info("video.mp4"),
+        )
+        self.assertEqual(
+            ("image/gif", "image", False, MessageType.IMAGE),
+            base_conversation_service._get_media_info("image.gif"),
+        )
+        with self.assertRaises(ValueError):
+            base_conversation_service._get_media_info("audio.mp3")
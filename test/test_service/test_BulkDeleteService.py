@@ -0,0 +1,36 @@
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.service.BulkDeleteService import BulkDeleteService
+
+
+class TestBulkDeleteService(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.delete_message")
+    def test_delete_messages_deletes_every_message(self, mock_delete_message):
+        with BulkDeleteService(max_workers=4) as bulk_delete_service:
+            futures = bulk_delete_service.delete_messages(
+                message_ids=[str(i) for i in range(10)]
+            )
+        results = [future.result() for future in futures]
+
+        self.assertEqual(10, mock_delete_message.call_count)
+        self.assertEqual(
+            [str(i) for i in range(10)], [result.message_id for result in results]
+        )
+        self.assertTrue(all(result.succeeded for result in results))
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.delete_message")
+    def test_failed_delete_is_reported_in_result(self, mock_delete_message):
+        error = ValueError("failed")
+        mock_delete_message.side_effect = [None, error]
+        with BulkDeleteService(max_workers=1) as bulk_delete_service:
+            futures = bulk_delete_service.delete_messages(message_ids=["1", "2"])
+
+        self.assertTrue(futures[0].result().succeeded)
+        self.assertIs(error, futures[1].result().error)
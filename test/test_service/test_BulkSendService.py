@@ -0,0 +1,73 @@
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.api.ClientPool import ClientPool
+from pythontextnow.service.BulkSendService import BulkSendService
+
+
+class TestBulkSendService(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_send_messages_sends_every_message_to_every_recipient(
+        self, mock_send_message
+    ):
+        with BulkSendService(max_workers=4) as bulk_send_service:
+            futures = bulk_send_service.send_messages(
+                messages=["a", "b\nc"], recipients=["1111111111", "2222222222"]
+            )
+        results = [future.result() for future in futures]
+
+        self.assertEqual(4, mock_send_message.call_count)
+        self.assertEqual(
+            [
+                ("a", "1111111111"),
+                ("a", "2222222222"),
+                ("b\nc", "1111111111"),
+                ("b\nc", "2222222222"),
+            ],
+            [(result.message, result.send_to) for result in results],
+        )
+        self.assertTrue(all(result.succeeded for result in results))
+        mock_send_message.assert_any_call(message="b\\nc", send_to="1111111111")
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_failed_send_is_reported_in_result(self, mock_send_message):
+        error = ValueError("failed")
+        mock_send_message.side_effect = [None, error]
+        with BulkSendService(max_workers=1) as bulk_send_service:
+            futures = bulk_send_service.send_messages(
+                messages=["a", "b"], recipients=["1111111111"]
+            )
+
+        self.assertTrue(futures[0].result().succeeded)
+        self.assertFalse(futures[1].result().succeeded)
+        self.assertIs(error, futures[1].result().error)
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_message")
+    def test_client_pool_spreads_sends_across_accounts(self, mock_send_message):
+        client_pool = ClientPool(
+            [
+                Client.create_client_config(
+                    username="username_1", sid_cookie="sid_cookie_1"
+                ),
+                Client.create_client_config(
+                    username="username_2", sid_cookie="sid_cookie_2"
+                ),
+            ]
+        )
+        with BulkSendService(
+            max_workers=1, client_pool=client_pool
+        ) as bulk_send_service:
+            futures = bulk_send_service.send_messages(
+                messages=["a", "b"], recipients=["1111111111"]
+            )
+
+        self.assertEqual(
+            ["username_1", "username_2"],
+            [future.result().username for future in futures],
+        )
@@ -0,0 +1,212 @@
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from unittest import TestCase, mock
+
+from pythontextnow.api.BaseTextNowAPI import BaseTextNowAPI
+from pythontextnow.api.Client import Client
+from pythontextnow.enum import ExportFormat
+from pythontextnow.export import MessageExporter
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.store import MessageStore
+from test.helper.helper_classes import FakeConversation, get_messages
+
+
+class TestConversationService(TestCase):
+    PHONE_NUMBER = "+12015550123"
+
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    def setUp(self):
+        # the conversation on TextNow, most recent first
+        self.conversation = get_messages(range(100, 0, -1))
+        self.fake_conversation = FakeConversation(self.conversation, max_page_size=30)
+        patcher = mock.patch(
+            "pythontextnow.api.TextNowAPI.TextNowAPI.get_messages",
+            side_effect=self.fake_conversation.get_page,
+        )
+        self.mock_get_messages = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def __get_message_store(self) -> MessageStore:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        message_store = MessageStore(
+            database_path=os.path.join(temp_dir.name, "messages.db")
+        )
+        self.addCleanup(message_store.close)
+        return message_store
+
+    def test_get_messages_gets_exact_count_in_fewest_calls(self):
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+        messages = [
+            message
+            for page in conversation_service.get_messages(num_messages=70)
+            for message in page
+        ]
+
+        self.assertEqual(70, len(messages))
+        self.assertEqual(self.conversation[:70], messages)
+        self.assertEqual(
+            [30, 30, 10],
+            [
+                call.kwargs["page_size"]
+                for call in self.mock_get_messages.call_args_list
+            ],
+        )
+
+    def test_get_messages_stops_at_since(self):
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+        since = datetime(2000, 1, 1, 1, 0, tzinfo=timezone.utc)
+        messages = [
+            message
+            for page in conversation_service.get_messages(since=since)
+            for message in page
+        ]
+
+        self.assertEqual(
+            [str(id_) for id_ in range(100, 59, -1)], [m.id_ for m in messages]
+        )
+        self.assertEqual(2, self.mock_get_messages.call_count)
+
+    def test_poll_new_returns_only_unseen_messages(self):
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+
+        self.assertEqual([], conversation_service.poll_new())
+        self.assertEqual([], conversation_service.poll_new())
+
+        self.fake_conversation.messages = (
+            get_messages([102, 101]) + self.fake_conversation.messages
+        )
+        self.mock_get_messages.reset_mock()
+        new_messages = conversation_service.poll_new()
+        self.assertEqual(["102", "101"], [message.id_ for message in new_messages])
+        # stopped at the first seen message rather than paging through the conversation
+        self.mock_get_messages.assert_called_once()
+
+    def test_sync_stores_whole_conversation_then_only_new_messages(self):
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER],
+            message_store=self.__get_message_store(),
+        )
+        self.assertEqual(100, conversation_service.sync())
+        self.assertEqual(5, self.mock_get_messages.call_count)
+
+        self.mock_get_messages.reset_mock()
+        self.fake_conversation.messages = (
+            get_messages([102, 101]) + self.fake_conversation.messages
+        )
+        self.assertEqual(2, conversation_service.sync())
+        self.assertEqual(1, self.mock_get_messages.call_count)
+
+        stored_messages = conversation_service.get_stored_messages(num_messages=3)
+        self.assertEqual(
+            ["102", "101", "100"], [message.id_ for message in stored_messages]
+        )
+        self.assertEqual("message 102", stored_messages[0].text)
+
+    def test_sync_carries_on_from_interrupted_sync(self):
+        message_store = self.__get_message_store()
+        # an earlier sync stored the most recent messages, but never reached the start of the conversation
+        message_store.add_messages(self.PHONE_NUMBER, self.conversation[:40])
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER],
+            message_store=message_store,
+        )
+        self.assertEqual(60, conversation_service.sync())
+
+        self.assertEqual(100, len(conversation_service.get_stored_messages()))
+        self.assertTrue(message_store.is_history_complete(self.PHONE_NUMBER))
+
+    def test_get_message_columns_yields_chunks(self):
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+        chunks = list(
+            conversation_service.get_message_columns(chunk_size=40, num_messages=90)
+        )
+
+        self.assertEqual([40, 40, 10], [len(chunk["id"]) for chunk in chunks])
+        self.assertEqual(set(MessageExporter.COLUMNS), set(chunks[0].keys()))
+        self.assertEqual("100", chunks[0]["id"][0])
+        self.assertEqual("message 100", chunks[0]["body"][0])
+        self.assertEqual("TEXT", chunks[0]["message_type"][0])
+
+    def test_export_messages_jsonl(self):
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "messages.jsonl")
+            rows_written = conversation_service.export_messages(
+                file_path=file_path, export_format=ExportFormat.JSONL, chunk_size=25
+            )
+            with open(file_path) as file:
+                rows = [json.loads(line) for line in file]
+
+        self.assertEqual(100, rows_written)
+        self.assertEqual(100, len(rows))
+        self.assertEqual("2000-01-01T01:40:00+00:00", rows[0]["datetime"])
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.mark_message_as_read")
+    def test_mark_as_read_marks_newest_message_in_each_conversation(
+        self, mock_mark_message_as_read
+    ):
+        other_conversation = BaseTextNowAPI._parse_messages(
+            {
+                "messages": [
+                    {
+                        "id": "1000",
+                        "contact_value": "other_contact_value",
+                        "message_direction": 2,
+                        "message_type": 1,
+                        "message": "message 1000",
+                        "read": False,
+                        "date": "1999-01-01T00:00:00+00:00",
+                        "conversation_filtering": {"first_time_contact": False},
+                    }
+                ]
+            }
+        )
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+        conversation_service.mark_as_read(
+            messages=list(reversed(self.conversation)) + other_conversation
+        )
+
+        self.assertEqual(
+            [mock.call(self.conversation[0]), mock.call(other_conversation[0])],
+            mock_mark_message_as_read.call_args_list,
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.delete_message")
+    def test_delete_messages_reports_each_result(self, mock_delete_message):
+        error = ValueError("failed")
+
+        def delete_message(*, message_id: str) -> None:
+            if message_id == "99":
+                raise error
+
+        mock_delete_message.side_effect = delete_message
+        conversation_service = ConversationService(
+            conversation_phone_numbers=[self.PHONE_NUMBER]
+        )
+        results = conversation_service.delete_messages(
+            messages=self.conversation[:2], message_ids=["1"], max_workers=2
+        )
+
+        self.assertEqual(["100", "99", "1"], [result.message_id for result in results])
+        self.assertEqual([True, False, True], [result.succeeded for result in results])
+        self.assertIs(error, results[1].error)
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, mock
+
+from pythontextnow.enum import MessageDirection, MessageType
+from pythontextnow.model.Message import Message
+from pythontextnow.service.InboxReader import InboxReader
+
+
+class TestInboxReader(TestCase):
+    START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+    def __get_conversation_service(self, number: str, minutes: list[int]) -> mock.Mock:
+        """
+        Returns a fake ConversationService whose messages were sent the given minutes after START, most recent first.
+        Its messages come in pages of 2.
+        """
+        messages = [
+            Message(
+                number=number,
+                datetime_=self.START + timedelta(minutes=minute),
+                first_contact=False,
+                message_type=MessageType.TEXT,
+                read=True,
+                id_=f"{number}-{minute}",
+                message_direction=MessageDirection.INCOMING,
+            )
+            for minute in minutes
+        ]
+        conversation_service = mock.Mock()
+        conversation_service.get_messages.side_effect = lambda **kwargs: iter(
+            [messages[i : i + 2] for i in range(0, len(messages), 2)]
+        )
+        return conversation_service
+
+    def test_get_messages_reads_every_conversation(self):
+        conversation_services = [
+            self.__get_conversation_service("a", [9, 5, 1]),
+            self.__get_conversation_service("b", [8, 2]),
+            self.__get_conversation_service("c", []),
+        ]
+        inbox_reader = InboxReader(conversation_services, max_workers=2)
+
+        messages = list(inbox_reader.get_messages(num_messages=10))
+
+        self.assertEqual(
+            {"a-9", "a-5", "a-1", "b-8", "b-2"},
+            {message.id_ for _, message in messages},
+        )
+        for conversation_service, message in messages:
+            self.assertIs(
+                conversation_services["abc".index(message.number)],
+                conversation_service,
+            )
+        conversation_services[0].get_messages.assert_called_once_with(
+            num_messages=10, include_archived=True, since=None, keep_raw=True
+        )
+
+    def test_get_messages_ordered_merges_most_recent_first(self):
+        conversation_services = [
+            self.__get_conversation_service("a", [9, 5, 4, 3, 1]),
+            self.__get_conversation_service("b", [8, 7, 6, 2]),
+            self.__get_conversation_service("c", [10]),
+        ]
+        inbox_reader = InboxReader(conversation_services, max_workers=2)
+
+        messages = [message for _, message in inbox_reader.get_messages(ordered=True)]
+
+        self.assertEqual(
+            [10, 9, 8, 7, 6, 5, 4, 3, 2, 1],
+            [
+                int((message.datetime_ - self.START).total_seconds() // 60)
+                for message in messages
+            ],
+        )
+
+    def test_get_messages_raises_failed_page(self):
+        conversation_service = mock.Mock()
+        conversation_service.get_messages.return_value = mock.Mock(
+            __next__=mock.Mock(side_effect=ValueError("failed"))
+        )
+
+        with self.assertRaisesRegex(ValueError, "failed"):
+            list(InboxReader([conversation_service]).get_messages())
@@ -0,0 +1,124 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.api.MediaStream import MediaStream
+from pythontextnow.enum import MessageType
+from pythontextnow.service.MediaSendService import MediaSendService
+from pythontextnow.store.MediaCache import MediaCache
+
+
+class TestMediaSendService(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_paths = list()
+        for file_name in ["a.png", "b.mp4"]:
+            file_path = os.path.join(self.directory.name, file_name)
+            with open(file_path, "wb") as file:
+                file.write(b"media")
+            self.file_paths.append(file_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_attachment")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.upload_raw_media")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_attachment_url")
+    def test_send_media_sends_every_file_to_every_recipient(
+        self, mock_get_attachment_url, mock_upload_raw_media, mock_send_attachment
+    ):
+        mock_get_attachment_url.side_effect = (
+            lambda *, message_type: f"{message_type.value}_url"
+        )
+        with MediaSendService(
+            max_workers=2, attachment_url_pool_size=1
+        ) as media_send_service:
+            futures = media_send_service.send_media(
+                file_paths=self.file_paths, recipients=["+12015550100", "+12015550101"]
+            )
+        results = [future.result() for future in futures]
+
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(
+            [
+                (self.file_paths[0], "+12015550100"),
+                (self.file_paths[0], "+12015550101"),
+                (self.file_paths[1], "+12015550100"),
+                (self.file_paths[1], "+12015550101"),
+            ],
+            [(result.file_path, result.send_to) for result in results],
+        )
+        self.assertEqual(4, mock_upload_raw_media.call_count)
+        self.assertIsInstance(
+            mock_upload_raw_media.call_args.kwargs["raw_media"], MediaStream
+        )
+        self.assertEqual(4, mock_send_attachment.call_count)
+        mock_send_attachment.assert_any_call(
+            conversation_phone_number="+12015550101",
+            message_type=MessageType.VIDEO,
+            file_type="video",
+            is_video=True,
+            attachment_url=f"{MessageType.VIDEO.value}_url",
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_attachment")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.upload_raw_media")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_attachment_url")
+    def test_failed_send_is_reported_in_result(
+        self, mock_get_attachment_url, mock_upload_raw_media, mock_send_attachment
+    ):
+        mock_get_attachment_url.return_value = "url"
+        error = ValueError("failed")
+        mock_upload_raw_media.side_effect = error
+        with MediaSendService(max_workers=1) as media_send_service:
+            upload_failed = media_send_service.submit(
+                file_path=self.file_paths[0], send_to="+12015550100"
+            )
+            not_media = media_send_service.submit(
+                file_path="song.mp3", send_to="+12015550100"
+            )
+
+        self.assertIs(error, upload_failed.result().error)
+        self.assertIsInstance(not_media.result().error, ValueError)
+        mock_send_attachment.assert_not_called()
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_attachment")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.upload_raw_media")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_attachment_url")
+    def test_media_cache_uploads_each_file_once(
+        self, mock_get_attachment_url, mock_upload_raw_media, mock_send_attachment
+    ):
+        mock_get_attachment_url.return_value = "url"
+        with MediaSendService(
+            max_workers=4, media_cache=MediaCache()
+        ) as media_send_service:
+            futures = media_send_service.send_media(
+                file_paths=[self.file_paths[0]],
+                recipients=[f"+1201555010{i}" for i in range(8)],
+            )
+
+        self.assertTrue(all(future.result().succeeded for future in futures))
+        mock_upload_raw_media.assert_called_once()
+        self.assertEqual(8, mock_send_attachment.call_count)
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_attachment")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.upload_raw_media")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_attachment_url")
+    def test_one_send_fetches_one_attachment_url(
+        self, mock_get_attachment_url, mock_upload_raw_media, mock_send_attachment
+    ):
+        mock_get_attachment_url.return_value = "url"
+        with MediaSendService(attachment_url_pool_size=4) as media_send_service:
+            future = media_send_service.submit(
+                file_path=self.file_paths[0], send_to="+12015550100"
+            )
+
+        self.assertTrue(future.result().succeeded)
+        mock_get_attachment_url.assert_called_once()
@@ -0,0 +1,81 @@
+import threading
+import time
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.service.MessageWatcher import MessageWatcher
+from test.helper.helper_classes import get_messages
+
+
+class TestMessageWatcher(TestCase):
+    PHONE_NUMBER = "+12015550123"
+
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    def test_new_messages_are_passed_to_callback(self):
+        new_messages = get_messages([1], read=False)
+        conversation_service = mock.Mock(spec=ConversationService)
+        conversation_service.poll_new.side_effect = [list(), new_messages] + [
+            list()
+        ] * 100
+        received = list()
+        received_event = threading.Event()
+
+        def on_new_messages(service, messages):
+            received.append((service, messages))
+            received_event.set()
+
+        with MessageWatcher(
+            on_new_messages=on_new_messages,
+            min_poll_interval_seconds=0.01,
+            max_poll_interval_seconds=0.05,
+            worker_count=1,
+        ) as message_watcher:
+            message_watcher.watch(conversation_service)
+            self.assertTrue(received_event.wait(5))
+
+        self.assertEqual([(conversation_service, new_messages)], received)
+
+    def test_rewatched_conversation_is_never_polled_twice_at_once(self):
+        polls_in_progress = 0
+        max_polls_in_progress = 0
+        lock = threading.Lock()
+
+        def poll_new():
+            nonlocal polls_in_progress, max_polls_in_progress
+            with lock:
+                polls_in_progress += 1
+                max_polls_in_progress = max(max_polls_in_progress, polls_in_progress)
+            time.sleep(0.02)
+            with lock:
+                polls_in_progress -= 1
+            return list()
+
+        conversation_service = mock.Mock(spec=ConversationService)
+        conversation_service.poll_new.side_effect = poll_new
+        message_watcher = MessageWatcher(
+            on_new_messages=lambda service, messages: None,
+            min_poll_interval_seconds=0.01,
+            max_poll_interval_seconds=0.01,
+            worker_count=2,
+        )
+        # each watch() schedules a poll, those scheduled before the last unwatch() must be skipped
+        for _ in range(5):
+            message_watcher.watch(conversation_service)
+            message_watcher.unwatch(conversation_service)
+        message_watcher.watch(conversation_service)
+
+        with message_watcher:
+            time.sleep(0.2)
+            # unwatched and watched again while a poll may be in progress
+            message_watcher.unwatch(conversation_service)
+            message_watcher.watch(conversation_service)
+            time.sleep(0.2)
+
+        self.assertGreater(conversation_service.poll_new.call_count, 1)
+        self.assertEqual(1, max_polls_in_progress)
@@ -0,0 +1,93 @@
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.store import GroupIndex
+
+
+class TestGroupIndex(TestCase):
+    PHONE_NUMBERS = ["+12015550123", "+12015550124"]
+
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    def test_get_ignores_phone_number_order(self):
+        group_index = GroupIndex()
+        group_index.put(
+            username="username", phone_numbers=self.PHONE_NUMBERS, group_number="1"
+        )
+
+        self.assertEqual(
+            "1",
+            group_index.get(
+                username="username", phone_numbers=reversed(self.PHONE_NUMBERS)
+            ),
+        )
+        self.assertIsNone(
+            group_index.get(username="other_username", phone_numbers=self.PHONE_NUMBERS)
+        )
+
+    def test_key_keeps_international_country_code(self):
+        self.assertEqual(
+            ("+12015550123", "+447911123456"),
+            GroupIndex._get_key(["447911123456", "2015550123"]),
+        )
+
+    def test_expired_entry_is_not_returned(self):
+        group_index = GroupIndex(ttl_seconds=10)
+        with mock.patch("time.time", return_value=1000):
+            group_index.put(
+                username="username", phone_numbers=self.PHONE_NUMBERS, group_number="1"
+            )
+        with mock.patch("time.time", return_value=1011):
+            self.assertIsNone(
+                group_index.get(username="username", phone_numbers=self.PHONE_NUMBERS)
+            )
+
+    def test_entries_persist_in_database(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            database_path = os.path.join(temp_dir, "group_index.db")
+            GroupIndex(database_path=database_path).put(
+                username="username", phone_numbers=self.PHONE_NUMBERS, group_number="1"
+            )
+            group_index = GroupIndex(database_path=database_path)
+
+            self.assertEqual(
+                "1",
+                group_index.get(username="username", phone_numbers=self.PHONE_NUMBERS),
+            )
+            group_index.invalidate(username="username")
+            self.assertIsNone(
+                GroupIndex(database_path=database_path).get(
+                    username="username", phone_numbers=self.PHONE_NUMBERS
+                )
+            )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.delete_conversation")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.create_group")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_groups")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_user")
+    def test_conversation_service_looks_up_group_once(
+        self, mock_get_user, mock_get_groups, mock_create_group, _
+    ):
+        mock_get_user.return_value = mock.Mock(phone_number="2015550100")
+        mock_get_groups.return_value = list()
+        mock_create_group.return_value = mock.Mock(e164_contact_value="+12015550199")
+        group_index = GroupIndex()
+
+        for _ in range(3):
+            conversation_service = ConversationService(
+                conversation_phone_numbers=self.PHONE_NUMBERS, group_index=group_index
+            )
+        self.assertEqual(1, mock_get_groups.call_count)
+        self.assertEqual(1, mock_create_group.call_count)
+
+        conversation_service.delete_conversation()
+        self.assertIsNone(
+            group_index.get(username="dummy_username", phone_numbers=self.PHONE_NUMBERS)
+        )
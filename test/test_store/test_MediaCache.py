@@ -0,0 +1,148 @@
+import hashlib
+import os
+import tempfile
+import threading
+from unittest import TestCase, mock
+
+from pythontextnow.api.Client import Client
+from pythontextnow.service.ConversationService import ConversationService
+from pythontextnow.store import MediaCache
+
+
+class TestMediaCache(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Client.set_client_config(
+            username="dummy_username", sid_cookie="dummy_sid_cookie"
+        )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "image.png")
+        with open(self.file_path, "wb") as file:
+            file.write(b"media")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_digest_hashes_file_contents_once(self):
+        media_cache = MediaCache()
+
+        with mock.patch("builtins.open", wraps=open) as mock_open:
+            digest = media_cache.get_digest(self.file_path)
+            self.assertEqual(digest, media_cache.get_digest(self.file_path))
+
+        self.assertEqual(hashlib.sha256(b"media").hexdigest(), digest)
+        self.assertEqual(1, mock_open.call_count)
+
+    def test_get_is_scoped_to_username(self):
+        media_cache = MediaCache()
+        media_cache.put(username="username", digest="digest", attachment_url="url")
+
+        self.assertEqual("url", media_cache.get(username="username", digest="digest"))
+        self.assertIsNone(media_cache.get(username="other_username", digest="digest"))
+
+    def test_expired_entry_is_not_returned(self):
+        media_cache = MediaCache(ttl_seconds=10)
+        with mock.patch("time.time", return_value=1000):
+            media_cache.put(username="username", digest="digest", attachment_url="url")
+        with mock.patch("time.time", return_value=1011):
+            self.assertIsNone(media_cache.get(username="username", digest="digest"))
+
+    def test_least_recently_used_entry_is_dropped(self):
+        media_cache = MediaCache(max_entries=2)
+        media_cache.put(username="username", digest="a", attachment_url="url_a")
+        media_cache.put(username="username", digest="b", attachment_url="url_b")
+        media_cache.get(username="username", digest="a")
+        media_cache.put(username="username", digest="c", attachment_url="url_c")
+
+        self.assertEqual("url_a", media_cache.get(username="username", digest="a"))
+        self.assertIsNone(media_cache.get(username="username", digest="b"))
+
+    def test_upload_lock_is_removed_once_released(self):
+        media_cache = MediaCache()
+        entered = threading.Event()
+        release = threading.Event()
+        order = list()
+
+        def upload(name: str):
+            with media_cache.lock_upload("digest"):
+                order.append(f"{name} start")
+                entered.set()
+                release.wait(5)
+                order.append(f"{name} end")
+
+        first = threading.Thread(target=upload, args=("first",))
+        first.start()
+        entered.wait(5)
+        second = threading.Thread(target=upload, args=("second",))
+        second.start()
+        release.set()
+        first.join()
+        second.join()
+
+        # the second upload waited for the first
+        self.assertEqual(
+            ["first start", "first end", "second start", "second end"], order
+        )
+        self.assertEqual(dict(), media_cache._MediaCache__upload_locks)
+
+    def test_entries_are_shared_through_database(self):
+        database_path = os.path.join(self.directory.name, "media_cache.db")
+        MediaCache(database_path=database_path).put(
+            username="username", digest="digest", attachment_url="url"
+        )
+
+        self.assertEqual(
+            "url",
+            MediaCache(database_path=database_path).get(
+                username="username", digest="digest"
+            ),
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_attachment")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.upload_raw_media")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_attachment_url")
+    def test_send_media_skips_upload_of_cached_media(
+        self, mock_get_attachment_url, mock_upload_raw_media, mock_send_attachment
+    ):
+        mock_get_attachment_url.return_value = "url"
+        media_cache = MediaCache()
+        for conversation_phone_number in ["+12015550123", "+12015550124"]:
+            ConversationService(
+                conversation_phone_numbers=[conversation_phone_number],
+                media_cache=media_cache,
+            ).send_media(file_path=self.file_path)
+
+        mock_upload_raw_media.assert_called_once()
+        self.assertEqual(2, mock_send_attachment.call_count)
+        mock_send_attachment.assert_called_with(
+            conversation_phone_number="+12015550124",
+            message_type=mock.ANY,
+            file_type="image",
+            is_video=False,
+            attachment_url="url",
+        )
+
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.send_attachment")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.upload_raw_media")
+    @mock.patch("pythontextnow.api.TextNowAPI.TextNowAPI.get_attachment_url")
+    def test_failed_send_invalidates_cached_media(
+        self, mock_get_attachment_url, mock_upload_raw_media, mock_send_attachment
+    ):
+        mock_get_attachment_url.return_value = "url"
+        mock_send_attachment.side_effect = ValueError("expired")
+        media_cache = MediaCache()
+        conversation_service = ConversationService(
+            conversation_phone_numbers=["+12015550123"], media_cache=media_cache
+        )
+
+        with self.assertRaises(ValueError):
+            conversation_service.send_media(file_path=self.file_path)
+
+        self.assertIsNone(
+            media_cache.get(
+                username="dummy_username",
+                digest=media_cache.get_digest(self.file_path),
+            )
+        )
@@ -0,0 +1,26 @@
+import os
+import tempfile
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from pythontextnow.store import MessageStore
+from test.helper.helper_classes import get_messages
+
+
+class TestMessageStore(TestCase):
+    PHONE_NUMBER = "+12015550123"
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.message_store = MessageStore(
+            database_path=os.path.join(temp_dir.name, "messages.db")
+        )
+        self.messages = get_messages(range(70, 0, -1))
+
+    def test_get_messages_since(self):
+        self.message_store.add_messages(self.PHONE_NUMBER, self.messages)
+        since = datetime(2000, 1, 1, 1, 8, tzinfo=timezone.utc)
+
+        messages = self.message_store.get_messages(self.PHONE_NUMBER, since=since)
+        self.assertEqual(["70", "69", "68"], [message.id_ for message in messages])
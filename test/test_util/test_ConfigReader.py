@@ -0,0 +1,42 @@
+import os
+from unittest import TestCase, mock
+
+from pythontextnow.util.ConfigReader import ConfigReader
+
+
+class TestConfigReader(TestCase):
+    def setUp(self):
+        ConfigReader.reload()
+        self.addCleanup(ConfigReader.reload)
+
+    @mock.patch("configparser.ConfigParser.read")
+    def test_get_does_not_read_file_again(self, mock_read):
+        ConfigReader.get("api", "textnow_base_url")
+        ConfigReader.get("api", "pool_maxsize", as_type=int)
+
+        mock_read.assert_not_called()
+
+    def test_get_converts_types(self):
+        self.assertIsInstance(ConfigReader.get("api", "pool_maxsize", as_type=int), int)
+        self.assertIsInstance(ConfigReader.get("api", "pool_block", as_type=bool), bool)
+        self.assertIsInstance(
+            ConfigReader.get("rate_limit", "send_rate_per_second", as_type=float),
+            float,
+        )
+        with self.assertRaises(ValueError):
+            ConfigReader.get("api", "pool_maxsize", as_type=dict)
+
+    @mock.patch.dict(os.environ, {"PYTHONTEXTNOW_API_POOL_MAXSIZE": "42"})
+    def test_environment_variable_overrides_file(self):
+        ConfigReader.reload()
+
+        self.assertEqual(42, ConfigReader.get("api", "pool_maxsize", as_type=int))
+
+    def test_reload_overrides(self):
+        ConfigReader.reload(overrides={"api": {"pool_maxsize": 7, "pool_block": True}})
+
+        self.assertEqual(7, ConfigReader.get("api", "pool_maxsize", as_type=int))
+        self.assertTrue(ConfigReader.get("api", "pool_block", as_type=bool))
+
+        ConfigReader.reload()
+        self.assertFalse(ConfigReader.get("api", "pool_block", as_type=bool))
@@ -0,0 +1,47 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from unittest import TestCase
+
+from pythontextnow.util.SQLiteConnections import SQLiteConnections
+
+
+class TestSQLiteConnections(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.database_path = os.path.join(self.directory.name, "test.db")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_each_thread_gets_its_own_connection(self):
+        sqlite_connections = SQLiteConnections(self.database_path)
+        connections = list()
+        thread = threading.Thread(
+            target=lambda: connections.append(sqlite_connections.get())
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIs(sqlite_connections.get(), sqlite_connections.get())
+        self.assertIsNot(connections[0], sqlite_connections.get())
+        sqlite_connections.close()
+
+    def test_close_closes_connections_of_every_thread(self):
+        sqlite_connections = SQLiteConnections(self.database_path)
+        connections = [sqlite_connections.get()]
+        thread = threading.Thread(
+            target=lambda: connections.append(sqlite_connections.get())
+        )
+        thread.start()
+        thread.join()
+
+        sqlite_connections.close()
+
+        for connection in connections:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                connection.execute("SELECT 1")
+        # a connection is opened again once it is needed
+        self.assertEqual((1,), sqlite_connections.get().execute("SELECT 1").fetchone())
+        sqlite_connections.close()
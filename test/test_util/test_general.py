@@ -0,0 +1,70 @@
+import asyncio
+import random
+import threading
+from unittest import TestCase
+
+from pythontextnow.util.general import (
+    get_random_user_agent,
+    loads_json,
+    prefetch,
+    prefetch_async,
+)
+
+
+class TestGeneral(TestCase):
+    def test_get_random_user_agent_is_deterministic_for_seed(self):
+        self.assertEqual(get_random_user_agent(12345), get_random_user_agent(12345))
+        self.assertIsInstance(get_random_user_agent(), str)
+
+    def test_get_random_user_agent_does_not_reseed_global_random(self):
+        random.seed(1)
+        expected = [random.random() for _ in range(3)]
+
+        random.seed(1)
+        get_random_user_agent(12345)
+        self.assertEqual(expected, [random.random() for _ in range(3)])
+
+    def test_prefetch_yields_every_item_in_order(self):
+        self.assertEqual([1, 2, 3], list(prefetch(iter([1, 2, 3]), depth=2)))
+        self.assertEqual([1, 2, 3], list(prefetch(iter([1, 2, 3]), depth=0)))
+
+    def test_prefetch_fetches_ahead_of_caller(self):
+        fetched = list()
+        all_fetched = threading.Event()
+
+        def items():
+            for i in range(3):
+                fetched.append(i)
+                yield i
+            all_fetched.set()
+
+        prefetched = prefetch(items(), depth=2)
+        self.assertEqual(0, next(prefetched))
+        # the other two items are fetched while the caller is still on the first
+        self.assertTrue(all_fetched.wait(1))
+        self.assertEqual([0, 1, 2], fetched)
+        self.assertEqual([1, 2], list(prefetched))
+
+    def test_prefetch_raises_errors_to_caller(self):
+        def items():
+            yield 1
+            raise ValueError("failed")
+
+        prefetched = prefetch(items(), depth=2)
+        self.assertEqual(1, next(prefetched))
+        with self.assertRaises(ValueError):
+            next(prefetched)
+
+    def test_prefetch_async_yields_every_item_in_order(self):
+        async def items():
+            for i in range(3):
+                yield i
+
+        async def collect():
+            return [item async for item in prefetch_async(items(), depth=2)]
+
+        self.assertEqual([0, 1, 2], asyncio.run(collect()))
+
+    def test_loads_json(self):
+        self.assertEqual({"messages": [1, "a"]}, loads_json(b'{"messages": [1, "a"]}'))
+        self.assertEqual([], loads_json("[]"))
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from pythontextnow.util import phone_number
+
+
+class TestPhoneNumber(TestCase):
+    def test_to_e164(self):
+        self.assertEqual("+12015550123", phone_number.to_e164("2015550123"))
+        self.assertEqual("+12015550123", phone_number.to_e164("(201) 555-0123"))
+        self.assertEqual("+12015550123", phone_number.to_e164("+1 201-555-0123"))
+        self.assertEqual("+abc", phone_number.to_e164("abc"))
+
+    def test_to_e164_keeps_country_code_of_bare_international_numbers(self):
+        self.assertEqual("+447911123456", phone_number.to_e164("447911123456"))
+        self.assertEqual("+33612345678", phone_number.to_e164("33612345678"))
+        self.assertEqual("+447911123456", phone_number.to_e164("+44 7911 123456"))
+
+    def test_validate(self):
+        self.assertEqual("+12015550123", phone_number.validate("+1 201 555 0123"))
+        with self.assertRaises(ValueError):
+            phone_number.validate("2015550123")
+        with self.assertRaises(ValueError):
+            phone_number.validate("+11111111111")
+
+    def test_parsing_is_cached(self):
+        phone_number._parse.cache_clear()
+        phone_number.to_e164("2015550123")
+        phone_number.to_e164("2015550123")
+
+        self.assertEqual(1, phone_number._parse.cache_info().hits)